@@ -4,16 +4,22 @@ Serializadores para la app about.
 """
 
 from rest_framework import serializers
+from core import images
+from core.sparse import SparseFieldsetSerializerMixin
+from core.timing import TimedSerializerMixin
 from apps.about.models import AboutMe
 
 
-class AboutMeSerializer(serializers.ModelSerializer):
+class AboutMeSerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for AboutMe model with camelCase field names.
     Serializador para el modelo AboutMe con nombres de campos en camelCase.
     """
 
     profileImage = serializers.ImageField(source='profile_image', required=False, allow_null=True)
+    profileImageWidth = serializers.IntegerField(source='profile_image_width', read_only=True)
+    profileImageHeight = serializers.IntegerField(source='profile_image_height', read_only=True)
+    profileImageSrcset = serializers.SerializerMethodField()
     resumeFile = serializers.FileField(source='resume_file', required=False, allow_null=True)
     linkedinUrl = serializers.URLField(source='linkedin_url', required=False, allow_blank=True)
     githubUrl = serializers.URLField(source='github_url', required=False, allow_blank=True)
@@ -34,6 +40,9 @@ class AboutMeSerializer(serializers.ModelSerializer):
             'phone',
             'location',
             'profileImage',
+            'profileImageWidth',
+            'profileImageHeight',
+            'profileImageSrcset',
             'resumeFile',
             'linkedinUrl',
             'githubUrl',
@@ -44,3 +53,12 @@ class AboutMeSerializer(serializers.ModelSerializer):
             'updatedAt',
         ]
         read_only_fields = ['id', 'createdAt', 'updatedAt']
+        sparse_field_sources = {'profileImageSrcset': ['profile_image', 'profile_image_variants']}
+
+    def get_profileImageSrcset(self, obj) -> dict:
+        """
+        Return the srcset strings of the resized copies, keyed by format.
+        Retorna las cadenas srcset de las copias redimensionadas, por formato.
+        """
+        request = self.context.get('request')
+        return images.srcset(obj.profile_image, obj.profile_image_variants, request.build_absolute_uri if request else None)
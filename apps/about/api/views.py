@@ -7,6 +7,11 @@ from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view
+from core.async_views import AsyncReadMixin
+from core.cache import CachedResponseMixin
+from core.conditional import ConditionalGetMixin
+from core.sparse import SparseFieldsetViewMixin
+from core.streaming import StreamingListMixin
 from apps.about.models import AboutMe
 from .serializers import AboutMeSerializer
 
@@ -43,7 +48,7 @@ from .serializers import AboutMeSerializer
         tags=["About"],
     ),
 )
-class AboutMeViewSet(viewsets.ModelViewSet):
+class AboutMeViewSet(AsyncReadMixin, CachedResponseMixin, ConditionalGetMixin, SparseFieldsetViewMixin, StreamingListMixin, viewsets.ModelViewSet):
     """
     ViewSet for viewing and editing AboutMe instances.
     Provides CRUD operations for personal information and bio.
@@ -53,8 +58,17 @@ class AboutMeViewSet(viewsets.ModelViewSet):
     """
 
     queryset = AboutMe.objects.all()
+    cache_models = [AboutMe]
+    cache_actions = ['list', 'retrieve', 'active']
+    local_cache_actions = ['active']
     serializer_class = AboutMeSerializer
 
+    def get_conditional_querysets(self):
+        """Validate the active action against the active profile only."""
+        if self.action == 'active':
+            return [self.queryset.filter(is_active=True)]
+        return super().get_conditional_querysets()
+
     @extend_schema(
         summary="Get active about profile / Obtener perfil about activo",
         description="Retrieve the currently active about/bio profile. Only one profile should be active at a time. / Obtiene el perfil about/bio actualmente activo. Solo un perfil debe estar activo a la vez.",
@@ -67,8 +81,13 @@ class AboutMeViewSet(viewsets.ModelViewSet):
         Get the active about profile.
         Obtener el perfil activo de about.
         """
-        active_profile = self.queryset.filter(is_active=True).first()
+        active_profile = self.get_queryset().filter(is_active=True).first()
         if active_profile:
             serializer = self.get_serializer(active_profile)
             return Response(serializer.data)
         return Response({})
+
+    async def aactive(self, request):
+        """Async variant of ``active`` (ASYNC_VIEWS)."""
+        active_profile = await self.get_queryset().filter(is_active=True).afirst()
+        return Response(self.get_serializer(active_profile).data if active_profile else {})
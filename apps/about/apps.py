@@ -11,3 +11,13 @@ class AboutConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.about'
+
+    def ready(self):
+        """Register versioned caching, query budgets and the profile image for responsive variants."""
+        from core import budgets, cache, images
+        from .api.views import AboutMeViewSet
+        from .models import AboutMe
+
+        cache.register(AboutMe)
+        images.register(AboutMe, "profile_image")
+        budgets.register(AboutMeViewSet, list=3, retrieve=2, active=2)
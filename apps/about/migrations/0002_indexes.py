@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('about', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aboutme',
+            index=models.Index(fields=['-created_at', 'id'], name='aboutme_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aboutme',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at', 'id'], name='aboutme_active_idx'),
+        ),
+    ]
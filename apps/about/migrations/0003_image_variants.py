@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('about', '0002_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aboutme',
+            name='profile_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Profile Image Height'),
+        ),
+        migrations.AddField(
+            model_name='aboutme',
+            name='profile_image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized WebP/JPEG copies, generated in the background', verbose_name='Profile Image Variants'),
+        ),
+        migrations.AddField(
+            model_name='aboutme',
+            name='profile_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Profile Image Width'),
+        ),
+    ]
@@ -6,6 +6,8 @@ Modelos de la app about.
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from core import cache, images
+
 
 class AboutMe(models.Model):
     """
@@ -20,6 +22,9 @@ class AboutMe(models.Model):
     phone = models.CharField(max_length=20, verbose_name=_("Phone"), help_text=_("Contact phone number"), blank=True)
     location = models.CharField(max_length=200, verbose_name=_("Location"), help_text=_("City, Country"), blank=True)
     profile_image = models.ImageField(upload_to="about/", verbose_name=_("Profile Image"), help_text=_("Profile photo"), blank=True, null=True)
+    profile_image_width = models.PositiveIntegerField(editable=False, blank=True, null=True, verbose_name=_("Profile Image Width"))
+    profile_image_height = models.PositiveIntegerField(editable=False, blank=True, null=True, verbose_name=_("Profile Image Height"))
+    profile_image_variants = models.JSONField(editable=False, blank=True, default=dict, verbose_name=_("Profile Image Variants"), help_text=_("Resized WebP/JPEG copies, generated in the background"))
     resume_file = models.FileField(upload_to="about/resumes/", verbose_name=_("Resume/CV"), help_text=_("Resume or CV file"), blank=True, null=True)
     linkedin_url = models.URLField(verbose_name=_("LinkedIn URL"), blank=True)
     github_url = models.URLField(verbose_name=_("GitHub URL"), blank=True)
@@ -33,12 +38,24 @@ class AboutMe(models.Model):
         verbose_name = _("About Me")
         verbose_name_plural = _("About Me")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "id"], name="aboutme_created_idx"),
+            # Only the active profile, for the active action and save().
+            models.Index(fields=["-created_at", "id"], condition=models.Q(is_active=True), name="aboutme_active_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
     def save(self, *args, **kwargs):
-        """Ensure only one active profile exists."""
+        """Ensure only one active profile exists and queue profile image variants."""
         if self.is_active:
-            AboutMe.objects.filter(is_active=True).exclude(pk=self.pk).update(is_active=False)
+            # A queryset update sends no signals, so bump the cache version here.
+            # Un update de queryset no envía señales, así que se incrementa la versión aquí.
+            if AboutMe.objects.filter(is_active=True).exclude(pk=self.pk).update(is_active=False):
+                cache.bump_model_version(AboutMe)
+        if not self.profile_image:
+            images.reset_variants(self, "profile_image")
         super().save(*args, **kwargs)
+        if images.needs_variants(self, "profile_image"):
+            images.queue_variants(self, "profile_image")
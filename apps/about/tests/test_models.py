@@ -2,9 +2,13 @@
 Tests for AboutMe model.
 """
 
+from io import BytesIO
+
 import pytest
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
+from PIL import Image
 from apps.about.models import AboutMe
 
 
@@ -116,6 +120,22 @@ class TestAboutMeModel:
         assert about1.is_active is False
         assert about2.is_active is True
 
+    def test_deactivating_other_profiles_bumps_cache_version(self):
+        """Test that the bulk deactivation invalidates cached profiles, not only post_save."""
+        from unittest import mock
+        from core import cache
+
+        AboutMe.objects.create(name="Profile 1", title="Developer", bio="Bio", email="profile1@example.com")
+
+        with mock.patch.object(cache, "bump_model_version") as bump:
+            AboutMe.objects.create(name="Profile 2", title="Engineer", bio="Bio", email="profile2@example.com")
+        # Bulk update + post_save.
+        assert bump.call_args_list == [mock.call(AboutMe)] * 2
+
+        with mock.patch.object(cache, "bump_model_version") as bump:
+            AboutMe.objects.create(name="Profile 3", title="Engineer", bio="Bio", email="profile3@example.com", is_active=False)
+        assert bump.call_args_list == [mock.call(AboutMe)]
+
     def test_multiple_inactive_profiles_allowed(self):
         """Test that multiple inactive profiles can coexist."""
         about1 = AboutMe.objects.create(
@@ -455,3 +475,25 @@ class TestAboutMeModel:
         assert about1.is_active is False
         assert about2.is_active is True
         assert AboutMe.objects.filter(is_active=True).count() == 1
+
+
+@pytest.mark.django_db
+class TestAboutMeImageVariants:
+    """Test suite for profile image variants."""
+
+    def test_profile_image_variants(self, settings, django_capture_on_commit_callbacks):
+        """Test that uploading a profile image stores its size and variants."""
+        settings.JOBS_SYNC = True
+        settings.IMAGE_VARIANT_WIDTHS = [160, 320]
+        buffer = BytesIO()
+        Image.new('RGB', (400, 400), 'navy').save(buffer, 'JPEG')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            about = AboutMe.objects.create(
+                name='Jane', title='Dev', bio='Bio', email='jane@example.com',
+                profile_image=SimpleUploadedFile('me.jpg', buffer.getvalue(), content_type='image/jpeg'),
+            )
+
+        about.refresh_from_db()
+        assert (about.profile_image_width, about.profile_image_height) == (400, 400)
+        assert sorted(about.profile_image_variants['jpeg'], key=int) == ['160', '320', '400']
@@ -250,7 +250,8 @@ class TestAboutMeSerializer:
         serializer = AboutMeSerializer(about)
         expected_fields = {
             'id', 'name', 'title', 'bio', 'email', 'phone', 'location',
-            'profileImage', 'resumeFile', 'linkedinUrl', 'githubUrl',
+            'profileImage', 'profileImageWidth', 'profileImageHeight',
+            'profileImageSrcset', 'resumeFile', 'linkedinUrl', 'githubUrl',
             'twitterUrl', 'websiteUrl', 'isActive', 'createdAt', 'updatedAt'
         }
 
@@ -425,3 +426,33 @@ class TestAboutMeSerializer:
         about = serializer.save()
 
         assert about.phone == '+1 (555) 123-4567'
+
+
+@pytest.mark.django_db
+class TestAboutMeSerializerImageVariants:
+    """Test suite for the profile image srcset fields."""
+
+    def test_srcset_empty_while_pending(self):
+        """Test that rows without generated variants expose an empty srcset."""
+        about = AboutMe.objects.create(name='Jane', title='Dev', bio='Bio', email='jane@example.com')
+
+        data = AboutMeSerializer(about).data
+
+        assert data['profileImageWidth'] is None
+        assert data['profileImageSrcset'] == {}
+
+    def test_srcset_uses_absolute_urls_with_request(self, request_factory):
+        """Test that srcset URLs are absolute when a request is in context."""
+        about = AboutMe.objects.create(name='Jane', title='Dev', bio='Bio', email='jane@example.com')
+        about.profile_image.name = 'about/me.jpg'
+        about.profile_image_variants = {
+            'source': 'about/me.jpg',
+            'webp': {'640': 'about/variants/me-640w.webp', '320': 'about/variants/me-320w.webp'},
+        }
+
+        data = AboutMeSerializer(about, context={'request': request_factory.get('/')}).data
+
+        assert data['profileImageSrcset'] == {
+            'webp': 'http://testserver/media/about/variants/me-320w.webp 320w, '
+                    'http://testserver/media/about/variants/me-640w.webp 640w',
+        }
@@ -414,3 +414,51 @@ class TestAboutMeViewSet:
         # Verify no active profiles
         active_count = AboutMe.objects.filter(is_active=True).count()
         assert active_count == 0
+
+
+@pytest.mark.django_db
+class TestAboutMeIndexUsage:
+    """Test suite proving about endpoints are served by their indexes."""
+
+    def test_list_uses_created_index(self, explain_endpoint, sample_about):
+        """Test that the newest-first list reads the created_at index."""
+        assert 'aboutme_created_idx' in explain_endpoint('/api/about/')
+
+    def test_active_uses_partial_index(self, explain_endpoint, sample_about):
+        """Test that the active action reads the partial index."""
+        assert 'aboutme_active_idx' in explain_endpoint('/api/about/active/')
+
+
+@pytest.mark.django_db
+class TestAboutMeConditionalGet:
+    """Test suite for ETag validation on about endpoints."""
+
+    def test_active_not_modified(self, api_client, sample_about):
+        """Test that the active action answers 304 while the profile is unchanged."""
+        etag = api_client.get('/api/about/active/')['ETag']
+
+        response = api_client.get('/api/about/active/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_active_etag_changes_when_profile_updated(self, api_client, sample_about):
+        """Test that editing the active profile invalidates the ETag."""
+        etag = api_client.get('/api/about/active/')['ETag']
+
+        sample_about.title = 'Staff Engineer'
+        sample_about.save()
+
+        response = api_client.get('/api/about/active/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['title'] == 'Staff Engineer'
+
+
+@pytest.mark.django_db
+class TestAboutMeSparseFieldsets:
+    """Test suite for ?fields= on the about endpoints."""
+
+    def test_active_fields(self, api_client, sample_about):
+        """Test that the active profile can be reduced to a few fields."""
+        response = api_client.get('/api/about/active/?fields=name,title,profileImage')
+
+        assert response.data == {'name': 'John Doe', 'title': 'Software Engineer', 'profileImage': None}
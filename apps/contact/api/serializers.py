@@ -4,10 +4,12 @@ Serializadores para la app contact.
 """
 
 from rest_framework import serializers
+from core.sparse import SparseFieldsetSerializerMixin
+from core.timing import TimedSerializerMixin
 from apps.contact.models import ContactMessage
 
 
-class ContactMessageSerializer(serializers.ModelSerializer):
+class ContactMessageSerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for ContactMessage model with camelCase field names.
     Serializador para el modelo ContactMessage con nombres de campos en camelCase.
@@ -35,7 +37,7 @@ class ContactMessageSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'createdAt', 'updatedAt']
 
 
-class ContactMessageCreateSerializer(serializers.ModelSerializer):
+class ContactMessageCreateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for creating contact messages (public endpoint).
     Serializador para crear mensajes de contacto (endpoint público).
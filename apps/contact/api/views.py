@@ -7,7 +7,13 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view
+from core.async_views import AsyncReadMixin
+from core.cache import CachedResponseMixin
+from core.conditional import ConditionalGetMixin
+from core.sparse import SparseFieldsetViewMixin
+from core.streaming import StreamingListMixin
 from apps.contact.models import ContactMessage
+from apps.contact.notifications import queue_notification
 from .serializers import ContactMessageSerializer, ContactMessageCreateSerializer
 
 
@@ -45,7 +51,7 @@ from .serializers import ContactMessageSerializer, ContactMessageCreateSerialize
         tags=["Contact"],
     ),
 )
-class ContactMessageViewSet(viewsets.ModelViewSet):
+class ContactMessageViewSet(AsyncReadMixin, CachedResponseMixin, ConditionalGetMixin, SparseFieldsetViewMixin, StreamingListMixin, viewsets.ModelViewSet):
     """
     ViewSet for viewing and editing ContactMessage instances.
     Provides CRUD operations and status management for contact messages.
@@ -55,14 +61,26 @@ class ContactMessageViewSet(viewsets.ModelViewSet):
     """
 
     queryset = ContactMessage.objects.all()
+    cache_models = [ContactMessage]
+    cache_actions = ['list', 'retrieve', 'unread']
     serializer_class = ContactMessageSerializer
 
+    def get_conditional_querysets(self):
+        """Validate the unread action against unread messages only."""
+        if self.action == 'unread':
+            return [self.queryset.filter(is_read=False)]
+        return super().get_conditional_querysets()
+
     def get_serializer_class(self):
         """Use different serializer for creation."""
         if self.action == 'create':
             return ContactMessageCreateSerializer
         return ContactMessageSerializer
 
+    def perform_create(self, serializer):
+        """Save the message and queue its e-mail notification."""
+        queue_notification(serializer.save())
+
     @extend_schema(
         summary="Mark message as read / Marcar mensaje como leído",
         description="Mark a contact message as read. / Marca un mensaje de contacto como leído.",
@@ -113,6 +131,13 @@ class ContactMessageViewSet(viewsets.ModelViewSet):
         Get unread messages.
         Obtener mensajes no leídos.
         """
-        unread_messages = self.queryset.filter(is_read=False)
+        unread_messages = self.get_queryset().filter(is_read=False)
+        if self.wants_stream(request):
+            return self.stream_queryset(unread_messages)
         serializer = self.get_serializer(unread_messages, many=True)
         return Response(serializer.data)
+
+    async def aunread(self, request):
+        """Async variant of ``unread`` (ASYNC_VIEWS); ``?stream=1`` stays synchronous."""
+        unread_messages = [message async for message in self.get_queryset().filter(is_read=False)]
+        return Response(self.get_serializer(unread_messages, many=True).data)
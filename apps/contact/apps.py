@@ -11,3 +11,14 @@ class ContactConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.contact'
+
+    def ready(self):
+        """Register versioned caching, query budgets and the notification job."""
+        from core import budgets, cache, jobs
+        from .api.views import ContactMessageViewSet
+        from .models import ContactMessage
+        from .notifications import TASK, send_notification
+
+        cache.register(ContactMessage)
+        budgets.register(ContactMessageViewSet, list=3, retrieve=2, unread=2)
+        jobs.register(TASK, send_notification)
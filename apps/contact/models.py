@@ -27,6 +27,12 @@ class ContactMessage(models.Model):
         verbose_name = _("Contact Message")
         verbose_name_plural = _("Contact Messages")
         ordering = ["-created_at"]
+        indexes = [
+            # Default list ordering and the (-created_at, id) keyset.
+            models.Index(fields=["-created_at", "id"], name="contact_created_idx"),
+            # Only unread rows, for the unread action.
+            models.Index(fields=["-created_at", "id"], condition=models.Q(is_read=False), name="contact_unread_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.subject}"
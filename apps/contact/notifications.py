@@ -0,0 +1,39 @@
+"""
+E-mail notification of new contact messages.
+Notificación por correo de los nuevos mensajes de contacto.
+
+The e-mail is sent by a background job so a slow or failing SMTP server
+never delays or fails the submission; failed sends are retried.
+El correo lo envía un trabajo en segundo plano, así un servidor SMTP lento o
+caído nunca retrasa ni hace fallar el envío del formulario.
+"""
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from core import jobs
+from .models import ContactMessage
+
+TASK = "contact.notify"
+
+
+def queue_notification(message):
+    """Queue the notification of ``message`` when recipients are configured."""
+    if getattr(settings, "CONTACT_NOTIFICATION_EMAILS", None):
+        jobs.enqueue(TASK, {"message_id": message.pk})
+
+
+def send_notification(message_id):
+    """
+    Send the notification e-mail of one contact message.
+    Envía el correo de notificación de un mensaje de contacto.
+    """
+    message = ContactMessage.objects.filter(pk=message_id).first()
+    if message is None:
+        return
+    sender = [f"{message.name} <{message.email}>"] + ([message.phone] if message.phone else [])
+    EmailMessage(
+        subject=f"[Portfolio] {message.subject}",
+        body="\n".join([*sender, "", message.message]),
+        to=settings.CONTACT_NOTIFICATION_EMAILS,
+        reply_to=[message.email],
+    ).send()
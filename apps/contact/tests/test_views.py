@@ -2,6 +2,8 @@
 Tests for ContactMessage API views.
 """
 
+import json
+
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -473,3 +475,190 @@ class TestContactMessageViewSet:
 
         assert response.status_code == status.HTTP_201_CREATED
         assert len(response.data['message']) == 1000
+
+
+@pytest.mark.django_db
+class TestContactKeysetPagination:
+    """Test suite for opt-in keyset (cursor) pagination on contact messages."""
+
+    def _create_messages(self, count):
+        return [
+            ContactMessage.objects.create(
+                name=f'Sender {index}',
+                email=f'sender{index}@example.com',
+                subject=f'Subject {index}',
+                message='Body',
+            )
+            for index in range(count)
+        ]
+
+    def _walk(self, api_client, url):
+        seen = []
+        while url:
+            response = api_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            seen.extend(message['id'] for message in response.data['results'])
+            url = response.data['next']
+        return seen
+
+    def test_cursor_mode_is_opt_in(self, api_client, sample_message):
+        """Test that plain requests keep page-number pagination."""
+        response = api_client.get('/api/contact/')
+
+        assert 'count' in response.data
+
+    def test_cursor_first_page_has_no_count(self, api_client, sample_message, django_assert_num_queries):
+        """Test that the first cursor page skips COUNT(*) and OFFSET."""
+        # One conditional GET aggregate, then the page itself.
+        with django_assert_num_queries(2) as context:
+            response = api_client.get('/api/contact/?cursor=')
+
+        assert set(response.data) == {'next', 'previous', 'results'}
+        assert response.data['previous'] is None
+        assert 'COUNT' not in context.captured_queries[-1]['sql'].upper()
+        assert 'OFFSET' not in context.captured_queries[-1]['sql'].upper()
+
+    def test_cursor_walks_every_message_in_order(self, api_client):
+        """Test that following next links visits every message once, newest first."""
+        messages = self._create_messages(25)
+
+        seen = self._walk(api_client, '/api/contact/?cursor=')
+
+        assert seen == [message.id for message in reversed(messages)]
+
+    def test_cursor_stable_across_inserts(self, api_client):
+        """Test that messages inserted between pages do not shift the next page."""
+        messages = self._create_messages(15)
+        first_page = api_client.get('/api/contact/?cursor=')
+
+        self._create_messages(3)
+        second_page = api_client.get(first_page.data['next'])
+
+        expected = [message.id for message in reversed(messages)]
+        assert [message['id'] for message in second_page.data['results']] == expected[10:]
+
+    def test_cursor_previous_link(self, api_client):
+        """Test that the previous link returns the page before."""
+        self._create_messages(15)
+        first_page = api_client.get('/api/contact/?cursor=')
+        second_page = api_client.get(first_page.data['next'])
+
+        back = api_client.get(second_page.data['previous'])
+
+        assert back.data['results'] == first_page.data['results']
+
+    def test_invalid_cursor_returns_404(self, api_client):
+        """Test that a tampered cursor is rejected."""
+        response = api_client.get('/api/contact/?cursor=not-a-cursor')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestContactIndexUsage:
+    """Test suite proving contact endpoints are served by their indexes."""
+
+    def test_list_uses_created_index(self, explain_endpoint, sample_message):
+        """Test that the newest-first list reads the created_at index."""
+        assert 'contact_created_idx' in explain_endpoint('/api/contact/')
+
+    def test_unread_uses_partial_index(self, explain_endpoint, sample_message):
+        """Test that the unread action reads the partial index."""
+        assert 'contact_unread_idx' in explain_endpoint('/api/contact/unread/')
+
+
+@pytest.mark.django_db
+class TestContactConditionalGet:
+    """Test suite for ETag validation on contact endpoints."""
+
+    def test_unread_not_modified(self, api_client, sample_message, read_message):
+        """Test that the unread action answers 304 while unread rows are unchanged."""
+        etag = api_client.get('/api/contact/unread/')['ETag']
+
+        response = api_client.get('/api/contact/unread/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_unread_etag_changes_when_message_read(self, api_client, sample_message):
+        """Test that marking a message read invalidates the unread ETag."""
+        etag = api_client.get('/api/contact/unread/')['ETag']
+
+        api_client.post(f'/api/contact/{sample_message.id}/mark_read/')
+
+        response = api_client.get('/api/contact/unread/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == []
+
+
+@pytest.mark.django_db
+class TestContactStreaming:
+    """Test suite for ?stream=1 on contact list endpoints."""
+
+    def test_list_stream(self, api_client, sample_message, read_message):
+        """Test that the list streams every message as a JSON array."""
+        response = api_client.get('/api/contact/?stream=1')
+
+        assert response.streaming
+        payload = json.loads(b''.join(response.streaming_content))
+        assert {message['email'] for message in payload} == {'john@example.com', 'jane@example.com'}
+
+    def test_unread_stream(self, api_client, sample_message, read_message):
+        """Test that the unread action streams only unread messages."""
+        response = api_client.get('/api/contact/unread/?stream=1')
+
+        assert response.streaming
+        payload = json.loads(b''.join(response.streaming_content))
+        assert [message['email'] for message in payload] == ['john@example.com']
+
+
+@pytest.mark.django_db
+class TestContactSparseFieldsets:
+    """Test suite for ?omit= on contact endpoints."""
+
+    def test_unread_omit_message(self, api_client, sample_message):
+        """Test that the unread inbox can skip message bodies."""
+        response = api_client.get('/api/contact/unread/?omit=message,phone')
+
+        assert 'message' not in response.data[0]
+        assert response.data[0]['subject'] == 'Inquiry'
+
+
+@pytest.mark.django_db
+class TestContactNotification:
+    """Test suite for the background e-mail sent on each submission."""
+
+    payload = {'name': 'Ana', 'email': 'ana@example.com', 'subject': 'Hola', 'message': 'Hi there'}
+
+    @pytest.fixture(autouse=True)
+    def recipients(self, settings):
+        settings.CONTACT_NOTIFICATION_EMAILS = ['owner@example.com']
+        settings.JOBS_SYNC = False
+
+    def test_submission_queues_a_job_and_the_worker_sends_it(self, api_client, mailoutbox):
+        """Test that the request only queues the e-mail and run_worker sends it."""
+        from core.jobs import Worker
+        from core.models import Job
+
+        response = api_client.post('/api/contact/', self.payload, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert mailoutbox == []
+        job = Job.objects.get()
+        assert job.task == 'contact.notify'
+
+        assert Worker().run(burst=True) == 1
+        assert len(mailoutbox) == 1
+        assert mailoutbox[0].to == ['owner@example.com']
+        assert mailoutbox[0].reply_to == ['ana@example.com']
+        assert mailoutbox[0].subject == '[Portfolio] Hola'
+        job.refresh_from_db()
+        assert job.status == Job.Status.DONE
+
+    def test_no_recipients_no_job(self, settings, api_client):
+        """Test that nothing is queued when no recipient is configured."""
+        from core.models import Job
+
+        settings.CONTACT_NOTIFICATION_EMAILS = []
+        api_client.post('/api/contact/', self.payload, format='json')
+
+        assert not Job.objects.exists()
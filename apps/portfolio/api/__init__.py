@@ -0,0 +1,4 @@
+"""
+API package for portfolio app.
+Paquete API para la app portfolio.
+"""
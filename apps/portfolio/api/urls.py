@@ -0,0 +1,11 @@
+"""
+URL configuration for the portfolio app API.
+Configuración de URL para la API de la app portfolio.
+"""
+
+from django.urls import path
+from .views import PortfolioBundleView
+
+urlpatterns = [
+    path("portfolio/", PortfolioBundleView.as_view(), name="portfolio-bundle"),
+]
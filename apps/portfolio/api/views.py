@@ -0,0 +1,83 @@
+"""
+API views for the portfolio app.
+Vistas de API para la app portfolio.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.views import APIView
+from core.cache import make_model_key
+from core.conditional import make_etag
+from core.renderers import FastJSONRenderer
+from apps.about.api.serializers import AboutMeSerializer
+from apps.about.models import AboutMe
+from apps.projects.api.serializers import ProjectSerializer
+from apps.projects.models import Project
+from apps.skills.api.serializers import SkillCategorySerializer
+from apps.skills.api.views import SkillViewSet
+from apps.skills.models import Skill, SkillCategory
+
+
+class PortfolioBundleView(APIView):
+    """
+    Everything the portfolio page renders, in one response.
+    Todo lo que muestra la página del portfolio, en una sola respuesta.
+
+    Replaces the ``/api/about/active/``, ``/api/projects/featured/``,
+    ``/api/skills/by_category/`` and ``/api/projects/`` round trips. The body
+    is cached as pre-encoded bytes under a key versioned by every model it
+    contains, so a warm request does no database work and no JSON encoding.
+    """
+
+    cache_models = [AboutMe, Project, Skill, SkillCategory]
+
+    @extend_schema(
+        summary="Get the portfolio bundle / Obtener el bundle del portfolio",
+        description="Active profile, featured projects, every project and skills grouped by category in one response. / Perfil activo, proyectos destacados, todos los proyectos y habilidades agrupadas por categoría en una sola respuesta.",
+        responses={200: OpenApiTypes.OBJECT},
+        tags=["Portfolio"],
+    )
+    def get(self, request):
+        """
+        Return the cached bundle, building it on a miss.
+        Retorna el bundle cacheado, construyéndolo si no existe.
+        """
+        # Image URLs are absolute, so each host gets its own copy.
+        # Las URLs de imágenes son absolutas, así que cada host tiene su copia.
+        cache_key = make_model_key(f"portfolio:bundle:{request.scheme}://{request.get_host()}", *self.cache_models)
+        etag = make_etag(cache_key)
+        not_modified = get_conditional_response(request._request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        body = cache.get(cache_key)
+        if body is None:
+            body = FastJSONRenderer().render(self.build_bundle(request))
+            cache.set(cache_key, body, settings.API_CACHE_TIMEOUT)
+        response = HttpResponse(body, content_type="application/json")
+        response["ETag"] = etag
+        return response
+
+    @staticmethod
+    def build_bundle(request):
+        """
+        Serialize the bundle with four queries, whatever the row counts.
+        Serializa el bundle con cuatro consultas, sin importar el número de filas.
+
+        Projects are read once; the featured list is taken from the same rows.
+        """
+        context = {"request": request}
+        about = AboutMe.objects.filter(is_active=True).first()
+        projects = ProjectSerializer(Project.objects.all(), many=True, context=context).data
+        return {
+            "about": AboutMeSerializer(about, context=context).data if about else None,
+            "featuredProjects": [project for project in projects if project["isFeatured"]],
+            "projects": projects,
+            "skillsByCategory": SkillCategorySerializer(
+                SkillViewSet.get_category_tree(), many=True, context=context
+            ).data,
+        }
@@ -0,0 +1,22 @@
+"""
+Portfolio app configuration.
+Configuración de la app portfolio.
+"""
+
+from django.apps import AppConfig
+
+
+class PortfolioConfig(AppConfig):
+    """Portfolio bundle app config."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.portfolio'
+
+    def ready(self):
+        """Register signal handlers, the bundle query budget and the export job."""
+        from core import budgets, jobs
+        from . import signals, static_api  # noqa: F401
+        from .api.views import PortfolioBundleView
+
+        budgets.register(PortfolioBundleView, get=4)
+        jobs.register(static_api.TASK, static_api.export_changes)
@@ -0,0 +1,4 @@
+"""
+Management package for portfolio app.
+Paquete de gestión para la app portfolio.
+"""
@@ -0,0 +1,4 @@
+"""
+Management commands for portfolio app.
+Comandos de gestión para la app portfolio.
+"""
@@ -0,0 +1,40 @@
+"""
+Pre-render the public read API into static JSON files.
+Pre-renderiza la API pública de lectura en archivos JSON estáticos.
+
+Run after collectstatic so WhiteNoise picks the files up at startup; with
+STATIC_API_EXPORT_ON_SAVE the files are then kept current on every save.
+Ejecutar tras collectstatic para que WhiteNoise encuentre los archivos.
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from apps.portfolio import static_api
+
+
+class Command(BaseCommand):
+    """Export every public GET endpoint, or only some groups."""
+
+    help = "Pre-render the public read API into static JSON files."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "groups",
+            nargs="*",
+            help=f"Groups to export (default: all). Choices: {', '.join(static_api.GROUPS)}.",
+        )
+        parser.add_argument("--root", help="Output directory (default: STATIC_API_ROOT).")
+
+    def handle(self, *args, **options):
+        unknown = set(options["groups"]) - set(static_api.GROUPS)
+        if unknown:
+            raise CommandError(f"Unknown group(s): {', '.join(sorted(unknown))}")
+
+        root = Path(options["root"]) if options["root"] else static_api.get_root()
+        written = 0
+        for name in options["groups"] or static_api.GROUPS:
+            files = static_api.export_group(name, root)
+            written += len(files)
+            self.stdout.write(f"Exported {name}: {len(files)} file(s).")
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} file(s) to {root}."))
@@ -0,0 +1,146 @@
+"""
+Fill the database with a reproducible portfolio of configurable size.
+Llena la base de datos con un portfolio reproducible de tamaño configurable.
+
+Rows are written with bulk inserts, then the derived data that bulk inserts
+skip is rebuilt: technology links, project snapshots, the search index and
+the cache versions. Used by benchmark_api and for local profiling.
+Las filas se insertan en bloque y luego se reconstruyen los datos derivados
+que las inserciones en bloque omiten.
+"""
+
+import random
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.about.models import AboutMe
+from apps.contact.models import ContactMessage
+from apps.projects.models import Project, Technology
+from apps.skills.models import Skill, SkillCategory
+from core import cache, search
+
+WORDS = "django python react postgres api cache query index render stream portfolio fast lean".split()
+TECHNOLOGIES = ["Python", "Django", "React", "PostgreSQL", "Redis", "Docker", "TypeScript", "Go", "Rust", "AWS"]
+
+
+class Command(BaseCommand):
+    """Seed projects, skills, categories, contact messages and a profile."""
+
+    help = "Fill the database with a reproducible portfolio of configurable size."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--projects", type=int, default=200, help="Number of projects.")
+        parser.add_argument("--categories", type=int, default=8, help="Number of skill categories.")
+        parser.add_argument("--skills", type=int, default=10, help="Skills per category.")
+        parser.add_argument("--messages", type=int, default=500, help="Number of contact messages.")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows per INSERT.")
+        parser.add_argument("--clear", action="store_true", help="Delete existing portfolio rows first.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        batch_size = options["batch_size"]
+
+        with transaction.atomic():
+            if options["clear"]:
+                for model in (Project, Technology, Skill, SkillCategory, ContactMessage, AboutMe):
+                    model.objects.all().delete()
+
+            categories = SkillCategory.objects.bulk_create(
+                [
+                    SkillCategory(name=f"{self.words(rng, 1).title()} {index}", description=self.words(rng, 12), order=index)
+                    for index in range(options["categories"])
+                ],
+                batch_size=batch_size,
+            )
+            Skill.objects.bulk_create(
+                [
+                    Skill(
+                        name=f"{self.words(rng, 1).title()} {category.order}-{index}",
+                        category=category,
+                        proficiency=rng.choice(["beginner", "intermediate", "advanced", "expert"]),
+                        percentage=rng.randint(10, 100),
+                        description=self.words(rng, 20),
+                        years_experience=rng.randint(0, 12),
+                        is_featured=rng.random() < 0.2,
+                        order=index,
+                    )
+                    for category in categories
+                    for index in range(options["skills"])
+                ],
+                batch_size=batch_size,
+            )
+
+            projects = Project.objects.bulk_create(
+                [
+                    Project(
+                        title=f"{self.words(rng, 3).title()} {index}",
+                        description=self.words(rng, rng.randint(40, 120)),
+                        short_description=self.words(rng, 12),
+                        url=f"https://example.com/{index}",
+                        github_url=f"https://github.com/example/{index}",
+                        technologies=", ".join(rng.sample(TECHNOLOGIES, rng.randint(1, 4))),
+                        is_featured=rng.random() < 0.2,
+                        order=rng.randint(0, 50),
+                    )
+                    for index in range(options["projects"])
+                ],
+                batch_size=batch_size,
+            )
+            self.link_technologies(projects, batch_size)
+
+            ContactMessage.objects.bulk_create(
+                [
+                    ContactMessage(
+                        name=f"Sender {index}",
+                        email=f"sender{index}@example.com",
+                        subject=self.words(rng, 5),
+                        message=self.words(rng, 40),
+                        is_read=rng.random() < 0.5,
+                    )
+                    for index in range(options["messages"])
+                ],
+                batch_size=batch_size,
+            )
+            if not AboutMe.objects.filter(is_active=True).exists():
+                AboutMe.objects.create(name="Jane Doe", title="Software Engineer", bio=self.words(rng, 60), email="jane@example.com")
+
+        call_command("rebuild_project_snapshots", stdout=StringIO())
+        if search.get_backend("default") is not None:
+            call_command("rebuild_search_index", stdout=StringIO())
+        for model in cache.registered_models():
+            cache.bump_model_version(model)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(projects)} projects, {len(categories)} categories, "
+            f"{len(categories) * options['skills']} skills and {options['messages']} messages."
+        ))
+
+    @staticmethod
+    def words(rng, count):
+        return " ".join(rng.choices(WORDS, k=count))
+
+    @staticmethod
+    def link_technologies(projects, batch_size):
+        """Bulk version of Project.sync_tech_stack for freshly inserted rows."""
+        names = {}
+        for project in projects:
+            names.update({key: name for key, name in Technology.parse(project.technologies).items() if key not in names})
+        Technology.objects.bulk_create(
+            [Technology(name=name, normalized_name=key) for key, name in names.items()],
+            ignore_conflicts=True,
+            batch_size=batch_size,
+        )
+        ids = dict(Technology.objects.filter(normalized_name__in=names).values_list("normalized_name", "pk"))
+        Through = Project.tech_stack.through
+        Through.objects.bulk_create(
+            [
+                Through(project_id=project.pk, technology_id=ids[key])
+                for project in projects
+                for key in Technology.parse(project.technologies)
+            ],
+            ignore_conflicts=True,
+            batch_size=batch_size,
+        )
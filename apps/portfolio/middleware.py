@@ -0,0 +1,85 @@
+"""
+Middleware serving pre-rendered API files.
+Middleware que sirve los archivos de API pre-renderizados.
+"""
+
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.http import http_date, quote_etag
+
+from apps.portfolio.static_api import file_for, get_root
+
+SAFE_PATH_RE = re.compile(r"^/api/[A-Za-z0-9_\-/]+/$")
+PAGE_RE = re.compile(r"^[1-9][0-9]*$")
+
+
+class StaticAPIFallbackMiddleware:
+    """
+    Answer public API GETs from the static export before reaching DRF.
+    Responde los GET de la API pública desde la exportación estática antes de DRF.
+
+    Enabled with ``STATIC_API_FALLBACK = True``. Only plain requests are
+    served: JSON (not the browsable API), no query string other than
+    ``?page=``, and only paths that were exported; everything else, and any
+    missing file, falls through to the normal view.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "STATIC_API_FALLBACK", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        self.max_age = getattr(settings, "STATIC_API_MAX_AGE", 60)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        path = self.get_static_file(request)
+        if path is None:
+            return self.get_response(request)
+        return self.file_response(request, path)
+
+    async def __acall__(self, request):
+        path = self.get_static_file(request)
+        if path is None:
+            return await self.get_response(request)
+        return self.file_response(request, path)
+
+    def file_response(self, request, path):
+        stat = path.stat()
+        etag = quote_etag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+        if etag in request.headers.get("If-None-Match", ""):
+            response = HttpResponseNotModified()
+        else:
+            response = FileResponse(path.open("rb"), content_type="application/json")
+            response["Last-Modified"] = http_date(stat.st_mtime)
+        response["ETag"] = etag
+        response["Cache-Control"] = f"public, max-age={self.max_age}"
+        return response
+
+    def get_static_file(self, request):
+        """Return the exported file for the request, or None to fall through."""
+        if request.method not in ("GET", "HEAD") or not SAFE_PATH_RE.match(request.path_info):
+            return None
+        if "text/html" in request.headers.get("Accept", ""):
+            return None
+        params = request.GET
+        if set(params) - {"page"} or len(params.getlist("page")) > 1:
+            return None
+        page = params.get("page")
+        if page is not None and not PAGE_RE.match(page):
+            return None
+        if request.path_info.startswith("/api/contact/") or "//" in request.path_info:
+            return None
+
+        path = get_root() / file_for(request.path_info, page)
+        return path if path.is_file() else None
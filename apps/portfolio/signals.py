@@ -0,0 +1,32 @@
+"""
+Signal handlers for the portfolio app.
+Manejadores de señales para la app portfolio.
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.images import variants_generated
+from apps.about.models import AboutMe
+from apps.portfolio import static_api
+from apps.projects.models import Project
+from apps.skills.models import Skill, SkillCategory
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=SkillCategory)
+@receiver(post_delete, sender=SkillCategory)
+@receiver(post_save, sender=AboutMe)
+@receiver(post_delete, sender=AboutMe)
+@receiver(variants_generated)
+def refresh_static_api(sender, **kwargs):
+    """
+    Re-export the static JSON files of the changed model after commit.
+    Re-exporta los archivos JSON estáticos del modelo modificado tras el commit.
+    """
+    if getattr(settings, "STATIC_API_EXPORT_ON_SAVE", False):
+        static_api.schedule_export(sender, kwargs.get("instance"))
@@ -0,0 +1,242 @@
+"""
+Pre-rendered static JSON copies of the public read API.
+Copias JSON estáticas pre-renderizadas de la API pública de lectura.
+
+Every public GET endpoint (each list page, featured/active/by_category
+actions, each detail and the portfolio bundle) is rendered through its DRF
+view and written under ``STATIC_API_ROOT`` mirroring the URL:
+
+- ``/api/projects/``        -> ``api/projects/index.json``
+- ``/api/projects/?page=2`` -> ``api/projects/page-2.json``
+- ``/api/projects/5/``      -> ``api/projects/5/index.json``
+
+Cada endpoint GET público se renderiza con su vista DRF y se escribe bajo
+``STATIC_API_ROOT`` reflejando la URL.
+
+After a save only the changed rows' detail files are rendered again, with
+the list and single endpoints of their groups, and the work runs as a
+``core.jobs`` task so the saving request does not wait for it.
+Tras un guardado solo se renderizan de nuevo los detalles de las filas
+modificadas y las listas de sus grupos, en un trabajo de ``core.jobs``.
+
+Contact messages are private and never exported.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from django.conf import settings
+from django.db import transaction
+from django.test import RequestFactory
+from django.urls import resolve
+
+from apps.about.models import AboutMe
+from apps.projects.models import Project
+from apps.skills.models import Skill, SkillCategory
+from core import jobs
+from core.files import write_file
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+TASK = "static_api.export"
+
+# Export group -> (list endpoints, detail endpoint prefix and model, single endpoints).
+# Grupo de exportación -> (listas, prefijo y modelo de detalle, endpoints sueltos).
+GROUPS = {
+    "projects": (["/api/projects/"], ("/api/projects/", Project), ["/api/projects/featured/"]),
+    "skills": (["/api/skills/"], ("/api/skills/", Skill), ["/api/skills/featured/", "/api/skills/by_category/"]),
+    "skill-categories": (["/api/skill-categories/"], ("/api/skill-categories/", SkillCategory), []),
+    "about": (["/api/about/"], ("/api/about/", AboutMe), ["/api/about/active/"]),
+    "portfolio": ([], None, ["/api/portfolio/"]),
+}
+
+# Groups whose output depends on each model.
+# Grupos cuya salida depende de cada modelo.
+MODEL_GROUPS = {
+    Project: ["projects", "portfolio"],
+    Skill: ["skills", "skill-categories", "portfolio"],
+    SkillCategory: ["skills", "skill-categories", "portfolio"],
+    AboutMe: ["about", "portfolio"],
+}
+
+# Detail rows of another group that embed a changed row; None means all of
+# them (a skill moved between categories changes two, and categories are few).
+# Filas de detalle de otro grupo que incluyen la fila modificada.
+RELATED_ROWS = {
+    (Skill, "skill-categories"): lambda instance: None,
+    (SkillCategory, "skills"): lambda instance: set(instance.skills.values_list("pk", flat=True)),
+}
+
+_pending = threading.local()
+
+
+def get_root():
+    return Path(getattr(settings, "STATIC_API_ROOT", None) or settings.STATIC_ROOT)
+
+
+def file_for(path, page=None):
+    """
+    Return the file (relative to the export root) for an API path and page.
+    Retorna el archivo (relativo a la raíz de exportación) de una ruta y página.
+    """
+    directory = Path(path.strip("/"))
+    if page and str(page) != "1":
+        return directory / f"page-{page}.json"
+    return directory / INDEX_FILE
+
+
+def render(path, page=None):
+    """
+    Render ``path`` through its view and return the response.
+    Renderiza ``path`` con su vista y retorna la respuesta.
+
+    Requests are built for ``STATIC_API_BASE_URL`` so absolute links
+    (pagination, images) point at the public host.
+    """
+    base = urlsplit(getattr(settings, "STATIC_API_BASE_URL", "http://localhost:8000"))
+    request = RequestFactory().get(
+        path,
+        data={"page": page} if page else None,
+        HTTP_HOST=base.netloc,
+        HTTP_ACCEPT="application/json",
+        secure=base.scheme == "https",
+    )
+    match = resolve(path)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, "render"):
+        response.render()
+    return response
+
+
+def export_endpoint(root, path):
+    """
+    Export every page of ``path`` and return the files written.
+    Exporta cada página de ``path`` y retorna los archivos escritos.
+    """
+    written = []
+    page = None
+    while True:
+        response = render(path, page)
+        if response.status_code != 200:
+            return written
+        relative = file_for(path, page)
+        write_file(root, relative, response.content)
+        written.append(relative)
+
+        payload = json.loads(response.content)
+        next_link = payload.get("next") if isinstance(payload, dict) else None
+        if not next_link:
+            return written
+        page = parse_qs(urlsplit(next_link).query).get("page", [None])[0]
+        if page is None:
+            return written
+
+
+def export_group(name, root=None, rows=None):
+    """
+    Re-export one group and delete its files that no longer exist.
+    Re-exporta un grupo y borra sus archivos que ya no existen.
+
+    ``rows`` limits the detail files to those primary keys (deleting the ones
+    that no longer render); by default every row is exported.
+    """
+    root = root or get_root()
+    lists, detail, singles = GROUPS[name]
+    written = []
+    for path in lists + singles:
+        written += export_endpoint(root, path)
+    if detail is not None:
+        prefix, model = detail
+        if rows is None:
+            pks = model._default_manager.values_list("pk", flat=True).iterator()
+        else:
+            pks = sorted(rows)
+        for pk in pks:
+            files = export_endpoint(root, f"{prefix}{pk}/")
+            if not files:
+                (root / file_for(f"{prefix}{pk}/")).unlink(missing_ok=True)
+            written += files
+
+    # Remove pages and details that disappeared; single endpoints of other
+    # groups never live under a list directory. A partial export only knows
+    # the list pages, so details of rows it did not render are kept.
+    # Borra páginas y detalles que desaparecieron.
+    keep = {root / relative for relative in written}
+    for path in lists:
+        directory = root / path.strip("/")
+        candidates = directory.rglob("*.json") if rows is None else directory.glob("*.json")
+        for stale in candidates:
+            if stale not in keep and not any(stale == root / file_for(single) for single in singles):
+                stale.unlink()
+    return written
+
+
+def export_changes(changes, root=None):
+    """
+    Re-export the groups in ``changes`` (group -> changed primary keys or None).
+    Re-exporta los grupos de ``changes`` (grupo -> claves modificadas o None).
+
+    This is the ``static_api.export`` job; a failing group is logged and the
+    others are still exported, then the job fails so the worker retries it.
+    """
+    failed = []
+    for name in sorted(changes):
+        try:
+            export_group(name, root, changes[name])
+        except Exception:
+            # The change is committed; a failed export only leaves files stale.
+            # El cambio ya está confirmado; un fallo solo deja archivos desactualizados.
+            logger.exception("Static API export of %s failed", name)
+            failed.append(name)
+    if failed:
+        raise RuntimeError(f"Static API export failed for: {', '.join(failed)}")
+
+
+def changed_rows(model, name, instance):
+    """
+    Return the detail rows of group ``name`` affected by ``instance`` (None: all).
+    Retorna las filas de detalle del grupo ``name`` afectadas por ``instance``.
+    """
+    detail = GROUPS[name][1]
+    if detail is None:
+        return set()
+    if instance is None:
+        return None
+    if detail[1] is model:
+        return {instance.pk}
+    related = RELATED_ROWS.get((model, name))
+    return related(instance) if related else None
+
+
+def schedule_export(model, instance=None):
+    """
+    Queue the export of the rows affected by ``instance`` once the transaction commits.
+    Encola la exportación de las filas afectadas por ``instance`` al confirmar.
+
+    Changes within one transaction are merged into a single job: the first
+    commit hook enqueues every pending change and the others find none.
+    """
+    changes = getattr(_pending, "changes", None) or {}
+    for name in MODEL_GROUPS[model]:
+        rows = changed_rows(model, name, instance)
+        if name in changes:
+            rows = None if rows is None or changes[name] is None else changes[name] | rows
+        changes[name] = rows
+    _pending.changes = changes
+    transaction.on_commit(_flush)
+
+
+def _flush():
+    changes = getattr(_pending, "changes", None) or {}
+    _pending.changes = {}
+    if not changes:
+        return
+    payload = {name: None if rows is None else sorted(rows) for name, rows in changes.items()}
+    try:
+        jobs.enqueue(TASK, {"changes": payload})
+    except Exception:
+        logger.exception("Could not queue the static API export of %s", ", ".join(sorted(payload)))
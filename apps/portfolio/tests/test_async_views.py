@@ -0,0 +1,104 @@
+"""
+Tests for the native async read actions (ASYNC_VIEWS).
+Pruebas de las acciones de lectura asíncronas nativas (ASYNC_VIEWS).
+"""
+
+import json
+
+import pytest
+from apps.projects.models import Project
+
+
+@pytest.fixture
+def sample_project():
+    """Fixture for creating a sample project."""
+    return Project.objects.create(title='Sample Project', description='Sample description', order=1)
+
+
+@pytest.fixture
+def featured_project():
+    """Fixture for creating a featured project."""
+    return Project.objects.create(
+        title='Featured Project', description='Featured project description', is_featured=True, order=0
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncViews:
+    """Test suite for the native async read actions (ASYNC_VIEWS)."""
+
+    @pytest.fixture
+    def async_view(self, settings):
+        from apps.projects.api.views import ProjectViewSet
+
+        settings.ASYNC_VIEWS = True
+
+        def build(actions, detail=False):
+            return ProjectViewSet.as_view(actions, basename='project', detail=detail)
+        return build
+
+    @staticmethod
+    def call(view, path, **kwargs):
+        from asgiref.sync import async_to_sync
+        from django.test import AsyncRequestFactory
+
+        return async_to_sync(view)(AsyncRequestFactory().get(path), **kwargs)
+
+    def test_views_are_coroutines_only_when_enabled(self, settings):
+        """Test that ASYNC_VIEWS turns the viewset routes into coroutines."""
+        import asyncio
+        from apps.projects.api.views import ProjectViewSet
+
+        assert not asyncio.iscoroutinefunction(ProjectViewSet.as_view({'get': 'list'}))
+        settings.ASYNC_VIEWS = True
+        assert asyncio.iscoroutinefunction(ProjectViewSet.as_view({'get': 'list'}))
+
+    def test_list_matches_the_sync_view(self, async_view, api_client, sample_project, featured_project):
+        """Test that the async list renders the same page as the sync view."""
+        response = self.call(async_view({'get': 'list'}), '/api/projects/')
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == api_client.get('/api/projects/').json()
+
+    def test_retrieve_and_missing_rows(self, async_view, sample_project):
+        """Test that the async retrieve returns the row and 404 for missing ids."""
+        view = async_view({'get': 'retrieve'}, detail=True)
+
+        response = self.call(view, f'/api/projects/{sample_project.pk}/', pk=str(sample_project.pk))
+        assert json.loads(response.content)['title'] == 'Sample Project'
+        assert self.call(view, '/api/projects/999/', pk='999').status_code == 404
+
+    def test_featured_action(self, async_view, sample_project, featured_project):
+        """Test that the featured action has an async variant."""
+        response = self.call(async_view({'get': 'featured'}), '/api/projects/featured/')
+
+        assert [row['title'] for row in json.loads(response.content)] == ['Featured Project']
+
+    def test_sync_only_parameters_fall_back(self, async_view, sample_project, monkeypatch):
+        """Test that search requests run the synchronous view."""
+        from apps.projects.api.views import ProjectViewSet
+
+        async def fail(self, request, *args, **kwargs):
+            raise AssertionError('async path used')
+        monkeypatch.setattr(ProjectViewSet, 'alist', fail)
+
+        response = self.call(async_view({'get': 'list'}), '/api/projects/?search=Sample')
+
+        assert response.status_code == 200
+        assert json.loads(response.content)['results'][0]['title'] == 'Sample Project'
+
+    def test_lean_chain_runs_async(self, sample_project):
+        """Test that the dispatcher builds an async lean chain under ASGI."""
+        import asyncio
+        from asgiref.sync import async_to_sync
+        from django.test import AsyncRequestFactory
+        from core.dispatch import PathDispatchMiddleware
+
+        async def full_chain(request):
+            raise AssertionError('full chain used')
+        middleware = PathDispatchMiddleware(full_chain)
+
+        assert asyncio.iscoroutinefunction(middleware)
+        response = async_to_sync(middleware)(AsyncRequestFactory().get('/api/projects/'))
+        assert response.status_code == 200
+        assert not hasattr(response, 'wsgi_request') or not hasattr(response.wsgi_request, 'session')
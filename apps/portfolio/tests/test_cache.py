@@ -0,0 +1,26 @@
+"""
+Tests for the shared-cache system check.
+Pruebas de la comprobación del sistema de caché compartida.
+"""
+
+import pytest
+
+
+class TestSharedCacheCheck:
+    """Test suite for the system check requiring a shared cache across workers."""
+
+    @pytest.mark.parametrize('backend, workers, debug, expected', [
+        ('django.core.cache.backends.locmem.LocMemCache', '4', True, ['core.E001']),
+        ('django.core.cache.backends.locmem.LocMemCache', '', False, ['core.W001']),
+        ('django.core.cache.backends.locmem.LocMemCache', '', True, []),
+        ('django.core.cache.backends.db.DatabaseCache', '4', False, []),
+    ])
+    def test_locmem_with_several_workers(self, settings, monkeypatch, backend, workers, debug, expected):
+        """Test that a per-process cache is refused with several workers and flagged otherwise."""
+        from core.cache import check_shared_cache
+
+        settings.CACHES = {'default': {'BACKEND': backend, 'LOCATION': 'api_cache'}}
+        settings.DEBUG = debug
+        monkeypatch.setenv('WEB_CONCURRENCY', workers)
+
+        assert [message.id for message in check_shared_cache()] == expected
@@ -0,0 +1,120 @@
+"""
+Tests for the seed_portfolio and benchmark_api commands.
+"""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from apps.about.models import AboutMe
+from apps.contact.models import ContactMessage
+from apps.projects.models import Project
+from apps.skills.models import Skill, SkillCategory
+
+
+def seed(*flags):
+    """Seed a small portfolio."""
+    call_command(
+        'seed_portfolio', '--projects=12', '--categories=2', '--skills=3', '--messages=5', *flags,
+        stdout=StringIO(),
+    )
+
+
+@pytest.mark.django_db
+class TestSeedPortfolio:
+    """Test suite for the seed_portfolio command."""
+
+    def test_seeds_requested_volumes(self):
+        """Test that every model gets the requested number of rows."""
+        seed()
+
+        assert Project.objects.count() == 12
+        assert SkillCategory.objects.count() == 2
+        assert Skill.objects.count() == 6
+        assert ContactMessage.objects.count() == 5
+        assert AboutMe.objects.filter(is_active=True).count() == 1
+
+    def test_rebuilds_derived_data(self):
+        """Test that bulk-inserted projects get technologies and snapshots."""
+        seed()
+
+        project = Project.objects.first()
+        assert project.snapshot
+        assert json.loads(project.snapshot)['title'] == project.title
+        assert sorted(project.tech_stack.values_list('name', flat=True)) == sorted(
+            name.strip() for name in project.technologies.split(',')
+        )
+
+    def test_same_seed_same_data(self):
+        """Test that the data is reproducible and --clear replaces it."""
+        seed()
+        first = list(Project.objects.order_by('pk').values_list('title', flat=True))
+
+        seed('--clear')
+
+        assert list(Project.objects.order_by('pk').values_list('title', flat=True)) == first
+        assert AboutMe.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestBenchmarkApi:
+    """Test suite for the benchmark_api command."""
+
+    def run(self, *args):
+        out = StringIO()
+        call_command('benchmark_api', '--iterations=3', '--warmup=1', *args, stdout=out, stderr=StringIO())
+        return json.loads(out.getvalue())
+
+    def test_reports_every_router_endpoint(self):
+        """Test that list, detail and extra actions are all measured."""
+        seed()
+
+        report = self.run()['endpoints']
+
+        project = Project.objects.order_by('pk').first()
+        for path in ['/api/projects/', f'/api/projects/{project.pk}/', '/api/projects/featured/',
+                     '/api/skills/by_category/', '/api/about/active/', '/api/contact/unread/', '/api/portfolio/']:
+            assert path in report
+        assert set(report['/api/projects/']) == {'p50_ms', 'p95_ms', 'p99_ms', 'queries', 'bytes'}
+        assert report['/api/projects/']['bytes'] > 0
+
+    def test_cold_runs_count_queries(self):
+        """Test that --cold measures uncached requests."""
+        seed()
+
+        report = self.run('--cold')['endpoints']
+
+        assert report['/api/projects/']['queries'] > 0
+
+    def test_fails_on_regression(self, tmp_path):
+        """Test that exceeding the stored baseline fails the command."""
+        seed()
+        baseline = tmp_path / 'baseline.json'
+        self.run('--cold', f'--save-baseline={baseline}')
+        self.run('--cold', f'--baseline={baseline}', '--slack-ms=1000')
+
+        stored = json.loads(baseline.read_text())
+        stored['endpoints']['/api/projects/']['queries'] -= 1
+        baseline.write_text(json.dumps(stored))
+
+        with pytest.raises(CommandError, match='/api/projects/ queries'):
+            self.run('--cold', f'--baseline={baseline}', '--slack-ms=1000')
+
+
+@pytest.mark.django_db
+class TestBenchmarkMiddleware:
+    """Test suite for the benchmark_middleware command."""
+
+    def test_reports_full_and_lean_chains(self):
+        """Test that the stub and each path are measured in both chains."""
+        seed()
+        out = StringIO()
+
+        call_command('benchmark_middleware', '--iterations=5', '--rounds=1', '--path=/api/projects/', stdout=out)
+
+        report = json.loads(out.getvalue())
+        assert set(report['results']) == {'middleware', '/api/projects/'}
+        assert set(report['results']['middleware']) == {'full_us', 'lean_us', 'saved_us', 'saved_pct'}
+        assert 'django.contrib.sessions.middleware.SessionMiddleware' in report['skipped']
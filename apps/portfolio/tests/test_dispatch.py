@@ -0,0 +1,50 @@
+"""
+Tests for the path-based middleware dispatcher.
+Pruebas del despachador de middleware por ruta.
+"""
+
+import pytest
+from apps.projects.models import Project
+
+
+@pytest.fixture
+def sample_project():
+    """Fixture for creating a sample project."""
+    return Project.objects.create(title='Sample Project', description='Sample description')
+
+
+@pytest.mark.django_db
+class TestLeanMiddleware:
+    """Test suite for the path-based middleware dispatcher."""
+
+    def test_anonymous_api_reads_skip_session_and_auth(self, client, sample_project):
+        """Test that public reads run without session, CSRF and auth middleware."""
+        from django.contrib.auth.models import AnonymousUser
+
+        response = client.get('/api/projects/')
+
+        assert response.status_code == 200
+        assert not hasattr(response.wsgi_request, 'session')
+        assert isinstance(response.wsgi_request.user, AnonymousUser)
+
+    def test_logged_in_users_keep_the_full_stack(self, client, django_user_model):
+        """Test that a session cookie routes the request through the full chain."""
+        client.force_login(django_user_model.objects.create_user('reader', password='secret'))
+
+        response = client.get('/api/projects/')
+
+        assert hasattr(response.wsgi_request, 'session')
+        assert response.wsgi_request.user.is_authenticated
+
+    @pytest.mark.parametrize('method, url', [('post', '/api/contact/'), ('get', '/admin/')])
+    def test_writes_and_admin_keep_the_full_stack(self, client, method, url):
+        """Test that unsafe methods and non-API paths are not dispatched."""
+        response = getattr(client, method)(url)
+
+        assert hasattr(response.wsgi_request, 'session')
+
+    def test_disabled(self, settings, client):
+        """Test that the dispatcher unloads itself when disabled."""
+        settings.LEAN_MIDDLEWARE_ENABLED = False
+
+        assert hasattr(client.get('/api/projects/').wsgi_request, 'session')
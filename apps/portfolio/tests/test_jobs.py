@@ -0,0 +1,280 @@
+"""
+Tests for the database-backed job queue and the run_worker command.
+Pruebas de la cola de trabajos en base de datos y del comando run_worker.
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from core import jobs
+from core.models import Job
+
+calls = []
+
+
+def record(value=None):
+    calls.append(value)
+
+
+def explode(value=None):
+    raise RuntimeError(f'boom {value}')
+
+
+@pytest.fixture(autouse=True)
+def tasks(settings, monkeypatch):
+    """Register test tasks and queue jobs instead of running them inline."""
+    settings.JOBS_SYNC = False
+    monkeypatch.setitem(jobs._registry, 'test.record', (record, None))
+    monkeypatch.setitem(jobs._registry, 'test.explode', (explode, 3))
+    calls.clear()
+
+
+@pytest.mark.django_db
+class TestEnqueueAndClaim:
+    """Test suite for enqueueing and claiming jobs."""
+
+    def test_enqueue_stores_the_payload(self):
+        """Test that a job row holds the task, payload and attempt limit."""
+        job = jobs.enqueue('test.record', {'value': 1})
+
+        assert (job.task, job.payload, job.status) == ('test.record', {'value': 1}, Job.Status.QUEUED)
+        assert job.max_attempts == 5
+        assert jobs.enqueue('test.explode').max_attempts == 3
+
+    def test_unknown_task_is_rejected(self):
+        """Test that enqueueing an unregistered task fails immediately."""
+        with pytest.raises(KeyError):
+            jobs.enqueue('test.missing')
+
+    def test_sync_mode_runs_on_commit(self, settings, django_capture_on_commit_callbacks):
+        """Test that JOBS_SYNC runs the task after commit without a row."""
+        settings.JOBS_SYNC = True
+        with django_capture_on_commit_callbacks(execute=True):
+            assert jobs.enqueue('test.record', {'value': 2}) is None
+            assert calls == []
+
+        assert calls == [2]
+        assert not Job.objects.exists()
+
+    def test_claim_locks_due_jobs_once(self):
+        """Test that a claimed job is running and invisible to other workers."""
+        first = jobs.enqueue('test.record')
+        jobs.enqueue('test.record', delay=60)
+
+        claimed = jobs.claim('worker-a', limit=5)
+
+        assert [job.pk for job in claimed] == [first.pk]
+        assert claimed[0].status == Job.Status.RUNNING
+        assert claimed[0].attempts == 1
+        assert claimed[0].locked_by == 'worker-a'
+        assert jobs.claim('worker-b', limit=5) == []
+
+    def test_claim_skips_rows_taken_by_another_worker(self, monkeypatch):
+        """Test that the compare-and-swap fallback loses races cleanly."""
+        job = jobs.enqueue('test.record')
+        original_update = type(Job.objects.all()).update
+
+        def race(queryset, **values):
+            # Another worker takes the row between the SELECT and the UPDATE.
+            monkeypatch.setattr(type(queryset), 'update', original_update)
+            Job.objects.filter(pk=job.pk).update(status=Job.Status.RUNNING, locked_by='worker-b')
+            return original_update(queryset, **values)
+        monkeypatch.setattr(type(Job.objects.all()), 'update', race)
+
+        assert jobs.claim('worker-a') == []
+        assert Job.objects.get().locked_by == 'worker-b'
+
+
+@pytest.mark.django_db
+class TestRunAndRetry:
+    """Test suite for running, retrying and expiring jobs."""
+
+    def test_success_marks_done(self):
+        """Test that a finished job records its completion."""
+        jobs.enqueue('test.record', {'value': 'ok'})
+
+        assert jobs.run(jobs.claim('worker')[0])
+
+        job = Job.objects.get()
+        assert calls == ['ok']
+        assert job.status == Job.Status.DONE
+        assert job.finished_at is not None and job.locked_by == ''
+
+    def test_failure_is_retried_with_backoff(self, settings):
+        """Test that a failed job is requeued after its backoff with the error kept."""
+        settings.JOBS_RETRY_BACKOFF = 10
+        jobs.enqueue('test.explode', {'value': 1})
+        before = timezone.now()
+
+        assert not jobs.run(jobs.claim('worker')[0])
+
+        job = Job.objects.get()
+        assert job.status == Job.Status.QUEUED
+        assert 'RuntimeError: boom 1' in job.last_error
+        assert before + timedelta(seconds=5) <= job.run_at <= timezone.now() + timedelta(seconds=10)
+        assert jobs.claim('worker') == []
+
+    def test_failure_after_max_attempts(self):
+        """Test that a job fails for good once its attempts run out."""
+        jobs.enqueue('test.explode')
+        for _attempt in range(3):
+            Job.objects.update(run_at=timezone.now())
+            jobs.run(jobs.claim('worker')[0])
+
+        job = Job.objects.get()
+        assert (job.status, job.attempts) == (Job.Status.FAILED, 3)
+
+    def test_unknown_task_fails(self):
+        """Test that a row whose task is no longer registered fails."""
+        Job.objects.create(task='test.gone')
+
+        assert not jobs.run(jobs.claim('worker')[0])
+        assert Job.objects.get().status == Job.Status.FAILED
+
+    def test_backoff_doubles_up_to_the_cap(self, settings):
+        """Test the exponential backoff and its jitter."""
+        settings.JOBS_RETRY_BACKOFF = 10
+        settings.JOBS_RETRY_BACKOFF_MAX = 60
+
+        assert 5 <= jobs.backoff(1) <= 10
+        assert 20 <= jobs.backoff(3) <= 40
+        assert 30 <= jobs.backoff(10) <= 60
+
+    def test_expired_locks_are_requeued(self, settings):
+        """Test that jobs of a dead worker run again."""
+        settings.JOBS_LOCK_TIMEOUT = 60
+        jobs.enqueue('test.record')
+        jobs.claim('dead-worker')
+        Job.objects.update(locked_at=timezone.now() - timedelta(seconds=120))
+
+        assert jobs.requeue_expired() == 1
+        job = Job.objects.get()
+        assert job.status == Job.Status.QUEUED
+        assert 'dead-worker' in job.last_error
+
+    def test_renewed_lease_is_not_requeued(self, settings):
+        """Test that a job whose worker renews its lease is never taken as dead."""
+        settings.JOBS_LOCK_TIMEOUT = 60
+        jobs.enqueue('test.record')
+        job, = jobs.claim('slow-worker')
+        Job.objects.update(locked_at=timezone.now() - timedelta(seconds=120))
+
+        assert jobs.renew(job)
+        assert jobs.requeue_expired() == 0
+
+    def test_stale_worker_outcome_is_discarded(self, settings):
+        """Test that a worker that lost its lease cannot overwrite the newer run."""
+        settings.JOBS_LOCK_TIMEOUT = 60
+        settings.JOBS_RETRY_BACKOFF = 0
+        jobs.enqueue('test.record')
+        stale, = jobs.claim('worker')
+        Job.objects.update(locked_at=timezone.now() - timedelta(seconds=120))
+        jobs.requeue_expired()
+        Job.objects.update(run_at=timezone.now())
+        current, = jobs.claim('worker')
+
+        jobs.finish(stale, Job.Status.DONE)
+        assert not jobs.renew(stale)
+        assert Job.objects.get().status == Job.Status.RUNNING
+
+        jobs.finish(current, Job.Status.DONE)
+        assert Job.objects.get().status == Job.Status.DONE
+
+    def test_heartbeat_renews_while_the_job_runs(self, monkeypatch):
+        """Test that the heartbeat thread renews the lease until the job ends."""
+        import time
+
+        renewed = []
+        monkeypatch.setattr(jobs, 'renew', lambda job: renewed.append(job) or True)
+
+        with jobs.Heartbeat(Job(pk=1, task='test.record'), interval=0.01):
+            time.sleep(0.1)
+        count = len(renewed)
+        time.sleep(0.05)
+
+        assert count >= 2
+        assert len(renewed) == count
+
+    def test_purge_keeps_recent_and_pending_jobs(self, settings):
+        """Test that only old finished jobs are deleted."""
+        settings.JOBS_RETENTION_DAYS = 7
+        old = Job.objects.create(task='test.record', status=Job.Status.DONE, finished_at=timezone.now() - timedelta(days=8))
+        Job.objects.create(task='test.record', status=Job.Status.DONE, finished_at=timezone.now())
+        Job.objects.create(task='test.record')
+
+        assert jobs.purge() == 1
+        assert not Job.objects.filter(pk=old.pk).exists()
+
+
+@pytest.mark.django_db
+class TestRunWorker:
+    """Test suite for the Worker and the run_worker command."""
+
+    def test_burst_drains_due_jobs(self):
+        """Test that --burst runs every due job and exits."""
+        for value in range(3):
+            jobs.enqueue('test.record', {'value': value})
+        jobs.enqueue('test.explode')
+
+        output = StringIO()
+        call_command('run_worker', '--burst', stdout=output)
+
+        assert calls == [0, 1, 2]
+        assert 'Ran 4 job(s), 1 failed.' in output.getvalue()
+        assert Job.objects.filter(status=Job.Status.DONE).count() == 3
+
+    def test_stop_ends_the_loop(self):
+        """Test that a stopped worker claims nothing."""
+        jobs.enqueue('test.record')
+        worker = jobs.Worker()
+        worker.stop()
+
+        assert worker.run() == 0
+        assert calls == []
+
+
+def test_concurrent_worker_threads(monkeypatch):
+    """Test that a worker with several threads runs each claimed job exactly once."""
+    import threading
+
+    pending = list(range(7))
+    threads = set()
+
+    def claim(worker, limit=1):
+        claimed, pending[:] = pending[:limit], pending[limit:]
+        return claimed
+
+    def run(job):
+        threads.add(threading.current_thread().name)
+        record(job)
+        return job != 3
+    monkeypatch.setattr(jobs, 'claim', claim)
+    monkeypatch.setattr(jobs, 'run', run)
+    monkeypatch.setattr(jobs.Worker, 'maintain', lambda self: None)
+
+    worker = jobs.Worker(concurrency=3, poll_interval=0.01)
+
+    assert worker.run(burst=True) == 7
+    assert worker.failed == 1
+    assert sorted(calls) == list(range(7))
+    assert all(name.startswith('jobs') for name in threads)
+
+
+@pytest.mark.django_db
+def test_image_variants_run_as_a_job(settings):
+    """Test that an upload queues its variants and the worker generates them."""
+    from apps.projects.models import Project
+    from apps.projects.tests.test_models import make_image
+
+    settings.IMAGE_VARIANT_WIDTHS = [320]
+    project = Project.objects.create(title='Img', description='Desc', image=make_image())
+
+    job = Job.objects.get(task='images.variants')
+    assert job.payload == {'label': 'projects.Project', 'pk': project.pk, 'field': 'image'}
+    jobs.Worker().run(burst=True)
+
+    project.refresh_from_db()
+    assert sorted(project.image_variants['webp']) == ['320', '800']
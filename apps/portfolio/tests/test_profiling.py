@@ -0,0 +1,96 @@
+"""
+Tests for the staff-only request profiler.
+Pruebas del perfilador de peticiones para el personal.
+"""
+
+import pytest
+from apps.projects.models import Project
+
+
+@pytest.fixture
+def sample_project():
+    """Fixture for creating a sample project."""
+    return Project.objects.create(title='Sample Project', description='Sample description')
+
+
+@pytest.mark.django_db
+class TestRequestProfiler:
+    """Test suite for the staff-only request profiler."""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self, settings, tmp_path):
+        settings.PROFILER_ENABLED = True
+        settings.PROFILER_DIR = str(tmp_path)
+        settings.PROFILER_MAX_FILES = 2
+
+    @pytest.fixture
+    def staff_client(self, api_client, django_user_model):
+        staff = django_user_model.objects.create_user('staff', password='secret', is_staff=True)
+        api_client.force_login(staff)
+        return api_client
+
+    def test_sampling_profile_is_folded_stacks(self, staff_client, sample_project, tmp_path):
+        """Test that ?profile returns folded stacks and saves them."""
+        response = staff_client.get('/api/projects/?profile')
+
+        assert response['Content-Type'].startswith('text/plain')
+        assert response['X-Profile-Status'] == '200'
+        saved = tmp_path / response['X-Profile-File']
+        assert saved.suffix == '.folded'
+        for line in saved.read_text().splitlines():
+            stack, count = line.rsplit(' ', 1)
+            assert ':' in stack.split(';')[0] and int(count) > 0
+
+    def test_cprofile_mode_by_header(self, staff_client, sample_project, tmp_path):
+        """Test that X-Profile: cprofile returns pstats and saves a loadable dump."""
+        import pstats
+
+        response = staff_client.get('/api/projects/', HTTP_X_PROFILE='cprofile')
+
+        assert b'cumulative' in response.content
+        stats = pstats.Stats(str(tmp_path / response['X-Profile-File']))
+        assert any(name == 'list' for _, _, name in stats.stats)
+
+    def test_ring_buffer_keeps_newest(self, staff_client, tmp_path):
+        """Test that only PROFILER_MAX_FILES profiles are kept."""
+        names = [staff_client.get('/api/projects/?profile')['X-Profile-File'] for _ in range(3)]
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == names[1:]
+
+    def test_non_staff_requests_are_not_profiled(self, api_client, tmp_path):
+        """Test that anonymous users get the normal response."""
+        response = api_client.get('/api/projects/?profile')
+
+        assert response['Content-Type'] == 'application/json'
+        assert 'X-Profile-File' not in response
+        assert not list(tmp_path.iterdir())
+
+    def test_disabled_by_default(self, settings, staff_client):
+        """Test that the middleware unloads itself when disabled."""
+        settings.PROFILER_ENABLED = False
+
+        assert 'X-Profile-File' not in staff_client.get('/api/projects/?profile')
+
+    def test_max_files_must_be_positive(self, settings):
+        """Test that PROFILER_MAX_FILES=0 is rejected instead of deleting every profile."""
+        from django.core.exceptions import ImproperlyConfigured
+        from core.profiling import ProfilerMiddleware
+
+        settings.PROFILER_MAX_FILES = 0
+
+        with pytest.raises(ImproperlyConfigured):
+            ProfilerMiddleware(lambda request: None)
+
+    def test_refuses_to_profile_under_asgi(self, django_user_model, tmp_path):
+        """Test that ASGI requests get a 501 rather than a profile of the wrong thread."""
+        from django.test import AsyncRequestFactory
+        from core.profiling import ProfilerMiddleware
+
+        middleware = ProfilerMiddleware(lambda request: pytest.fail('view should not run'))
+        request = AsyncRequestFactory().get('/api/projects/?profile')
+        request.user = django_user_model(username='staff', is_staff=True)
+
+        response = middleware(request)
+
+        assert response.status_code == 501
+        assert not list(tmp_path.iterdir())
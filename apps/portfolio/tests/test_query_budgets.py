@@ -0,0 +1,45 @@
+"""
+Query budget regression tests for every API read route.
+Pruebas de regresión de presupuestos de consultas para cada ruta de lectura.
+
+Cases come from ``core.budgets`` through the ``core.testing`` plugin.
+"""
+
+import pytest
+from core.budgets import budget_cases, get_budget
+from core.testing import BUDGET_ROWS
+from apps.projects.api.views import ProjectViewSet
+
+
+@pytest.mark.django_db
+def test_query_budget(budget_case, query_counts):
+    """Each route stays within its budget and runs the same queries for 1 or N rows."""
+    counts = query_counts(budget_case)
+    assert max(counts.values()) <= budget_case.budget, counts
+    assert counts[BUDGET_ROWS] == counts[1], f"queries grow with rows: {counts}"
+
+
+def test_every_read_route_has_a_budget():
+    """The main list and detail routes are covered by the registry."""
+    names = {case.url_name for case in budget_cases()}
+    for basename in ('project', 'skill', 'skill-category', 'about', 'contact'):
+        assert {f'{basename}-list', f'{basename}-detail'} <= names
+    assert 'portfolio-bundle' in names
+
+
+def test_budgets_and_benchmark_walk_the_same_routes():
+    """Every budgeted route is one of the GET routes benchmark_api walks."""
+    from core.routes import iter_routes
+
+    routes = {route.url_name: route for route in iter_routes()}
+    for case in budget_cases():
+        assert routes[case.url_name].action == case.action
+
+
+def test_budget_lookup_follows_inheritance():
+    """Subclasses of a registered viewset inherit its budgets."""
+    class CustomProjectViewSet(ProjectViewSet):
+        pass
+
+    assert get_budget(CustomProjectViewSet, 'list') == get_budget(ProjectViewSet, 'list')
+    assert get_budget(CustomProjectViewSet, 'unknown') is None
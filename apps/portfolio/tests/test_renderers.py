@@ -0,0 +1,87 @@
+"""
+Tests for the orjson-backed JSON renderer and parser.
+Pruebas del renderizador y analizador JSON basados en orjson.
+"""
+
+import pytest
+from rest_framework import status
+from apps.projects.models import Project
+
+
+@pytest.fixture
+def sample_project():
+    """Fixture for creating a sample project."""
+    return Project.objects.create(title='Sample Project', description='Sample description')
+
+
+class TestFastJSON:
+    """Test suite for the orjson-backed renderer and parser."""
+
+    def payload(self):
+        import datetime
+        import uuid
+        from decimal import Decimal
+        from django.utils import timezone
+        from django.utils.translation import gettext_lazy as _
+
+        return {
+            'aware': datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'local': timezone.localtime(timezone.now()),
+            'naive': datetime.datetime(2024, 5, 1, 12, 30),
+            'date': datetime.date(2024, 5, 1),
+            'time': datetime.time(8, 15, 30, 500),
+            'decimal': Decimal('19.99'),
+            'lazy': _('Projects'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'text': 'Ñandú   line   end',
+            'nested': [1, 2.5, None, True, {'a': 'b'}],
+        }
+
+    def test_render_is_byte_identical(self):
+        """Test that non-native values encode exactly like DRF's JSONRenderer."""
+        from rest_framework.renderers import JSONRenderer
+        from core.renderers import FastJSONRenderer
+
+        payload = self.payload()
+
+        assert FastJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+    def test_render_falls_back_for_indent_and_int_keys(self):
+        """Test that unsupported options use the stdlib renderer."""
+        from rest_framework.renderers import JSONRenderer
+        from core.renderers import FastJSONRenderer
+
+        indented = FastJSONRenderer().render({'a': 1}, 'application/json; indent=2')
+        assert indented == JSONRenderer().render({'a': 1}, 'application/json; indent=2')
+        assert FastJSONRenderer().render({1: 'one'}) == b'{"1":"one"}'
+
+    def test_parse_matches_stdlib(self):
+        """Test that parsing matches JSONParser, including huge integers and errors."""
+        import io
+        from rest_framework.exceptions import ParseError
+        from rest_framework.parsers import JSONParser
+        from core.renderers import FastJSONParser
+
+        for body in (b'{"title": "\\u00d1and\\u00fa", "n": [1, 2.5]}', b'{"big": 123456789012345678901234567890}'):
+            assert FastJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(io.BytesIO(body))
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"n": NaN}'))
+
+    @pytest.mark.django_db
+    def test_api_response_matches_stdlib(self, api_client, sample_project):
+        """Test that API responses are rendered byte-identically."""
+        from rest_framework.renderers import JSONRenderer
+
+        response = api_client.get(f'/api/projects/{sample_project.id}/')
+
+        assert response.content == JSONRenderer().render(response.data)
+
+    @pytest.mark.django_db
+    def test_api_accepts_json_body(self, api_client):
+        """Test that JSON writes are parsed by the fast parser."""
+        response = api_client.post(
+            '/api/projects/', {'title': 'Ñandú', 'description': 'Fast'}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Project.objects.get().title == 'Ñandú'
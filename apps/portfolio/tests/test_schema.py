@@ -0,0 +1,147 @@
+"""
+Tests for the pre-built OpenAPI schema and documentation pages.
+Pruebas del esquema OpenAPI pre-generado y de las páginas de documentación.
+"""
+
+import gzip
+import json
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+import yaml
+from django.core.management import call_command
+from core import schema
+
+
+@pytest.fixture(autouse=True)
+def schema_root(settings, tmp_path):
+    """Build the artifacts in a temporary directory, once per test."""
+    settings.SCHEMA_ROOT = str(tmp_path)
+    schema.reset()
+    yield tmp_path
+    schema.reset()
+
+
+@pytest.mark.django_db
+class TestBuildSchema:
+    """Test suite for the build_schema command."""
+
+    def test_writes_compact_json_yaml_and_gzip(self, schema_root):
+        """Test that every artifact is written and matches the live schema."""
+        call_command('build_schema', stdout=StringIO())
+
+        body = (schema_root / 'schema.json').read_bytes()
+        assert b'\n' not in body
+        data = json.loads(body)
+        assert data['info']['title'] == 'Portfolio API'
+        assert '/api/projects/' in data['paths']
+        assert yaml.safe_load((schema_root / 'schema.yaml').read_bytes()) == data
+        assert gzip.decompress((schema_root / 'schema.json.gz').read_bytes()) == body
+
+    def test_skips_when_code_is_unchanged(self, schema_root):
+        """Test that a second build reuses the artifacts until the fingerprint changes."""
+        call_command('build_schema', stdout=StringIO())
+        output = StringIO()
+        with patch('core.schema.generate') as generate:
+            call_command('build_schema', stdout=output)
+        assert not generate.called
+        assert 'up to date' in output.getvalue()
+
+        with patch('core.schema.fingerprint', return_value='changed'):
+            manifest, built = schema.build()
+        assert built and manifest['fingerprint'] == 'changed'
+
+
+@pytest.mark.django_db
+class TestPrebuiltSchemaView:
+    """Test suite for the schema and docs routes."""
+
+    def test_schema_is_generated_once_per_process(self, client):
+        """Test that repeated requests never run drf-spectacular again."""
+        client.get('/api/schema/')
+        with patch('core.schema.generate') as generate:
+            response = client.get('/api/schema/')
+        assert response.status_code == 200
+        assert not generate.called
+
+    def test_yaml_by_default_json_on_request(self, client, schema_root):
+        """Test that content negotiation picks the artifact."""
+        response = client.get('/api/schema/')
+        assert response['Content-Type'].startswith('application/vnd.oai.openapi')
+        assert response.content == (schema_root / 'schema.yaml').read_bytes()
+
+        response = client.get('/api/schema/?format=json')
+        assert response['Content-Type'].startswith('application/vnd.oai.openapi+json')
+        assert response.content == (schema_root / 'schema.json').read_bytes()
+
+    def test_etag_revalidation(self, client):
+        """Test that a matching If-None-Match gets an empty 304."""
+        etag = client.get('/api/schema/')['ETag']
+
+        response = client.get('/api/schema/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+        assert not response.content
+
+    def test_precompressed_body(self, client, schema_root):
+        """Test that gzip clients get the precompressed file under its own ETag."""
+        plain = client.get('/api/schema/?format=json')
+        response = client.get('/api/schema/?format=json', HTTP_ACCEPT_ENCODING='gzip, br')
+
+        assert response['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.content) == plain.content
+        assert response['ETag'] != plain['ETag']
+        assert 'Accept-Encoding' in response['Vary']
+
+    def test_lang_parameter_uses_live_generation(self, client):
+        """Test that parametrized requests bypass the artifacts."""
+        with patch('core.schema.get_artifacts') as get_artifacts:
+            response = client.get('/api/schema/?lang=en')
+        assert response.status_code == 200
+        assert not get_artifacts.called
+
+    @pytest.mark.parametrize('url', ['/', '/api/docs/'])
+    def test_docs_pages_revalidate(self, client, url):
+        """Test that ReDoc and Swagger UI answer 304 while the schema is unchanged."""
+        response = client.get(url)
+        assert response.status_code == 200
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == 304
+
+    def test_charset_matches_live_view(self, client):
+        """Test that the YAML artifact keeps the charset the live view sent."""
+        assert client.get('/api/schema/')['Content-Type'] == 'application/vnd.oai.openapi; charset=utf-8'
+
+    @pytest.mark.parametrize('header, compressed', [
+        ('gzip;q=0', False),
+        ('br, gzip;q=0.0', False),
+        ('gzip;q=0.5', True),
+        ('*', True),
+        ('*;q=0', False),
+        ('identity', False),
+    ])
+    def test_accept_encoding_quality_values(self, client, header, compressed):
+        """Test that a q=0 refusal of gzip is honored."""
+        response = client.get('/api/schema/?format=json', HTTP_ACCEPT_ENCODING=header)
+        assert (response.get('Content-Encoding') == 'gzip') is compressed
+
+    def test_unwritable_root_falls_back_to_live_generation(self, client):
+        """Test that an OSError while building the artifacts is not a 500."""
+        with patch('core.schema.build', side_effect=PermissionError('read-only')) as build:
+            assert client.get('/api/schema/').status_code == 200
+            assert client.get('/').status_code == 200
+        assert build.call_count == 1
+
+    def test_schema_routes_are_not_documented(self):
+        """Test that the schema and docs views stay out of the schema itself."""
+        paths = json.loads(schema.generate()['json'])['paths']
+        assert not {'/', '/api/docs/', '/api/schema/'} & set(paths)
+
+    def test_mixin_query_parameters_are_documented(self):
+        """Test that fields/omit, stream and cursor appear on the list operations."""
+        operation = json.loads(schema.generate()['json'])['paths']['/api/projects/']['get']
+        names = {parameter['name'] for parameter in operation['parameters']}
+        assert {'fields', 'omit', 'stream', 'cursor', 'search', 'ordering'} <= names
@@ -0,0 +1,220 @@
+"""
+Tests for the static JSON export and its fallback middleware.
+"""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.about.models import AboutMe
+from apps.contact.models import ContactMessage
+from apps.projects.models import Project
+from apps.skills.models import Skill, SkillCategory
+
+
+@pytest.fixture
+def api_client():
+    """Fixture for API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def export_root(settings, tmp_path):
+    """Export into a temporary directory with the test host as base URL."""
+    settings.STATIC_API_ROOT = str(tmp_path)
+    settings.STATIC_API_BASE_URL = 'http://testserver'
+    return tmp_path
+
+
+@pytest.fixture
+def content(db):
+    """Fixture with twelve projects (two pages), a skill, a profile and a message."""
+    for index in range(12):
+        Project.objects.create(title=f'Project {index}', description='Desc', is_featured=index == 0, order=index)
+    Skill.objects.create(name='Python', category=SkillCategory.objects.create(name='Backend'))
+    AboutMe.objects.create(name='John Doe', title='Engineer', bio='Bio', email='john@example.com')
+    ContactMessage.objects.create(name='Jane', email='jane@example.com', subject='Hi', message='Hello')
+
+
+@pytest.mark.django_db
+class TestExportStaticApi:
+    """Test suite for the export_static_api command."""
+
+    def test_export_matches_api_responses(self, api_client, export_root, content):
+        """Test that every exported file equals the live response body."""
+        call_command('export_static_api', stdout=StringIO())
+
+        project = Project.objects.first()
+        for url, relative in [
+            ('/api/projects/', 'api/projects/index.json'),
+            ('/api/projects/?page=2', 'api/projects/page-2.json'),
+            (f'/api/projects/{project.pk}/', f'api/projects/{project.pk}/index.json'),
+            ('/api/projects/featured/', 'api/projects/featured/index.json'),
+            ('/api/skills/by_category/', 'api/skills/by_category/index.json'),
+            ('/api/about/active/', 'api/about/active/index.json'),
+            ('/api/portfolio/', 'api/portfolio/index.json'),
+        ]:
+            assert (export_root / relative).read_bytes() == api_client.get(url).content, url
+
+    def test_private_endpoints_are_not_exported(self, export_root, content):
+        """Test that contact messages never reach the static files."""
+        call_command('export_static_api', stdout=StringIO())
+
+        assert not (export_root / 'api' / 'contact').exists()
+
+    def test_group_export_removes_stale_files(self, export_root, content):
+        """Test that deleted rows and vanished pages lose their files."""
+        call_command('export_static_api', 'projects', stdout=StringIO())
+        last = Project.objects.order_by('-pk').first()
+        assert (export_root / 'api/projects/page-2.json').exists()
+
+        Project.objects.filter(pk__gte=last.pk - 2).delete()
+        call_command('export_static_api', 'projects', stdout=StringIO())
+
+        assert not (export_root / 'api/projects/page-2.json').exists()
+        assert not (export_root / f'api/projects/{last.pk}/index.json').exists()
+        assert (export_root / 'api/projects/featured/index.json').exists()
+
+    def test_unknown_group(self, export_root):
+        """Test that a typo in a group name is an error."""
+        from django.core.management.base import CommandError
+
+        with pytest.raises(CommandError):
+            call_command('export_static_api', 'projcts', stdout=StringIO())
+
+    def test_save_triggers_incremental_export(self, settings, export_root, django_capture_on_commit_callbacks):
+        """Test that a committed save re-exports the affected groups only."""
+        settings.STATIC_API_EXPORT_ON_SAVE = True
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Project.objects.create(title='Fresh', description='Desc')
+            Project.objects.create(title='Second', description='Desc')
+
+        payload = json.loads((export_root / 'api/projects/index.json').read_text())
+        assert {project['title'] for project in payload['results']} == {'Fresh', 'Second'}
+        assert (export_root / 'api/portfolio/index.json').exists()
+        assert not (export_root / 'api/skills').exists()
+
+    def test_save_renders_only_the_changed_detail(self, settings, export_root, content, django_capture_on_commit_callbacks):
+        """Test that a save leaves the detail files of other rows alone."""
+        call_command('export_static_api', stdout=StringIO())
+        settings.STATIC_API_EXPORT_ON_SAVE = True
+        changed, other = Project.objects.order_by('pk')[:2]
+        sentinel = export_root / f'api/projects/{other.pk}/index.json'
+        sentinel.write_text('untouched')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            changed.title = 'Renamed'
+            changed.save()
+
+        detail = json.loads((export_root / f'api/projects/{changed.pk}/index.json').read_text())
+        assert detail['title'] == 'Renamed'
+        assert sentinel.read_text() == 'untouched'
+        assert 'Renamed' in (export_root / 'api/portfolio/index.json').read_text()
+
+    def test_delete_removes_the_detail_file(self, settings, export_root, content, django_capture_on_commit_callbacks):
+        """Test that deleting a row removes its file and the page it emptied."""
+        call_command('export_static_api', 'projects', stdout=StringIO())
+        settings.STATIC_API_EXPORT_ON_SAVE = True
+        last = Project.objects.order_by('-pk').first()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Project.objects.filter(pk__gte=last.pk - 1).delete()
+
+        assert not (export_root / f'api/projects/{last.pk}/index.json').exists()
+        assert not (export_root / 'api/projects/page-2.json').exists()
+
+    def test_category_change_refreshes_its_skills(self, settings, export_root, content, django_capture_on_commit_callbacks):
+        """Test that renaming a category re-renders the skills that embed it."""
+        call_command('export_static_api', stdout=StringIO())
+        settings.STATIC_API_EXPORT_ON_SAVE = True
+        skill = Skill.objects.get()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            skill.category.name = 'Server'
+            skill.category.save()
+
+        detail = json.loads((export_root / f'api/skills/{skill.pk}/index.json').read_text())
+        assert 'Server' in json.dumps(detail)
+
+    def test_save_queues_one_job_without_jobs_sync(self, settings, export_root, django_capture_on_commit_callbacks):
+        """Test that the export runs in the worker, merged into one job per transaction."""
+        from core.models import Job
+
+        settings.STATIC_API_EXPORT_ON_SAVE = True
+        settings.JOBS_SYNC = False
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first = Project.objects.create(title='Fresh', description='Desc')
+            second = Project.objects.create(title='Second', description='Desc')
+
+        job = Job.objects.get(task='static_api.export')
+        assert job.payload == {'changes': {'projects': [first.pk, second.pk], 'portfolio': []}}
+        assert not (export_root / 'api').exists()
+
+        call_command('run_worker', '--burst', stdout=StringIO())
+        assert (export_root / f'api/projects/{second.pk}/index.json').exists()
+
+
+@pytest.mark.django_db
+class TestStaticAPIFallbackMiddleware:
+    """Test suite for serving exported files before DRF."""
+
+    @pytest.fixture(autouse=True)
+    def fallback(self, settings, export_root, content):
+        settings.STATIC_API_FALLBACK = True
+        call_command('export_static_api', stdout=StringIO())
+        # Mark the file so tests can tell it apart from a live response.
+        (export_root / 'api/projects/index.json').write_bytes(b'{"static":true}')
+
+    def test_serves_exported_file_without_queries(self, api_client, django_assert_num_queries):
+        """Test that exported paths never reach the database."""
+        with django_assert_num_queries(0):
+            response = api_client.get('/api/projects/')
+
+        assert b''.join(response.streaming_content) == b'{"static":true}'
+        assert response['Content-Type'] == 'application/json'
+        assert response['Cache-Control'] == 'public, max-age=60'
+
+    def test_serves_pages(self, api_client, export_root):
+        """Test that ?page= maps to the page file."""
+        response = api_client.get('/api/projects/?page=2')
+
+        assert b''.join(response.streaming_content) == (export_root / 'api/projects/page-2.json').read_bytes()
+
+    def test_etag_not_modified(self, api_client):
+        """Test that a matching If-None-Match gets a 304."""
+        etag = api_client.get('/api/projects/')['ETag']
+
+        response = api_client.get('/api/projects/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.parametrize('url', [
+        '/api/projects/?search=project',
+        '/api/projects/?page=abc',
+        '/api/contact/',
+        '/api/projects/999999/',
+    ])
+    def test_falls_through_to_drf(self, api_client, url):
+        """Test that other queries, private and missing paths reach the view."""
+        response = api_client.get(url)
+
+        assert not getattr(response, 'streaming', False)
+
+    def test_browsable_api_falls_through(self, rf):
+        """Test that HTML requests keep the browsable API."""
+        from apps.portfolio.middleware import StaticAPIFallbackMiddleware
+
+        middleware = StaticAPIFallbackMiddleware(lambda request: 'live')
+
+        assert middleware(rf.get('/api/projects/', HTTP_ACCEPT='text/html')) == 'live'
+
+    def test_writes_fall_through(self, api_client):
+        """Test that unsafe methods are never answered from files."""
+        response = api_client.post('/api/projects/', {'title': 'New', 'description': 'Desc'}, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
@@ -0,0 +1,83 @@
+"""
+Tests for the Server-Timing middleware.
+Pruebas del middleware Server-Timing.
+"""
+
+import json
+
+import pytest
+from apps.projects.models import Project
+
+
+@pytest.fixture
+def sample_project():
+    """Fixture for creating a sample project."""
+    return Project.objects.create(title='Sample Project', description='Sample description')
+
+
+@pytest.mark.django_db
+class TestServerTiming:
+    """Test suite for the Server-Timing middleware."""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self, settings):
+        settings.SERVER_TIMING_ENABLED = True
+        settings.SERVER_TIMING_SAMPLE_RATE = 1.0
+        settings.SERVER_TIMING_LOG_THRESHOLD_MS = 0
+
+    def test_header_reports_queries_and_phases(self, api_client, sample_project):
+        """Test that every phase is reported and queries are counted."""
+        import re
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get('/api/projects/')
+
+        header = response['Server-Timing']
+        assert f'desc="{len(context.captured_queries)} queries"' in header
+        names = re.findall(r'(\w+);dur=[\d.]+', header)
+        assert names == ['db', 'serialize', 'render', 'total']
+
+    def test_structured_log_line(self, api_client, sample_project, caplog):
+        """Test that the log line carries the same measurements as JSON."""
+        with caplog.at_level('INFO', logger='core.timing'):
+            api_client.get(f'/api/projects/{sample_project.id}/')
+
+        record = json.loads(caplog.records[-1].getMessage().split(' ', 2)[2])
+        assert record['path'] == f'/api/projects/{sample_project.id}/'
+        assert record['status'] == 200
+        assert record['db_queries'] >= 1
+        assert record['serialize_ms'] >= 0 and record['total_ms'] >= record['db_ms']
+
+    def test_threshold_skips_fast_requests(self, settings, api_client, caplog):
+        """Test that only slow requests are logged."""
+        settings.SERVER_TIMING_LOG_THRESHOLD_MS = 60_000
+
+        with caplog.at_level('INFO', logger='core.timing'):
+            response = api_client.get('/api/projects/')
+
+        assert 'Server-Timing' in response
+        assert not caplog.records
+
+    def test_header_off_keeps_the_log_line(self, settings, api_client, caplog):
+        """Test that production's header-less mode still logs the timings."""
+        settings.SERVER_TIMING_HEADER = False
+
+        with caplog.at_level('INFO', logger='core.timing'):
+            response = api_client.get('/api/projects/')
+
+        assert 'Server-Timing' not in response
+        assert caplog.records
+
+    def test_unsampled_requests_are_untouched(self, settings, api_client):
+        """Test that requests outside the sample get no header."""
+        settings.SERVER_TIMING_SAMPLE_RATE = 0
+
+        assert 'Server-Timing' not in api_client.get('/api/projects/')
+
+    def test_disabled_by_default(self, settings, api_client):
+        """Test that the middleware unloads itself when disabled."""
+        settings.SERVER_TIMING_ENABLED = False
+
+        assert 'Server-Timing' not in api_client.get('/api/projects/')
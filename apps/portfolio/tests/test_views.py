@@ -0,0 +1,129 @@
+"""
+Tests for the portfolio bundle API view.
+"""
+
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.about.models import AboutMe
+from apps.projects.models import Project
+from apps.skills.models import Skill, SkillCategory
+
+URL = '/api/portfolio/'
+
+
+@pytest.fixture
+def api_client():
+    """Fixture for API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def portfolio():
+    """Fixture with a profile, two projects and a skill category."""
+    about = AboutMe.objects.create(name='John Doe', title='Engineer', bio='Bio', email='john@example.com')
+    featured = Project.objects.create(title='Featured', description='Desc', is_featured=True, order=0)
+    regular = Project.objects.create(title='Regular', description='Desc', order=1)
+    category = SkillCategory.objects.create(name='Backend', order=1)
+    skill = Skill.objects.create(name='Python', category=category)
+    return {'about': about, 'featured': featured, 'regular': regular, 'category': category, 'skill': skill}
+
+
+def get_payload(response):
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'] == 'application/json'
+    return json.loads(response.content)
+
+
+@pytest.mark.django_db
+class TestPortfolioBundle:
+    """Test suite for the aggregated /api/portfolio/ endpoint."""
+
+    def test_bundle_matches_individual_endpoints(self, api_client, portfolio):
+        """Test that each section equals the endpoint it replaces."""
+        payload = get_payload(api_client.get(URL))
+
+        assert payload['about'] == json.loads(api_client.get('/api/about/active/').content)
+        assert payload['featuredProjects'] == json.loads(api_client.get('/api/projects/featured/').content)
+        assert payload['skillsByCategory'] == json.loads(api_client.get('/api/skills/by_category/').content)
+        assert payload['projects'] == json.loads(api_client.get('/api/projects/').content)['results']
+
+    def test_bundle_without_profile(self, api_client):
+        """Test that an empty database returns empty sections."""
+        payload = get_payload(api_client.get(URL))
+
+        assert payload == {'about': None, 'featuredProjects': [], 'projects': [], 'skillsByCategory': []}
+
+    def test_cold_bundle_query_count_is_constant(self, api_client, portfolio):
+        """Test that building the bundle costs four queries regardless of rows."""
+        with CaptureQueriesContext(connection) as context:
+            api_client.get(URL)
+        assert len(context.captured_queries) == 4
+
+        for index in range(5):
+            Project.objects.create(title=f'Extra {index}', description='Desc', is_featured=bool(index % 2))
+            Skill.objects.create(name=f'Skill {index}', category=SkillCategory.objects.create(name=f'Cat {index}'))
+        with CaptureQueriesContext(connection) as context:
+            api_client.get(URL)
+        assert len(context.captured_queries) == 4
+
+    def test_warm_bundle_uses_no_queries(self, api_client, portfolio, django_assert_num_queries):
+        """Test that a cached bundle is served without touching the database."""
+        first = api_client.get(URL)
+
+        with django_assert_num_queries(0):
+            second = api_client.get(URL)
+
+        assert second.content == first.content
+
+    @pytest.mark.parametrize('change', ['project', 'skill', 'category', 'about', 'delete'])
+    def test_any_model_change_invalidates(self, api_client, portfolio, change):
+        """Test that edits to any bundled model rebuild the bundle."""
+        before = api_client.get(URL).content
+
+        if change == 'project':
+            portfolio['regular'].title = 'Renamed'
+            portfolio['regular'].save()
+        elif change == 'skill':
+            portfolio['skill'].name = 'Renamed'
+            portfolio['skill'].save()
+        elif change == 'category':
+            portfolio['category'].name = 'Renamed'
+            portfolio['category'].save()
+        elif change == 'about':
+            portfolio['about'].name = 'Renamed'
+            portfolio['about'].save()
+        else:
+            portfolio['featured'].delete()
+
+        assert api_client.get(URL).content != before
+
+    def test_etag_not_modified(self, api_client, portfolio, django_assert_num_queries):
+        """Test that a matching If-None-Match gets a 304 without reading the cache body."""
+        etag = api_client.get(URL)['ETag']
+
+        with django_assert_num_queries(0):
+            response = api_client.get(URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        portfolio['about'].save()
+        assert api_client.get(URL, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_sparse_fields_do_not_leak_into_bundle(self, api_client, portfolio):
+        """Test that ?fields= is ignored so the shared blob stays complete."""
+        payload = get_payload(api_client.get(URL + '?fields=id'))
+
+        assert 'description' in payload['projects'][0]
+
+    def test_image_variants_invalidate(self, api_client, portfolio):
+        """Test that background image updates, which skip post_save, rebuild the bundle."""
+        from core.images import variants_generated
+
+        etag = api_client.get(URL)['ETag']
+        variants_generated.send(sender=Project, instance=portfolio['featured'], field='image')
+
+        assert api_client.get(URL)['ETag'] != etag
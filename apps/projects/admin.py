@@ -4,7 +4,16 @@ Configuración de admin para la app projects.
 """
 
 from django.contrib import admin
-from .models import Project
+from .models import Project, Technology
+
+
+@admin.register(Technology)
+class TechnologyAdmin(admin.ModelAdmin):
+    """Admin configuration for Technology model."""
+
+    list_display = ["name", "normalized_name", "created_at"]
+    search_fields = ["name"]
+    ordering = ["name"]
 
 
 @admin.register(Project)
@@ -12,7 +21,7 @@ class ProjectAdmin(admin.ModelAdmin):
     """Admin configuration for Project model."""
 
     list_display = ["title", "is_featured", "order", "created_at"]
-    list_filter = ["is_featured", "created_at"]
+    list_filter = ["is_featured", "tech_stack", "created_at"]
     search_fields = ["title", "description", "technologies"]
     list_editable = ["is_featured", "order"]
     ordering = ["order", "-created_at"]
@@ -0,0 +1,39 @@
+"""
+Filter backends for the projects app.
+Backends de filtrado para la app projects.
+"""
+
+from rest_framework import filters
+from apps.projects.models import Technology
+
+
+class TechnologyFilter(filters.BaseFilterBackend):
+    """
+    Filter projects by technology using the indexed Technology table.
+    Filtra proyectos por tecnología usando la tabla indexada Technology.
+
+    ``?technology=django`` matches case-insensitively; repeating the parameter
+    (``?technology=django&technology=react``) requires every technology.
+    """
+
+    technology_param = 'technology'
+
+    def get_technologies(self, request):
+        names = request.query_params.getlist(self.technology_param)
+        return [Technology.normalize(name) for name in names if name.strip()]
+
+    def filter_queryset(self, request, queryset, view):
+        for normalized_name in self.get_technologies(request):
+            queryset = queryset.filter(tech_stack__normalized_name=normalized_name)
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.technology_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Filter by technology name (repeatable) / Filtrar por nombre de tecnología (repetible)',
+                'schema': {'type': 'string'},
+            },
+        ]
@@ -4,10 +4,13 @@ Serializadores para la app projects.
 """
 
 from rest_framework import serializers
+from core import images
+from core.sparse import SparseFieldsetSerializerMixin
+from core.timing import TimedSerializerMixin
 from apps.projects.models import Project
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for Project model with camelCase field names.
     Serializador para el modelo Project con nombres de campos en camelCase.
@@ -15,6 +18,9 @@ class ProjectSerializer(serializers.ModelSerializer):
 
     shortDescription = serializers.CharField(source='short_description', required=False, allow_blank=True)
     imageUrl = serializers.ImageField(source='image', required=False, allow_null=True)
+    imageWidth = serializers.IntegerField(source='image_width', read_only=True)
+    imageHeight = serializers.IntegerField(source='image_height', read_only=True)
+    imageSrcset = serializers.SerializerMethodField()
     githubUrl = serializers.URLField(source='github_url', required=False, allow_blank=True)
     isFeatured = serializers.BooleanField(source='is_featured', default=False)
     createdAt = serializers.DateTimeField(source='created_at', read_only=True)
@@ -28,6 +34,9 @@ class ProjectSerializer(serializers.ModelSerializer):
             'description',
             'shortDescription',
             'imageUrl',
+            'imageWidth',
+            'imageHeight',
+            'imageSrcset',
             'url',
             'githubUrl',
             'technologies',
@@ -37,3 +46,12 @@ class ProjectSerializer(serializers.ModelSerializer):
             'updatedAt',
         ]
         read_only_fields = ['id', 'createdAt', 'updatedAt']
+        sparse_field_sources = {'imageSrcset': ['image', 'image_variants']}
+
+    def get_imageSrcset(self, obj) -> dict:
+        """
+        Return the srcset strings of the resized copies, keyed by format.
+        Retorna las cadenas srcset de las copias redimensionadas, por formato.
+        """
+        request = self.context.get('request')
+        return images.srcset(obj.image, obj.image_variants, request.build_absolute_uri if request else None)
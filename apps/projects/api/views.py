@@ -8,7 +8,14 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
+from core.async_views import AsyncReadMixin
+from core.cache import CachedResponseMixin
+from core.conditional import ConditionalGetMixin
+from core.sparse import SparseFieldsetViewMixin
+from core.search import FullTextSearchFilter
+from core.streaming import StreamingListMixin
 from apps.projects.models import Project
+from .filters import TechnologyFilter
 from .serializers import ProjectSerializer
 
 
@@ -44,7 +51,7 @@ from .serializers import ProjectSerializer
         tags=["Projects"],
     ),
 )
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(AsyncReadMixin, CachedResponseMixin, ConditionalGetMixin, SparseFieldsetViewMixin, StreamingListMixin, viewsets.ModelViewSet):
     """
     ViewSet for viewing and editing Project instances.
     Provides CRUD operations and filtering for portfolio projects.
@@ -54,12 +61,21 @@ class ProjectViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Project.objects.all()
+    cache_models = [Project]
+    cache_actions = ['list', 'retrieve', 'featured']
+    local_cache_actions = ['featured']
     serializer_class = ProjectSerializer
-    filter_backends = [filters.OrderingFilter, filters.SearchFilter]
+    filter_backends = [filters.OrderingFilter, FullTextSearchFilter, TechnologyFilter]
     search_fields = ['title', 'description', 'technologies']
     ordering_fields = ['order', 'created_at', 'title']
     ordering = ['order', '-created_at']
 
+    def get_conditional_querysets(self):
+        """Validate the featured action against featured rows only."""
+        if self.action == 'featured':
+            return [self.queryset.filter(is_featured=True)]
+        return super().get_conditional_querysets()
+
     @extend_schema(
         summary="Get featured projects / Obtener proyectos destacados",
         description="Retrieve only projects marked as featured. / Obtiene solo los proyectos marcados como destacados.",
@@ -72,6 +88,11 @@ class ProjectViewSet(viewsets.ModelViewSet):
         Get featured projects only.
         Obtener solo proyectos destacados.
         """
-        featured_projects = self.queryset.filter(is_featured=True)
+        featured_projects = self.get_queryset().filter(is_featured=True)
         serializer = self.get_serializer(featured_projects, many=True)
         return Response(serializer.data)
+
+    async def afeatured(self, request):
+        """Async variant of ``featured`` (ASYNC_VIEWS)."""
+        featured_projects = [project async for project in self.get_queryset().filter(is_featured=True)]
+        return Response(self.get_serializer(featured_projects, many=True).data)
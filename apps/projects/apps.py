@@ -11,3 +11,14 @@ class ProjectsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.projects"
     verbose_name = "Projects"
+
+    def ready(self):
+        """Register projects for versioned caching, full-text search, image variants and query budgets."""
+        from core import budgets, cache, images, search
+        from .api.views import ProjectViewSet
+        from .models import Project
+
+        cache.register(Project)
+        search.register(Project, ["title", "technologies", "description"])
+        images.register(Project, "image")
+        budgets.register(ProjectViewSet, list=3, retrieve=2, featured=2)
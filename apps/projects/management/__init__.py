@@ -0,0 +1,4 @@
+"""
+Management package for projects app.
+Paquete de gestión para la app projects.
+"""
@@ -0,0 +1,4 @@
+"""
+Management commands for projects app.
+Comandos de gestión para la app projects.
+"""
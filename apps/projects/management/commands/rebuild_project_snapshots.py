@@ -0,0 +1,48 @@
+"""
+Rebuild the pre-encoded JSON snapshot of every project.
+Reconstruye el snapshot JSON pre-codificado de cada proyecto.
+
+Run after bulk imports, after changing MEDIA_URL or after changing
+Project.to_dict().
+Ejecutar tras importaciones masivas, al cambiar MEDIA_URL o Project.to_dict().
+"""
+
+from django.core.management.base import BaseCommand
+from apps.projects.models import Project
+
+
+class Command(BaseCommand):
+    """Rebuild Project.snapshot for all (or only missing) projects."""
+
+    help = "Rebuild the pre-encoded JSON snapshot of every project."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only rebuild projects that have no snapshot yet.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of projects written per UPDATE batch.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Project.objects.all()
+        if options["missing_only"]:
+            queryset = queryset.filter(snapshot="")
+
+        batch = []
+        rebuilt = 0
+        for project in queryset.iterator(chunk_size=options["batch_size"]):
+            project.snapshot = project.encode_snapshot()
+            batch.append(project)
+            if len(batch) >= options["batch_size"]:
+                rebuilt += Project.objects.bulk_update(batch, ["snapshot"])
+                batch = []
+        if batch:
+            rebuilt += Project.objects.bulk_update(batch, ["snapshot"])
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} project snapshot(s)."))
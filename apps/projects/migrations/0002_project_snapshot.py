@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='snapshot',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Pre-encoded to_dict() output, refreshed on save', verbose_name='JSON Snapshot'),
+        ),
+    ]
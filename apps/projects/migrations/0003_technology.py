@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_project_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Technology name as displayed', max_length=500, verbose_name='Name')),
+                ('normalized_name', models.CharField(editable=False, help_text='Lowercase name used for lookups', max_length=500, unique=True, verbose_name='Normalized Name')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'Technology',
+                'verbose_name_plural': 'Technologies',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tech_stack',
+            field=models.ManyToManyField(blank=True, help_text='Normalized technologies, synced from the technologies field', related_name='projects', to='projects.technology', verbose_name='Technology Stack'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:18
+
+from django.db import migrations
+
+
+def populate_technologies(apps, schema_editor):
+    """Create Technology rows from the comma-separated field and link them."""
+    Project = apps.get_model("projects", "Project")
+    Technology = apps.get_model("projects", "Technology")
+
+    for project in Project.objects.exclude(technologies=""):
+        names = {}
+        for name in project.technologies.split(","):
+            name = name.strip()
+            if name:
+                names.setdefault(name.lower(), name)
+        technologies = []
+        for normalized_name, name in names.items():
+            technology, _created = Technology.objects.get_or_create(
+                normalized_name=normalized_name,
+                defaults={"name": name},
+            )
+            technologies.append(technology)
+        project.tech_stack.set(technologies)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_technology'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_technologies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_populate_technologies'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['order', '-created_at', 'id'], name='project_order_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['order', '-created_at', 'id'], name='project_featured_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:34
+
+from django.db import migrations, models
+
+
+def clear_snapshots(apps, schema_editor):
+    """Drop snapshots encoded without the image keys; they are re-encoded on read."""
+    apps.get_model('projects', 'Project').objects.update(snapshot='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image Height'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized WebP/JPEG copies, generated in the background', verbose_name='Image Variants'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image Width'),
+        ),
+        migrations.RunPython(clear_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from core.search import CreateSearchTable
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_image_variants'),
+    ]
+
+    operations = [
+        CreateSearchTable('project', ['title', 'technologies', 'description']),
+    ]
@@ -3,9 +3,58 @@ Projects app models.
 Modelos de la app projects.
 """
 
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from core import cache, images
+
+
+class Technology(models.Model):
+    """
+    Model representing a technology used in projects.
+    Modelo que representa una tecnología usada en proyectos.
+    """
+
+    # As long as Project.technologies, so a single entry always fits.
+    # Tan largo como Project.technologies, así una sola entrada siempre cabe.
+    name = models.CharField(max_length=500, verbose_name=_("Name"), help_text=_("Technology name as displayed"))
+    normalized_name = models.CharField(max_length=500, unique=True, editable=False, verbose_name=_("Normalized Name"), help_text=_("Lowercase name used for lookups"))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created At"))
+
+    class Meta:
+        verbose_name = _("Technology")
+        verbose_name_plural = _("Technologies")
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        """Keep the normalized lookup name in sync with the display name."""
+        self.normalized_name = self.normalize(self.name)
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def normalize(name):
+        """Return the lookup form of a technology name."""
+        return name.strip().lower()
+
+    @staticmethod
+    def parse(technologies):
+        """
+        Split a comma-separated technologies string into display names.
+        Divide una cadena de tecnologías separadas por comas en nombres.
+        """
+        names = {}
+        for name in (technologies or "").split(","):
+            name = name.strip()
+            if name:
+                names.setdefault(Technology.normalize(name), name)
+        return names
+
 
 class Project(models.Model):
     """
@@ -17,23 +66,85 @@ class Project(models.Model):
     description = models.TextField(verbose_name=_("Description"), help_text=_("Detailed project description"))
     short_description = models.CharField(max_length=300, verbose_name=_("Short Description"), help_text=_("Brief project summary"), blank=True)
     image = models.ImageField(upload_to="projects/", verbose_name=_("Image"), help_text=_("Project image or screenshot"), blank=True, null=True)
+    image_width = models.PositiveIntegerField(editable=False, blank=True, null=True, verbose_name=_("Image Width"))
+    image_height = models.PositiveIntegerField(editable=False, blank=True, null=True, verbose_name=_("Image Height"))
+    image_variants = models.JSONField(editable=False, blank=True, default=dict, verbose_name=_("Image Variants"), help_text=_("Resized WebP/JPEG copies, generated in the background"))
     url = models.URLField(verbose_name=_("Project URL"), help_text=_("Live project URL"), blank=True)
     github_url = models.URLField(verbose_name=_("GitHub URL"), help_text=_("GitHub repository URL"), blank=True)
     technologies = models.CharField(max_length=500, verbose_name=_("Technologies"), help_text=_("Technologies used (comma-separated)"), blank=True)
+    tech_stack = models.ManyToManyField(Technology, related_name="projects", blank=True, verbose_name=_("Technology Stack"), help_text=_("Normalized technologies, synced from the technologies field"))
     is_featured = models.BooleanField(default=False, verbose_name=_("Featured"), help_text=_("Display in featured section"))
     order = models.IntegerField(default=0, verbose_name=_("Order"), help_text=_("Display order (lower numbers first)"))
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created At"))
 
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Updated At"))
+    snapshot = models.TextField(editable=False, blank=True, default="", verbose_name=_("JSON Snapshot"), help_text=_("Pre-encoded to_dict() output, refreshed on save"))
 
     class Meta:
         verbose_name = _("Project")
         verbose_name_plural = _("Projects")
         ordering = ["order", "-created_at"]
+        indexes = [
+            # Default list ordering and the (order, -created_at, id) keyset.
+            models.Index(fields=["order", "-created_at", "id"], name="project_order_created_idx"),
+            # Only featured rows, for the featured action.
+            models.Index(fields=["order", "-created_at", "id"], condition=models.Q(is_featured=True), name="project_featured_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        """Save the project, sync its technology stack, refresh its JSON snapshot and queue image variants."""
+        if not self.image:
+            images.reset_variants(self, "image")
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "technologies" in update_fields:
+            self.sync_tech_stack()
+        self.refresh_snapshot()
+        if images.needs_variants(self, "image"):
+            images.queue_variants(self, "image")
+
+    def sync_tech_stack(self):
+        """
+        Mirror the comma-separated technologies field into the tech_stack relation.
+        Refleja el campo technologies separado por comas en la relación tech_stack.
+        """
+        names = Technology.parse(self.technologies)
+        Technology.objects.bulk_create(
+            [Technology(name=name, normalized_name=key) for key, name in names.items()],
+            ignore_conflicts=True,
+        )
+        self.tech_stack.set(Technology.objects.filter(normalized_name__in=names))
+
+    def refresh_snapshot(self):
+        """
+        Re-encode to_dict() and store it in the snapshot column.
+        Re-codifica to_dict() y lo guarda en la columna snapshot.
+
+        Uses a queryset update so no save signals fire twice, then bumps the
+        cache version itself: the post_save bump ran before this write, and in
+        autocommit a reader in between could cache the old snapshot under it.
+        """
+        self.snapshot = self.encode_snapshot()
+        Project.objects.filter(pk=self.pk).update(snapshot=self.snapshot)
+        cache.bump_model_version(Project)
+
+    def encode_snapshot(self):
+        """
+        Encode to_dict() exactly like JsonResponse does.
+        Codifica to_dict() igual que JsonResponse.
+        """
+        return json.dumps(self.to_dict(), cls=DjangoJSONEncoder)
+
+    def to_json(self):
+        """
+        Return the pre-encoded snapshot, encoding on the fly if it is missing.
+        Retorna el snapshot pre-codificado, codificándolo al vuelo si falta.
+        """
+        return self.snapshot or self.encode_snapshot()
+
     def to_dict(self):
         """
         Convert model to dictionary with camelCase keys.
@@ -45,6 +156,9 @@ class Project(models.Model):
             "description": self.description,
             "shortDescription": self.short_description,
             "imageUrl": self.image.url if self.image else None,
+            "imageWidth": self.image_width,
+            "imageHeight": self.image_height,
+            "imageSrcset": images.srcset(self.image, self.image_variants),
             "url": self.url,
             "githubUrl": self.github_url,
             "technologies": self.technologies.split(",") if self.technologies else [],
@@ -2,10 +2,16 @@
 Tests for Project model.
 """
 
+import json
+from io import BytesIO, StringIO
+
 import pytest
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
 from django.utils import timezone
-from apps.projects.models import Project
+from PIL import Image
+from apps.projects.models import Project, Technology
 
 
 @pytest.mark.django_db
@@ -313,3 +319,229 @@ class TestProjectModel:
         featured_projects = Project.objects.filter(is_featured=True)
         assert featured_projects.count() == 1
         assert featured_projects.first().title == "Featured Project"
+
+
+@pytest.mark.django_db
+class TestProjectSnapshot:
+    """Test suite for the pre-encoded Project snapshot."""
+
+    def test_snapshot_written_on_create(self):
+        """Test that creating a project stores its encoded to_dict()."""
+        project = Project.objects.create(
+            title="Snapshot Project",
+            description="Stored as JSON",
+            technologies="Python,Django"
+        )
+
+        stored = Project.objects.get(pk=project.pk).snapshot
+        assert json.loads(stored) == json.loads(json.dumps(project.to_dict()))
+
+    def test_snapshot_refreshed_on_save(self):
+        """Test that saving a project refreshes its snapshot."""
+        project = Project.objects.create(title="Old Title", description="Desc")
+
+        project.title = "New Title"
+        project.save()
+
+        stored = json.loads(Project.objects.get(pk=project.pk).snapshot)
+        assert stored["title"] == "New Title"
+        assert stored["updatedAt"] == project.updated_at.isoformat()
+
+    def test_cache_version_bumped_after_snapshot_write(self, monkeypatch):
+        """Test that the last cache bump of a save already sees the new snapshot."""
+        from core import cache
+
+        project = Project.objects.create(title="Old Title", description="Desc")
+        seen = []
+        bump_version = cache.bump_version
+
+        def record(namespace):
+            seen.append(Project.objects.values_list("snapshot", flat=True).get(pk=project.pk))
+            bump_version(namespace)
+
+        monkeypatch.setattr(cache, "bump_version", record)
+        project.title = "New Title"
+        project.save()
+
+        assert json.loads(seen[-1])["title"] == "New Title"
+
+    def test_to_json_encodes_when_snapshot_missing(self):
+        """Test that to_json falls back to encoding when no snapshot exists."""
+        Project.objects.bulk_create([Project(title="Bulk", description="No snapshot")])
+        project = Project.objects.get(title="Bulk")
+
+        assert project.snapshot == ""
+        assert json.loads(project.to_json())["title"] == "Bulk"
+
+    def test_rebuild_command_fills_missing_snapshots(self):
+        """Test the rebuild_project_snapshots management command."""
+        Project.objects.bulk_create([
+            Project(title=f"Bulk {index}", description="No snapshot") for index in range(3)
+        ])
+
+        call_command("rebuild_project_snapshots", "--missing-only", stdout=StringIO())
+
+        assert not Project.objects.filter(snapshot="").exists()
+        for project in Project.objects.all():
+            assert json.loads(project.snapshot)["title"] == project.title
+
+
+@pytest.mark.django_db
+class TestTechnologyModel:
+    """Test suite for the Technology model and the tech_stack sync."""
+
+    def test_parse_technologies_string(self):
+        """Test splitting, trimming and de-duplicating technology names."""
+        assert Technology.parse(" Python, Django ,,python,C++") == {
+            "python": "Python",
+            "django": "Django",
+            "c++": "C++",
+        }
+
+    def test_project_save_links_technologies(self):
+        """Test that saving a project creates and links Technology rows."""
+        project = Project.objects.create(title="Stack", description="Desc", technologies="Python,Django")
+
+        assert sorted(project.tech_stack.values_list("normalized_name", flat=True)) == ["django", "python"]
+
+    def test_technologies_shared_between_projects(self):
+        """Test that projects reuse existing Technology rows."""
+        Project.objects.create(title="One", description="Desc", technologies="Python")
+        Project.objects.create(title="Two", description="Desc", technologies="python, React")
+
+        assert Technology.objects.count() == 2
+        assert Technology.objects.get(normalized_name="python").projects.count() == 2
+
+    def test_clearing_technologies_unlinks_stack(self):
+        """Test that emptying the technologies field clears the relation."""
+        project = Project.objects.create(title="Stack", description="Desc", technologies="Python")
+
+        project.technologies = ""
+        project.save()
+
+        assert project.tech_stack.count() == 0
+
+    def test_technology_str_representation(self):
+        """Test the string representation of a technology."""
+        technology = Technology.objects.create(name="Django")
+
+        assert str(technology) == "Django"
+        assert technology.normalized_name == "django"
+
+    def test_single_long_entry_fits(self):
+        """Test that one entry as long as the technologies field fits a Technology row."""
+        long_name = "x" * Project._meta.get_field("technologies").max_length
+        project = Project.objects.create(title="Long", description="Desc", technologies=long_name)
+
+        assert project.tech_stack.get().name == long_name
+        for field in ("name", "normalized_name"):
+            assert Technology._meta.get_field(field).max_length >= len(long_name)
+
+
+def make_image(name='photo.png', size=(800, 400)):
+    """Build an uploaded PNG of the given size."""
+    buffer = BytesIO()
+    Image.new('RGB', size, 'teal').save(buffer, 'PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+def variant_jobs(callbacks):
+    """Keep the on_commit callbacks that run queued jobs (here, image variants) inline."""
+    return [callback for callback in callbacks if callback.__qualname__.startswith('enqueue')]
+
+
+@pytest.mark.django_db
+class TestProjectImageVariants:
+    """Test suite for the background responsive-image pipeline."""
+
+    @pytest.fixture(autouse=True)
+    def sync_variants(self, settings):
+        settings.JOBS_SYNC = True
+        settings.IMAGE_VARIANT_WIDTHS = [320, 640, 1600]
+
+    def test_upload_queues_variants_after_commit(self, django_capture_on_commit_callbacks):
+        """Test that variants are generated only once the transaction commits."""
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            project = Project.objects.create(title="Img", description="Desc", image=make_image())
+            project.refresh_from_db()
+            assert project.image_variants == {}
+
+        project.refresh_from_db()
+        assert len(variant_jobs(callbacks)) == 1
+        assert (project.image_width, project.image_height) == (800, 400)
+        assert sorted(project.image_variants["webp"], key=int) == ["320", "640", "800"]
+        assert sorted(project.image_variants["jpeg"], key=int) == ["320", "640", "800"]
+        with Image.open(project.image.storage.open(project.image_variants["webp"]["320"])) as variant:
+            assert variant.format == "WEBP"
+            assert variant.size == (320, 160)
+
+    def test_transparent_pixels_are_white_in_jpeg(self, django_capture_on_commit_callbacks):
+        """Test that transparent areas of a PNG become white, not black, in JPEG variants."""
+        buffer = BytesIO()
+        Image.new('RGBA', (400, 200), (0, 0, 0, 0)).save(buffer, 'PNG')
+        upload = SimpleUploadedFile('clear.png', buffer.getvalue(), content_type='image/png')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            project = Project.objects.create(title="Img", description="Desc", image=upload)
+
+        project.refresh_from_db()
+        with Image.open(project.image.storage.open(project.image_variants["jpeg"]["400"])) as variant:
+            assert min(variant.convert("RGB").getpixel((10, 10))) > 240
+
+    def test_to_dict_and_snapshot_expose_srcset(self, django_capture_on_commit_callbacks):
+        """Test that to_dict and the stored snapshot carry size and srcset."""
+        with django_capture_on_commit_callbacks(execute=True):
+            project = Project.objects.create(title="Img", description="Desc", image=make_image())
+
+        project.refresh_from_db()
+        result = project.to_dict()
+        assert result["imageWidth"] == 800
+        assert result["imageHeight"] == 400
+        assert result["imageSrcset"]["jpeg"].endswith(" 800w")
+        assert result["imageSrcset"]["webp"].count("w,") == 2
+        assert json.loads(project.snapshot)["imageSrcset"] == result["imageSrcset"]
+
+    def test_unchanged_image_is_not_requeued(self, django_capture_on_commit_callbacks):
+        """Test that saving other fields does not regenerate variants."""
+        with django_capture_on_commit_callbacks(execute=True):
+            project = Project.objects.create(title="Img", description="Desc", image=make_image())
+        project.refresh_from_db()
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            project.title = "Renamed"
+            project.save()
+
+        assert variant_jobs(callbacks) == []
+
+    def test_removing_image_clears_variants(self, django_capture_on_commit_callbacks):
+        """Test that clearing the image resets size and srcset."""
+        with django_capture_on_commit_callbacks(execute=True):
+            project = Project.objects.create(title="Img", description="Desc", image=make_image())
+        project.refresh_from_db()
+
+        project.image = None
+        project.save()
+        project.refresh_from_db()
+
+        assert project.image_width is None
+        assert project.to_dict()["imageSrcset"] == {}
+
+    def test_invalid_image_does_not_fail_save(self, django_capture_on_commit_callbacks):
+        """Test that an unreadable upload is logged and left without variants."""
+        upload = SimpleUploadedFile("broken.jpg", b"not an image", content_type="image/jpeg")
+        with django_capture_on_commit_callbacks(execute=True):
+            project = Project.objects.create(title="Img", description="Desc", image=upload)
+
+        project.refresh_from_db()
+        assert project.image_variants == {}
+
+    def test_generate_image_variants_command(self):
+        """Test that the command backfills rows saved outside a commit hook."""
+        project = Project.objects.create(title="Img", description="Desc", image=make_image(size=(200, 100)))
+        out = StringIO()
+
+        call_command("generate_image_variants", stdout=out)
+
+        project.refresh_from_db()
+        assert project.image_variants["webp"] == {"200": project.image_variants["webp"]["200"]}
+        assert "Generated variants for 1 image(s)." in out.getvalue()
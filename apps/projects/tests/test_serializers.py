@@ -186,7 +186,8 @@ class TestProjectSerializer:
         serializer = ProjectSerializer(project)
         expected_fields = {
             'id', 'title', 'description', 'shortDescription',
-            'imageUrl', 'url', 'githubUrl', 'technologies',
+            'imageUrl', 'imageWidth', 'imageHeight', 'imageSrcset',
+            'url', 'githubUrl', 'technologies',
             'isFeatured', 'order', 'createdAt', 'updatedAt'
         }
 
@@ -2,10 +2,14 @@
 Tests for Project API views.
 """
 
+import json
+
 import pytest
+from django.http import JsonResponse
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
+from apps.projects import views as legacy_views
 from apps.projects.models import Project
 
 
@@ -384,3 +388,650 @@ class TestProjectViewSet:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestLegacyProjectViews:
+    """Test suite for the snapshot-backed JSON views in apps/projects/views.py."""
+
+    def test_project_list_matches_json_response(self, request_factory, sample_project, featured_project):
+        """Test that concatenated snapshots are byte-identical to JsonResponse."""
+        response = legacy_views.project_list(request_factory.get('/projects/'))
+
+        expected = JsonResponse({
+            "success": True,
+            "projects": [project.to_dict() for project in Project.objects.all()],
+        })
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/json'
+        assert response.streaming
+        assert b''.join(response.streaming_content) == expected.content
+
+    def test_project_list_reads_only_snapshots(self, request_factory, sample_project, django_assert_num_queries):
+        """Test that the list reads the snapshot column in a single query."""
+        with django_assert_num_queries(1) as context:
+            b''.join(legacy_views.project_list(request_factory.get('/projects/')).streaming_content)
+
+        assert '"description"' not in context.captured_queries[0]['sql']
+
+    def test_project_list_encodes_rows_without_snapshot(self, request_factory):
+        """Test that bulk-created rows without snapshot are still listed."""
+        Project.objects.bulk_create([Project(title='Bulk', description='No snapshot')])
+
+        response = legacy_views.project_list(request_factory.get('/projects/'))
+
+        payload = json.loads(b''.join(response.streaming_content))
+        assert payload['projects'][0]['title'] == 'Bulk'
+
+    def test_featured_projects(self, request_factory, sample_project, featured_project):
+        """Test that only featured snapshots are returned."""
+        response = legacy_views.featured_projects(request_factory.get('/projects/featured/'))
+
+        payload = json.loads(b''.join(response.streaming_content))
+        assert [project['title'] for project in payload['projects']] == ['Featured Project']
+
+    def test_project_detail(self, request_factory, sample_project):
+        """Test the detail view returns the project snapshot."""
+        response = legacy_views.project_detail(request_factory.get('/projects/1/'), pk=sample_project.pk)
+
+        payload = json.loads(response.content)
+        assert payload == {"success": True, "project": json.loads(json.dumps(sample_project.to_dict()))}
+
+    def test_project_detail_not_found(self, request_factory):
+        """Test the detail view returns 404 for unknown projects."""
+        response = legacy_views.project_detail(request_factory.get('/projects/999/'), pk=999)
+
+        assert response.status_code == 404
+        assert json.loads(response.content)['success'] is False
+        assert response.content == JsonResponse({"success": False, "error": "Project not found"}).content
+
+
+@pytest.mark.django_db
+class TestProjectTechnologyFilter:
+    """Test suite for the indexed ?technology= filter."""
+
+    def _results(self, response):
+        return response.data['results'] if 'results' in response.data else response.data
+
+    def test_filter_by_technology(self, api_client, sample_project, featured_project):
+        """Test filtering projects by a single technology."""
+        response = api_client.get('/api/projects/?technology=Django')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [project['id'] for project in self._results(response)] == [sample_project.id]
+
+    def test_filter_by_technology_is_case_insensitive(self, api_client, sample_project):
+        """Test that technology lookups ignore case and surrounding spaces."""
+        response = api_client.get('/api/projects/?technology=%20python%20')
+
+        assert len(self._results(response)) == 1
+
+    def test_filter_by_multiple_technologies_requires_all(self, api_client, sample_project):
+        """Test that repeated technology parameters are combined with AND."""
+        Project.objects.create(title='Only Python', description='Desc', technologies='Python')
+
+        response = api_client.get('/api/projects/?technology=python&technology=django')
+
+        assert [project['id'] for project in self._results(response)] == [sample_project.id]
+
+    def test_filter_uses_technology_table_not_like_scan(self, api_client, sample_project):
+        """Test that the filter joins the technology table instead of scanning the text field."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as context:
+            api_client.get('/api/projects/?technology=django')
+
+        select_sql = context.captured_queries[-1]['sql']
+        assert 'projects_technology' in select_sql
+        assert 'LIKE' not in select_sql.upper()
+
+    def test_wire_format_keeps_technologies_string(self, api_client, sample_project):
+        """Test that the technologies field is still serialized as the original string."""
+        response = api_client.get(f'/api/projects/{sample_project.id}/')
+
+        assert response.data['technologies'] == 'Python, Django'
+
+    def test_tech_stack_synced_on_update(self, api_client, sample_project):
+        """Test that editing the technologies string re-links the tech stack."""
+        api_client.patch(f'/api/projects/{sample_project.id}/', {'technologies': 'Go'}, format='json')
+
+        assert list(sample_project.tech_stack.values_list('name', flat=True)) == ['Go']
+        assert api_client.get('/api/projects/?technology=django').data['count'] == 0
+
+
+@pytest.mark.django_db
+class TestProjectFullTextSearch:
+    """Test suite for the full-text ?search= backend."""
+
+    def _titles(self, response):
+        results = response.data['results'] if 'results' in response.data else response.data
+        return [project['title'] for project in results]
+
+    def test_search_uses_full_text_table(self, api_client, sample_project):
+        """Test that ?search= queries the shadow search table."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get('/api/projects/?search=sample')
+
+        assert self._titles(response) == ['Sample Project']
+        assert 'projects_project_search' in context.captured_queries[-1]['sql']
+
+    def test_search_results_are_ranked(self, api_client):
+        """Test that better matches come first when no ordering is requested."""
+        Project.objects.create(title='Blog', description='Built with Django', order=0)
+        Project.objects.create(title='Django Django Shop', description='Django store', order=5)
+
+        response = api_client.get('/api/projects/?search=django')
+
+        assert self._titles(response) == ['Django Django Shop', 'Blog']
+
+    def test_equal_ranks_follow_model_ordering_then_pk(self, rf, sample_project):
+        """Test that ties in rank have a total order, so pages never overlap."""
+        from rest_framework.request import Request
+        from core.search import FullTextSearchFilter
+
+        request = Request(rf.get('/api/projects/', {'search': 'sample'}))
+        queryset = FullTextSearchFilter().filter_queryset(request, Project.objects.all(), view=None)
+
+        assert queryset.query.order_by == ('-search_rank', *Project._meta.ordering, 'pk')
+
+    def test_search_matches_word_prefixes(self, api_client, sample_project):
+        """Test that partial words match like the previous icontains search."""
+        response = api_client.get('/api/projects/?search=Djan')
+
+        assert self._titles(response) == ['Sample Project']
+
+    def test_search_requires_every_term(self, api_client):
+        """Test that multi-word searches match projects containing all terms."""
+        Project.objects.create(title='Python API', description='REST service')
+        Project.objects.create(title='Python Scripts', description='Automation')
+
+        response = api_client.get('/api/projects/?search=python%20rest')
+
+        assert self._titles(response) == ['Python API']
+
+    def test_search_index_follows_updates_and_deletes(self, api_client, sample_project):
+        """Test that the search table is kept current on save and delete."""
+        sample_project.title = 'Renamed Portfolio'
+        sample_project.save()
+        assert self._titles(api_client.get('/api/projects/?search=renamed')) == ['Renamed Portfolio']
+        assert self._titles(api_client.get('/api/projects/?search=project')) == []
+
+        sample_project.delete()
+        assert self._titles(api_client.get('/api/projects/?search=renamed')) == []
+
+    def test_search_ignores_query_syntax(self, api_client, sample_project):
+        """Test that FTS operators in user input are treated as plain words."""
+        response = api_client.get('/api/projects/?search=%22sample%22%20OR%20NEAR(')
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_rebuild_search_index_command(self, api_client):
+        """Test that bulk-created rows become searchable after a rebuild."""
+        from io import StringIO
+        from django.core.management import call_command
+
+        Project.objects.bulk_create([Project(title='Imported Project', description='Bulk')])
+        assert self._titles(api_client.get('/api/projects/?search=imported')) == []
+
+        call_command('rebuild_search_index', stdout=StringIO())
+
+        assert self._titles(api_client.get('/api/projects/?search=imported')) == ['Imported Project']
+
+
+@pytest.mark.django_db
+class TestProjectKeysetPagination:
+    """Test suite for keyset pagination on (order, -created_at, id)."""
+
+    def test_cursor_follows_model_ordering(self, api_client):
+        """Test that cursor pages follow order, then newest first, then id."""
+        for index in range(12):
+            Project.objects.create(title=f'Project {index}', description='Desc', order=index % 3)
+        expected = list(Project.objects.order_by('order', '-created_at', 'id').values_list('id', flat=True))
+
+        seen = []
+        url = '/api/projects/?cursor='
+        while url:
+            response = api_client.get(url)
+            seen.extend(project['id'] for project in response.data['results'])
+            url = response.data['next']
+
+        assert seen == expected
+
+    def test_cursor_key_derived_from_meta_ordering(self):
+        """Test the keyset key used for projects."""
+        from core.pagination import KeysetPagination
+
+        paginator = KeysetPagination(page_size=10)
+
+        assert paginator.get_ordering(Project.objects.all(), view=None) == ['order', '-created_at', 'id']
+
+    def test_cursor_rejects_ordering(self, api_client, sample_project):
+        """Test that ?ordering= with a cursor is an error instead of being ignored."""
+        response = api_client.get('/api/projects/?cursor=&ordering=title')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'ordering' in response.data
+
+
+@pytest.mark.django_db
+class TestProjectIndexUsage:
+    """Test suite proving project endpoints are served by their indexes."""
+
+    def test_list_uses_ordering_index(self, explain_endpoint, sample_project):
+        """Test that the default list ordering reads the composite index."""
+        assert 'project_order_created_idx' in explain_endpoint('/api/projects/')
+
+    def test_cursor_list_uses_ordering_index(self, explain_endpoint, sample_project):
+        """Test that keyset pages read the composite index."""
+        assert 'project_order_created_idx' in explain_endpoint('/api/projects/?cursor=')
+
+    def test_featured_uses_partial_index(self, explain_endpoint, featured_project):
+        """Test that the featured action reads the partial index."""
+        assert 'project_featured_idx' in explain_endpoint('/api/projects/featured/')
+
+
+@pytest.mark.django_db
+class TestProjectConditionalGet:
+    """Test suite for ETag / Last-Modified validation on project endpoints."""
+
+    def test_list_returns_validators(self, api_client, sample_project):
+        """Test that the list carries ETag and Last-Modified headers."""
+        response = api_client.get('/api/projects/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'].startswith('"')
+        assert 'Last-Modified' in response
+
+    def test_list_not_modified_skips_serialization(self, api_client, sample_project, django_assert_num_queries):
+        """Test that a matching If-None-Match gets a 304 from the cached aggregate."""
+        etag = api_client.get('/api/projects/')['ETag']
+
+        with django_assert_num_queries(0):
+            response = api_client.get('/api/projects/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert response.content == b''
+
+    def test_list_if_modified_since(self, api_client, sample_project):
+        """Test that If-Modified-Since with the returned date gets a 304."""
+        last_modified = api_client.get('/api/projects/')['Last-Modified']
+
+        response = api_client.get('/api/projects/', HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_etag_changes_on_update_and_delete(self, api_client, sample_project, featured_project):
+        """Test that edits and deletions produce a new ETag."""
+        first = api_client.get('/api/projects/')['ETag']
+
+        sample_project.title = 'Changed'
+        sample_project.save()
+        second = api_client.get('/api/projects/', HTTP_IF_NONE_MATCH=first)
+        assert second.status_code == status.HTTP_200_OK
+
+        featured_project.delete()
+        third = api_client.get('/api/projects/', HTTP_IF_NONE_MATCH=second['ETag'])
+        assert third.status_code == status.HTTP_200_OK
+
+    def test_etag_varies_with_query_string(self, api_client, sample_project):
+        """Test that different pages or filters never share an ETag."""
+        assert api_client.get('/api/projects/')['ETag'] != api_client.get('/api/projects/?search=sample')['ETag']
+
+    def test_detail_not_modified(self, api_client, sample_project):
+        """Test that the detail endpoint validates against the row's updated_at."""
+        url = f'/api/projects/{sample_project.id}/'
+        etag = api_client.get(url)['ETag']
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        sample_project.save()
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_detail_missing_still_404(self, api_client):
+        """Test that unknown rows skip validation and return 404."""
+        response = api_client.get('/api/projects/424242/', HTTP_IF_NONE_MATCH='"anything"')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_featured_ignores_non_featured_changes(self, api_client, sample_project, featured_project):
+        """Test that the featured ETag only tracks featured rows."""
+        etag = api_client.get('/api/projects/featured/')['ETag']
+
+        sample_project.title = 'Not featured'
+        sample_project.save()
+
+        response = api_client.get('/api/projects/featured/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_writes_are_not_validated(self, api_client, sample_project):
+        """Test that unsafe methods ignore conditional headers."""
+        etag = api_client.get(f'/api/projects/{sample_project.id}/')['ETag']
+
+        response = api_client.patch(
+            f'/api/projects/{sample_project.id}/', {'title': 'Patched'}, format='json', HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestProjectStreaming:
+    """Test suite for ?stream=1 on the project list."""
+
+    def test_stream_returns_plain_array(self, api_client, sample_project, featured_project):
+        """Test that the streamed body matches the paginated results."""
+        regular = api_client.get('/api/projects/')
+
+        response = api_client.get('/api/projects/?stream=1')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Type'] == 'application/json'
+        assert json.loads(b''.join(response.streaming_content)) == json.loads(json.dumps(regular.data['results']))
+
+    def test_stream_applies_filters(self, api_client, sample_project, featured_project):
+        """Test that filter backends still apply to streamed lists."""
+        response = api_client.get('/api/projects/?stream=1&technology=python')
+
+        payload = json.loads(b''.join(response.streaming_content))
+        assert [project['title'] for project in payload] == ['Sample Project']
+
+    def test_stream_empty(self, api_client):
+        """Test that an empty queryset streams an empty array."""
+        response = api_client.get('/api/projects/?stream=1')
+
+        assert b''.join(response.streaming_content) == b'[]'
+
+    def test_legacy_list_streams_in_chunks(self):
+        """Test that snapshots are read in bounded chunks with missing ones filled per chunk."""
+        for index in range(3):
+            Project.objects.create(title=f'Project {index}', description='Chunked', order=index)
+        Project.objects.bulk_create([Project(title='Bulk', description='No snapshot', order=9)])
+
+        fragments = list(legacy_views.iter_project_snapshots(Project.objects.all(), chunk_size=2))
+
+        assert [json.loads(fragment)['title'] for fragment in fragments] == [
+            'Project 0', 'Project 1', 'Project 2', 'Bulk',
+        ]
+
+
+@pytest.mark.django_db
+class TestProjectSparseFieldsets:
+    """Test suite for ?fields= / ?omit= on project endpoints."""
+
+    def test_fields_prunes_output_and_columns(self, api_client, sample_project):
+        """Test that only requested fields are rendered and selected."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get('/api/projects/?fields=id,title,imageUrl')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert list(response.data['results'][0]) == ['id', 'title', 'imageUrl']
+        select_sql = context.captured_queries[-1]['sql']
+        assert '"projects_project"."title"' in select_sql
+        assert '"projects_project"."description"' not in select_sql
+
+    def test_omit_drops_fields(self, api_client, sample_project):
+        """Test that omitted fields are removed from the detail response."""
+        response = api_client.get(f'/api/projects/{sample_project.id}/?omit=description,technologies')
+
+        assert 'description' not in response.data
+        assert 'technologies' not in response.data
+        assert response.data['title'] == 'Sample Project'
+
+    def test_method_field_loads_declared_sources(self, api_client, sample_project):
+        """Test that imageSrcset only needs the image columns."""
+        response = api_client.get('/api/projects/?fields=id,imageSrcset')
+
+        assert response.data['results'][0] == {'id': sample_project.id, 'imageSrcset': {}}
+
+    def test_featured_and_cursor_pages(self, api_client, featured_project):
+        """Test that the featured action and keyset pages honour sparse fields."""
+        featured = api_client.get('/api/projects/featured/?fields=id,title')
+        assert featured.data == [{'id': featured_project.id, 'title': 'Featured Project'}]
+
+        response = api_client.get('/api/projects/?cursor=&fields=title')
+        assert response.data['results'] == [{'title': 'Featured Project'}]
+
+    def test_unknown_field_is_rejected(self, api_client, sample_project):
+        """Test that a typo in ?fields= returns 400 instead of every field."""
+        response = api_client.get('/api/projects/?fields=id,titel')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_writes_return_every_field(self, api_client, sample_project):
+        """Test that unsafe methods ignore ?fields=."""
+        response = api_client.patch(
+            f'/api/projects/{sample_project.id}/?fields=id', {'title': 'Patched'}, format='json'
+        )
+
+        assert response.data['title'] == 'Patched'
+        assert 'description' in response.data
+
+
+@pytest.mark.django_db
+class TestProjectResponseCache:
+    """Test suite for the model-versioned response cache."""
+
+    def test_warm_request_hits_no_database(self, api_client, sample_project, django_assert_num_queries):
+        """Test that a repeated request is answered from the cache."""
+        first = api_client.get('/api/projects/')
+
+        with django_assert_num_queries(0):
+            response = api_client.get('/api/projects/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == first.content
+        assert response['ETag'] == first['ETag']
+
+    def test_save_and_delete_invalidate(self, api_client, sample_project, featured_project):
+        """Test that writes are visible on the next request."""
+        api_client.get('/api/projects/featured/')
+
+        featured_project.title = 'Renamed'
+        featured_project.save()
+        assert api_client.get('/api/projects/featured/').data[0]['title'] == 'Renamed'
+
+        featured_project.delete()
+        assert api_client.get('/api/projects/featured/').data == []
+
+    def test_tech_stack_change_invalidates(self, api_client, sample_project):
+        """Test that many-to-many changes bump the project version."""
+        assert api_client.get('/api/projects/?technology=django').data['count'] == 1
+
+        sample_project.tech_stack.clear()
+
+        assert api_client.get('/api/projects/?technology=django').data['count'] == 0
+
+    def test_query_and_fields_are_cached_separately(self, api_client, sample_project):
+        """Test that different query strings never share an entry."""
+        full = api_client.get(f'/api/projects/{sample_project.id}/')
+        sparse = api_client.get(f'/api/projects/{sample_project.id}/?fields=id,title')
+
+        assert 'description' in full.data
+        assert set(sparse.data) == {'id', 'title'}
+
+    def test_version_bumped_again_on_commit(self, django_capture_on_commit_callbacks):
+        """Test that entries cached before the commit are retired by it."""
+        from core.cache import get_model_versions
+
+        with django_capture_on_commit_callbacks(execute=True):
+            project = Project.objects.create(title='Pending', description='Desc')
+            during = get_model_versions(Project)
+
+        assert get_model_versions(Project) != during
+        assert project.pk
+
+    @pytest.mark.parametrize('backend', [
+        'django.core.cache.backends.locmem.LocMemCache',
+        'django.core.cache.backends.filebased.FileBasedCache',
+        'django.core.cache.backends.db.DatabaseCache',
+    ])
+    def test_backends(self, settings, tmp_path, api_client, sample_project, backend):
+        """Test that invalidation works with every supported backend."""
+        from django.core.management import call_command
+
+        location = str(tmp_path) if 'filebased' in backend else 'api_cache'
+        settings.CACHES = {'default': {'BACKEND': backend, 'LOCATION': location}}
+        if 'db' in backend.split('.'):
+            call_command('createcachetable')
+
+        assert api_client.get(f'/api/projects/{sample_project.id}/').data['title'] == 'Sample Project'
+        sample_project.title = 'Updated'
+        sample_project.save()
+
+        assert api_client.get(f'/api/projects/{sample_project.id}/').data['title'] == 'Updated'
+
+
+@pytest.mark.django_db
+class TestProjectStampedeProtection:
+    """Test suite for single-flight refreshes and stale-while-revalidate."""
+
+    @pytest.fixture
+    def lock_held(self, monkeypatch):
+        """Pretend another worker holds every refresh lock."""
+        from django.core.cache import cache
+        from core import cache as api_cache
+
+        monkeypatch.setattr(api_cache, '_lock_key', lambda key: 'other-worker-lock')
+        cache.set('other-worker-lock', 1)
+        yield
+        cache.delete('other-worker-lock')
+
+    def test_stale_served_while_other_worker_refreshes(self, api_client, sample_project, request):
+        """Test that a changed model serves the previous data until the refresh lands."""
+        assert api_client.get('/api/projects/')['X-Cache'] == 'miss'
+        sample_project.title = 'Renamed'
+        sample_project.save()
+
+        request.getfixturevalue('lock_held')
+        stale = api_client.get('/api/projects/')
+
+        assert stale['X-Cache'] == 'stale'
+        assert stale.data['results'][0]['title'] == 'Sample Project'
+        assert 'ETag' not in stale
+
+    def test_refresh_after_change(self, api_client, sample_project):
+        """Test that the worker taking the lock serves fresh data."""
+        api_client.get('/api/projects/')
+        sample_project.title = 'Renamed'
+        sample_project.save()
+
+        response = api_client.get('/api/projects/')
+
+        assert response['X-Cache'] == 'refresh'
+        assert response.data['results'][0]['title'] == 'Renamed'
+        assert 'ETag' in response
+        assert api_client.get('/api/projects/')['X-Cache'] == 'hit'
+
+    def test_cold_miss_computes_when_lock_is_held(self, settings, api_client, sample_project, lock_held):
+        """Test that a request with nothing to serve never waits forever."""
+        settings.API_CACHE_LOCK_WAIT = 0
+
+        response = api_client.get('/api/projects/')
+
+        assert response['X-Cache'] == 'miss'
+        assert response.data['count'] == 1
+
+    def test_early_expiration(self, monkeypatch):
+        """Test that XFetch only refreshes close to the expiry, scaled by compute time."""
+        import random
+        from core.cache import should_refresh_early
+
+        monkeypatch.setattr(random, 'random', lambda: 0.5)
+        entry = {'delta': 2.0, 'expires': 100.0}
+
+        assert should_refresh_early(entry, now=50.0) is False
+        assert should_refresh_early(entry, now=99.0) is True
+        assert should_refresh_early(entry, now=101.0) is True
+
+    def test_counters(self, settings, api_client, sample_project):
+        """Test that hits, misses and stale serves are counted."""
+        from io import StringIO
+        from django.core.management import call_command
+        from core.cache import get_stats, reset_stats
+
+        reset_stats()
+        api_client.get('/api/projects/')
+        api_client.get('/api/projects/')
+        api_client.get('/api/projects/')
+
+        stats = get_stats()
+        assert (stats['miss'], stats['hit'], stats['stale']) == (1, 2, 0)
+        out = StringIO()
+        call_command('cache_stats', '--reset', stdout=out)
+        assert 'hit: 2 (66.7%)' in out.getvalue()
+        assert get_stats()['hit'] == 0
+
+
+@pytest.mark.django_db
+class TestProjectLocalCache:
+    """Test suite for the per-process LRU in front of the shared cache."""
+
+    def test_lru_evicts_by_size(self):
+        """Test that least recently used values go first once over budget."""
+        import pickle
+        from core.local_cache import LRUCache
+
+        size = len(pickle.dumps('x' * 100, pickle.HIGHEST_PROTOCOL))
+        lru = LRUCache(max_bytes=size * 2)
+        lru.set('a', 'x' * 100)
+        lru.set('b', 'x' * 100)
+        lru.get('a')
+        lru.set('c', 'x' * 100)
+
+        assert 'a' in lru and 'c' in lru and 'b' not in lru
+        assert lru.size == size * 2
+        assert lru.set('huge', 'x' * 1000) is False
+
+    def test_featured_served_from_process_memory(self, api_client, featured_project):
+        """Test that a warm featured list never reaches the shared cache body."""
+        assert api_client.get('/api/projects/featured/')['X-Cache'] == 'miss'
+
+        response = api_client.get('/api/projects/featured/')
+
+        assert response['X-Cache'] == 'local'
+        assert response.data[0]['title'] == 'Featured Project'
+
+    def test_other_worker_write_drops_lru(self, api_client, featured_project):
+        """Test that a generation bump from another process empties this LRU."""
+        from core.cache import GENERATION_NAMESPACE, bump_version
+
+        api_client.get('/api/projects/featured/')
+        # Another worker wrote: the shared generation moved, this LRU did not see it.
+        bump_version(GENERATION_NAMESPACE)
+
+        assert api_client.get('/api/projects/featured/')['X-Cache'] == 'hit'
+
+    def test_local_write_drops_lru(self, api_client, featured_project):
+        """Test that writes in this process are visible immediately."""
+        api_client.get('/api/projects/featured/')
+        featured_project.title = 'Renamed'
+        featured_project.save()
+
+        assert api_client.get('/api/projects/featured/').data[0]['title'] == 'Renamed'
+
+    def test_generation_read_once_per_request(self, monkeypatch):
+        """Test that the shared generation is read at most once inside a request."""
+        from core import cache as api_cache
+
+        reads = []
+        get_version = api_cache.get_version
+        monkeypatch.setattr(api_cache, 'get_version', lambda namespace: reads.append(namespace) or get_version(namespace))
+
+        api_cache._open_request_scope()
+        try:
+            api_cache.local_get('a')
+            api_cache.local_get('b')
+        finally:
+            api_cache._close_request_scope()
+        api_cache.local_get('c')
+
+        assert reads == [api_cache.GENERATION_NAMESPACE] * 2
@@ -4,25 +4,71 @@ Vistas de la app projects.
 """
 
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_http_methods
+from core.streaming import DEFAULT_CHUNK_SIZE, streaming_json_response
 from .models import Project
 
 
+def resolve_snapshots(rows):
+    """
+    Fill in missing snapshots for a batch of ``(pk, snapshot)`` rows.
+    Completa los snapshots que falten en un lote de filas ``(pk, snapshot)``.
+
+    Rows without a snapshot yet (created through bulk_create or before the
+    column existed) are encoded with one extra query per batch.
+    """
+    missing = [pk for pk, snapshot in rows if not snapshot]
+    if missing:
+        encoded = {project.pk: project.encode_snapshot() for project in Project.objects.filter(pk__in=missing)}
+        rows = [(pk, snapshot or encoded[pk]) for pk, snapshot in rows]
+    return [snapshot for _pk, snapshot in rows]
+
+
+def project_snapshots(queryset):
+    """
+    Return the pre-encoded JSON fragment of every project in the queryset.
+    Retorna el fragmento JSON pre-codificado de cada proyecto del queryset.
+    """
+    return resolve_snapshots(list(queryset.values_list("pk", "snapshot")))
+
+
+def iter_project_snapshots(queryset, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield pre-encoded project fragments, reading ``chunk_size`` rows at a time.
+    Genera fragmentos de proyectos pre-codificados, leyendo ``chunk_size`` filas a la vez.
+    """
+    batch = []
+    for row in queryset.values_list("pk", "snapshot").iterator(chunk_size=chunk_size):
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            yield from resolve_snapshots(batch)
+            batch = []
+    yield from resolve_snapshots(batch)
+
+
+def projects_response(queryset):
+    """
+    Stream the project list payload from pre-encoded fragments.
+    Envía la lista de proyectos en streaming a partir de fragmentos pre-codificados.
+
+    The body is byte-identical to the former ``JsonResponse`` output.
+    """
+    return streaming_json_response(
+        iter_project_snapshots(queryset),
+        prefix='{"success": true, "projects": [',
+        suffix="]}",
+        separator=", ",
+    )
+
+
 @require_http_methods(["GET"])
 def project_list(request):
     """
     Return list of all projects in JSON format with camelCase keys.
     Retorna lista de todos los proyectos en formato JSON con llaves en camelCase.
     """
-    projects = Project.objects.all()
-
-    data = {
-        "success": True,
-        "projects": [project.to_dict() for project in projects]
-    }
-
-    return JsonResponse(data)
+    return projects_response(Project.objects.all())
 
 
 @require_http_methods(["GET"])
@@ -31,18 +77,13 @@ def project_detail(request, pk):
     Return single project details in JSON format with camelCase keys.
     Retorna detalles de un proyecto en formato JSON con llaves en camelCase.
     """
-    try:
-        project = Project.objects.get(pk=pk)
-        data = {
-            "success": True,
-            "project": project.to_dict()
-        }
-        return JsonResponse(data)
-    except Project.DoesNotExist:
+    snapshots = project_snapshots(Project.objects.filter(pk=pk))
+    if not snapshots:
         return JsonResponse({
             "success": False,
             "error": "Project not found"
         }, status=404)
+    return HttpResponse('{"success": true, "project": ' + snapshots[0] + "}", content_type="application/json")
 
 
 @require_http_methods(["GET"])
@@ -51,11 +92,4 @@ def featured_projects(request):
     Return featured projects in JSON format with camelCase keys.
     Retorna proyectos destacados en formato JSON con llaves en camelCase.
     """
-    projects = Project.objects.filter(is_featured=True)
-
-    data = {
-        "success": True,
-        "projects": [project.to_dict() for project in projects]
-    }
-
-    return JsonResponse(data)
+    return projects_response(Project.objects.filter(is_featured=True))
@@ -4,10 +4,12 @@ Serializadores para la app skills.
 """
 
 from rest_framework import serializers
+from core.sparse import SparseFieldsetSerializerMixin
+from core.timing import TimedSerializerMixin
 from apps.skills.models import Skill, SkillCategory
 
 
-class SkillSerializer(serializers.ModelSerializer):
+class SkillSerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for Skill model with camelCase field names.
     Serializador para el modelo Skill con nombres de campos en camelCase.
@@ -43,14 +45,14 @@ class SkillSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'categoryName', 'createdAt', 'updatedAt']
 
 
-class SkillGetSerializers(serializers.ModelSerializer):
+class SkillGetSerializers(TimedSerializerMixin, SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     category = serializers.StringRelatedField()
     
     class Meta:
         model = Skill
         fields = '__all__'
 
-class SkillCategorySerializer(serializers.ModelSerializer):
+class SkillCategorySerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for SkillCategory model with camelCase field names.
     Serializador para el modelo SkillCategory con nombres de campos en camelCase.
@@ -3,10 +3,17 @@ API views for the skills app.
 Vistas de API para la app skills.
 """
 
+from django.db.models import Prefetch
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view
+from core.async_views import AsyncReadMixin
+from core.cache import STALE, CachedResponseMixin, cached_call, get_model_versions
+from core.conditional import ConditionalGetMixin, make_etag
+from core.sparse import SparseFieldsetViewMixin, get_requested_fields, select_fields
+from core.search import FullTextSearchFilter
+from core.streaming import StreamingListMixin
 from apps.skills.models import Skill, SkillCategory
 from .serializers import SkillSerializer, SkillCategorySerializer,SkillGetSerializers
 
@@ -43,7 +50,7 @@ from .serializers import SkillSerializer, SkillCategorySerializer,SkillGetSerial
         tags=["Skills"],
     ),
 )
-class SkillViewSet(viewsets.ModelViewSet):
+class SkillViewSet(AsyncReadMixin, CachedResponseMixin, ConditionalGetMixin, SparseFieldsetViewMixin, StreamingListMixin, viewsets.ModelViewSet):
     """
     ViewSet for viewing and editing Skill instances.
     Provides CRUD operations and filtering for skills.
@@ -53,11 +60,48 @@ class SkillViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Skill.objects.all()
+    cache_models = [Skill, SkillCategory]
+    cache_actions = ['list', 'retrieve', 'featured']
     serializer_class = SkillSerializer
-    filter_backends = [filters.OrderingFilter, filters.SearchFilter]
+    filter_backends = [filters.OrderingFilter, FullTextSearchFilter]
     search_fields = ['name', 'description']
     ordering_fields = ['order', 'name', 'percentage']
     ordering = ['category__order', 'order', 'name']
+    # The category is always joined by get_queryset().
+    # La categoría siempre se une en get_queryset().
+    sparse_always_load = ['category']
+
+    # Category columns the list serializer never renders.
+    # Columnas de la categoría que el serializador de lista nunca muestra.
+    LIST_DEFERRED_FIELDS = ['category__description', 'category__created_at', 'category__updated_at']
+
+    def get_queryset(self):
+        """
+        Join the category in the same query so names never cost a query per row.
+        Une la categoría en la misma consulta para no hacer una consulta por fila.
+        """
+        queryset = super().get_queryset().select_related('category')
+        if self.action == 'list':
+            queryset = queryset.defer(*self.LIST_DEFERRED_FIELDS)
+        return queryset
+
+    def get_conditional_querysets(self):
+        """
+        Include the categories whose names every skill representation renders.
+        Incluye las categorías cuyos nombres muestra cada habilidad.
+        """
+        if self.action == 'featured':
+            return [self.get_queryset().filter(is_featured=True), SkillCategory.objects.all()]
+        return super().get_conditional_querysets() + [SkillCategory.objects.all()]
+
+    def get_validators(self):
+        """
+        by_category is validated with the same version counter as its cache,
+        so a warm request still performs no database work.
+        """
+        if self.action == 'by_category':
+            return make_etag(self.basename, self.action, get_model_versions(*self.cache_models), self.get_representation_key()), None
+        return super().get_validators()
 
     def get_serializer_class(self):
         """
@@ -79,10 +123,15 @@ class SkillViewSet(viewsets.ModelViewSet):
         Get featured skills only.
         Obtener solo habilidades destacadas.
         """
-        featured_skills = self.queryset.filter(is_featured=True)
+        featured_skills = self.get_queryset().filter(is_featured=True)
         serializer = self.get_serializer(featured_skills, many=True)
         return Response(serializer.data)
 
+    async def afeatured(self, request):
+        """Async variant of ``featured`` (ASYNC_VIEWS)."""
+        featured_skills = [skill async for skill in self.get_queryset().filter(is_featured=True)]
+        return Response(self.get_serializer(featured_skills, many=True).data)
+
     @extend_schema(
         summary="Get skills grouped by category / Obtener habilidades agrupadas por categoría",
         description="Retrieve all skill categories with their associated skills. / Obtiene todas las categorías de habilidades con sus habilidades asociadas.",
@@ -94,10 +143,43 @@ class SkillViewSet(viewsets.ModelViewSet):
         """
         Get skills grouped by category.
         Obtener habilidades agrupadas por categoría.
+
+        ``?fields=`` / ``?omit=`` prune the category fields (nested skills
+        render in full); each fieldset is cached under its own key.
         """
-        categories = SkillCategory.objects.all()
-        serializer = SkillCategorySerializer(categories, many=True)
-        return Response(serializer.data)
+        key = "portfolio:skills:by_category"
+        fields, omit = get_requested_fields(request)
+        kept = None
+        if fields is not None or omit:
+            kept = select_fields(list(SkillCategorySerializer().fields), fields, omit)
+            key = f"{key}:{','.join(kept)}"
+        categories = self.get_category_tree() if kept is None or 'skills' in kept else SkillCategory.objects.order_by('order', 'name')
+        state, data = cached_call(
+            key, self.cache_models,
+            lambda: SkillCategorySerializer(categories, many=True, context=self.get_serializer_context()).data,
+            local=True,
+        )
+        if state == STALE:
+            # The ETag already describes the new version.
+            # El ETag ya describe la nueva versión.
+            self.conditional_validators = None
+        return Response(data, headers={'X-Cache': state})
+
+    @staticmethod
+    def get_category_tree():
+        """
+        Categories with their skills prefetched in two queries.
+        Categorías con sus habilidades precargadas en dos consultas.
+
+        Skills are ordered like ``Skill.Meta.ordering`` within each category,
+        and the prefetch fills ``skill.category`` so ``categoryName`` never
+        triggers another query. Leading with ``category`` lets the prefetch
+        read the (category, order, name) index instead of sorting.
+        """
+        skills = Skill.objects.order_by('category', 'order', 'name')
+        return SkillCategory.objects.order_by('order', 'name').prefetch_related(
+            Prefetch('skills', queryset=skills)
+        )
 
 
 @extend_schema_view(
@@ -132,7 +214,7 @@ class SkillViewSet(viewsets.ModelViewSet):
         tags=["Skills"],
     ),
 )
-class SkillCategoryViewSet(viewsets.ModelViewSet):
+class SkillCategoryViewSet(AsyncReadMixin, CachedResponseMixin, ConditionalGetMixin, SparseFieldsetViewMixin, StreamingListMixin, viewsets.ModelViewSet):
     """
     ViewSet for viewing and editing SkillCategory instances.
     Provides CRUD operations for skill categories.
@@ -142,5 +224,19 @@ class SkillCategoryViewSet(viewsets.ModelViewSet):
     """
 
     queryset = SkillCategory.objects.all()
+    cache_models = [SkillCategory, Skill]
     serializer_class = SkillCategorySerializer
     ordering = ['order', 'name']
+
+    def get_queryset(self):
+        """
+        Prefetch the nested skills so a page costs the same queries for 1 or many categories.
+        Precarga las habilidades anidadas para que una página cueste lo mismo con 1 o muchas categorías.
+        """
+        skills = Skill.objects.order_by('category', 'order', 'name')
+        return super().get_queryset().prefetch_related(Prefetch('skills', queryset=skills))
+
+    def get_conditional_querysets(self):
+        """Include the nested skills rendered inside each category."""
+        querysets = super().get_conditional_querysets()
+        return querysets + [Skill.objects.filter(category__in=querysets[0])]
@@ -11,3 +11,15 @@ class SkillsConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.skills'
+
+    def ready(self):
+        """Register versioned caching, full-text search and query budgets."""
+        from core import budgets, cache, search
+        from .api.views import SkillCategoryViewSet, SkillViewSet
+        from .models import Skill, SkillCategory
+
+        cache.register(Skill)
+        cache.register(SkillCategory)
+        search.register(Skill, ["name", "description"])
+        budgets.register(SkillViewSet, list=4, retrieve=3, featured=3, by_category=2)
+        budgets.register(SkillCategoryViewSet, list=5, retrieve=4)
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['category', 'order', 'name', 'id'], name='skill_category_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['category', 'order', 'name', 'id'], name='skill_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skillcategory',
+            index=models.Index(fields=['order', 'name', 'id'], name='skillcategory_order_idx'),
+        ),
+    ]
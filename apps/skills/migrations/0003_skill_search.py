@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from core.search import CreateSearchTable
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0002_indexes'),
+    ]
+
+    operations = [
+        CreateSearchTable('skill', ['name', 'description']),
+    ]
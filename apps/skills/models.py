@@ -24,6 +24,9 @@ class SkillCategory(models.Model):
         verbose_name = _("Skill Category")
         verbose_name_plural = _("Skill Categories")
         ordering = ["order", "name"]
+        indexes = [
+            models.Index(fields=["order", "name", "id"], name="skillcategory_order_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -58,6 +61,12 @@ class Skill(models.Model):
         verbose_name = _("Skill")
         verbose_name_plural = _("Skills")
         ordering = ["category__order", "order", "name"]
+        indexes = [
+            # Skills of a category in display order (by_category prefetch).
+            models.Index(fields=["category", "order", "name", "id"], name="skill_category_order_idx"),
+            # Only featured rows, for the featured action.
+            models.Index(fields=["category", "order", "name", "id"], condition=models.Q(is_featured=True), name="skill_featured_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.category.name})"
@@ -3,6 +3,8 @@ Tests for Skill and SkillCategory API views.
 """
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 from apps.skills.models import Skill, SkillCategory
@@ -577,3 +579,257 @@ class TestSkillCategoryViewSet:
 
         assert len(frontend['skills']) == 2
         assert len(backend['skills']) == 1
+
+
+@pytest.mark.django_db
+class TestSkillsByCategoryCache:
+    """Test suite for the prefetched, cached by_category action."""
+
+    url = '/api/skills/by_category/'
+
+    def test_by_category_query_count_is_constant(self, api_client, django_assert_num_queries):
+        """Test that a cold request uses two queries regardless of row count."""
+        for index in range(3):
+            category = SkillCategory.objects.create(name=f'Category {index}', order=index)
+            for position in range(4):
+                Skill.objects.create(name=f'Skill {index}-{position}', category=category, order=position)
+
+        with django_assert_num_queries(2):
+            response = api_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 3
+        assert all(len(category['skills']) == 4 for category in response.data)
+        assert response.data[0]['skills'][0]['categoryName'] == 'Category 0'
+
+    def test_by_category_skills_follow_model_ordering(self, api_client, sample_category):
+        """Test that nested skills are ordered by order, then name."""
+        Skill.objects.create(name='Zeta', category=sample_category, order=0)
+        Skill.objects.create(name='Alpha', category=sample_category, order=1)
+        Skill.objects.create(name='Beta', category=sample_category, order=0)
+
+        response = api_client.get(self.url)
+
+        names = [skill['name'] for skill in response.data[0]['skills']]
+        assert names == ['Beta', 'Zeta', 'Alpha']
+
+    def test_by_category_warm_request_hits_no_database(self, api_client, sample_skill, django_assert_num_queries):
+        """Test that a cached response is served without queries."""
+        api_client.get(self.url)
+
+        with django_assert_num_queries(0):
+            response = api_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[0]['skills'][0]['name'] == 'Python'
+
+    def test_by_category_cache_invalidated_on_skill_save(self, api_client, sample_skill):
+        """Test that saving a skill invalidates the cached response."""
+        api_client.get(self.url)
+
+        sample_skill.name = 'Python 3'
+        sample_skill.save()
+        response = api_client.get(self.url)
+
+        assert response.data[0]['skills'][0]['name'] == 'Python 3'
+
+    def test_by_category_cache_invalidated_on_category_delete(self, api_client, sample_category, sample_skill):
+        """Test that deleting a category invalidates the cached response."""
+        api_client.get(self.url)
+
+        sample_category.delete()
+        response = api_client.get(self.url)
+
+        assert response.data == []
+
+
+    def test_by_category_stale_while_refreshing(self, api_client, sample_skill, monkeypatch):
+        """Test that other workers keep the previous tree while one refreshes it."""
+        from django.core.cache import cache
+        from core import cache as api_cache
+
+        api_client.get(self.url)
+        sample_skill.name = 'Python 3'
+        sample_skill.save()
+        monkeypatch.setattr(api_cache, '_lock_key', lambda key: 'other-worker-lock')
+        cache.set('other-worker-lock', 1)
+
+        response = api_client.get(self.url)
+
+        assert response['X-Cache'] == 'stale'
+        assert response.data[0]['skills'][0]['name'] == 'Python'
+        assert 'ETag' not in response
+
+
+@pytest.mark.django_db
+class TestSkillListQueries:
+    """Test suite for the query budget of the skills list."""
+
+    url = '/api/skills/'
+
+    def _count_list_queries(self, api_client):
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        return len(context.captured_queries)
+
+    def test_list_query_count_independent_of_page_size(self, api_client, sample_category):
+        """Test that a page of skills costs the same queries for 1 or many rows."""
+        Skill.objects.create(name='Skill 0', category=sample_category)
+        single_row_queries = self._count_list_queries(api_client)
+
+        for index in range(1, 8):
+            other_category = SkillCategory.objects.create(name=f'Category {index}')
+            Skill.objects.create(name=f'Skill {index}', category=other_category)
+        many_rows_queries = self._count_list_queries(api_client)
+
+        assert single_row_queries == many_rows_queries
+        # Two conditional GET aggregates, the page COUNT and the page SELECT.
+        assert many_rows_queries <= 4
+
+    def test_list_renders_category_name(self, api_client, sample_skill):
+        """Test that the joined category still renders as its name."""
+        response = api_client.get(self.url)
+
+        results = response.data['results'] if 'results' in response.data else response.data
+        assert results[0]['category'] == 'Programming'
+
+    def test_list_defers_unused_category_columns(self, api_client, sample_skill):
+        """Test that the list query does not read the category description."""
+        with CaptureQueriesContext(connection) as context:
+            api_client.get(self.url)
+
+        select_sql = context.captured_queries[-1]['sql']
+        assert 'skills_skillcategory"."name"' in select_sql
+        assert 'skills_skillcategory"."description"' not in select_sql
+
+
+@pytest.mark.django_db
+class TestSkillFullTextSearch:
+    """Test suite for the full-text ?search= backend on skills."""
+
+    def test_search_uses_full_text_table(self, api_client, sample_skill):
+        """Test that ?search= on skills queries the shadow search table."""
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get('/api/skills/?search=pyth')
+
+        assert [skill['name'] for skill in response.data['results']] == ['Python']
+        assert 'skills_skill_search' in context.captured_queries[-1]['sql']
+
+    def test_search_ranks_name_matches_first(self, api_client, sample_category):
+        """Test that a name match outranks a description match."""
+        Skill.objects.create(name='Flask', category=sample_category, description='A Python micro framework', order=0)
+        Skill.objects.create(name='Python', category=sample_category, order=9)
+
+        response = api_client.get('/api/skills/?search=python')
+
+        assert [skill['name'] for skill in response.data['results']] == ['Python', 'Flask']
+
+
+@pytest.mark.django_db
+class TestSkillIndexUsage:
+    """Test suite proving skill endpoints are served by their indexes."""
+
+    def test_by_category_uses_ordering_indexes(self, explain_endpoint, sample_skill):
+        """Test that both by_category queries read their ordering indexes."""
+        plans = explain_endpoint('/api/skills/by_category/')
+
+        assert 'skillcategory_order_idx' in plans
+        assert 'skill_category_order_idx' in plans
+
+    def test_categories_list_uses_ordering_index(self, explain_endpoint, sample_category):
+        """Test that the categories list reads the (order, name) index."""
+        assert 'skillcategory_order_idx' in explain_endpoint('/api/skill-categories/')
+
+    def test_featured_uses_partial_index(self, explain_endpoint, featured_skill):
+        """Test that the featured action reads the partial index."""
+        assert 'skill_featured_idx' in explain_endpoint('/api/skills/featured/')
+
+
+@pytest.mark.django_db
+class TestSkillConditionalGet:
+    """Test suite for ETag validation on skill endpoints."""
+
+    def test_by_category_not_modified_without_queries(self, api_client, sample_skill, django_assert_num_queries):
+        """Test that by_category answers 304 from its version counter alone."""
+        etag = api_client.get('/api/skills/by_category/')['ETag']
+
+        with django_assert_num_queries(0):
+            response = api_client.get('/api/skills/by_category/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_by_category_etag_changes_on_skill_delete(self, api_client, sample_skill):
+        """Test that deleting a skill invalidates the by_category ETag."""
+        etag = api_client.get('/api/skills/by_category/')['ETag']
+
+        sample_skill.delete()
+
+        response = api_client.get('/api/skills/by_category/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_skill_list_etag_tracks_category_names(self, api_client, sample_category, sample_skill):
+        """Test that renaming a category invalidates skill lists that render its name."""
+        etag = api_client.get('/api/skills/')['ETag']
+
+        sample_category.name = 'Languages'
+        sample_category.save()
+
+        response = api_client.get('/api/skills/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_category_detail_tracks_nested_skills(self, api_client, sample_category, sample_skill):
+        """Test that editing a nested skill invalidates its category's ETag."""
+        url = f'/api/skill-categories/{sample_category.id}/'
+        etag = api_client.get(url)['ETag']
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        Skill.objects.create(name='Go', category=sample_category)
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestSkillSparseFieldsets:
+    """Test suite for ?fields= / ?omit= on skill endpoints."""
+
+    def test_list_fields_with_joined_category(self, api_client, sample_skill):
+        """Test that sparse lists still join the category in one query."""
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get('/api/skills/?fields=id,name,category')
+
+        assert response.data['results'] == [{'id': sample_skill.id, 'name': sample_skill.name, 'category': 'Programming'}]
+        select_sql = context.captured_queries[-1]['sql']
+        assert '"skills_skill"."description"' not in select_sql
+        assert 'skills_skillcategory"."name"' in select_sql
+
+    def test_featured_category_name(self, api_client, featured_skill):
+        """Test that categoryName traverses the joined category."""
+        response = api_client.get('/api/skills/featured/?fields=name,categoryName')
+
+        assert response.data == [{'name': featured_skill.name, 'categoryName': 'Programming'}]
+
+    def test_category_omit_nested_skills(self, api_client, sample_skill):
+        """Test that categories can drop their nested skills."""
+        response = api_client.get('/api/skill-categories/?omit=skills,description')
+
+        assert 'skills' not in response.data['results'][0]
+        assert response.data['results'][0]['name'] == 'Programming'
+
+    def test_by_category_fieldsets_are_cached_apart(self, api_client, sample_skill):
+        """Test that by_category applies the fieldset and caches each one separately."""
+        full = api_client.get('/api/skills/by_category/')
+        sparse = api_client.get('/api/skills/by_category/?fields=name,skills')
+        omitted = api_client.get('/api/skills/by_category/?omit=skills')
+
+        assert set(full.data[0]) > {'name', 'skills', 'description'}
+        assert set(sparse.data[0]) == {'name', 'skills'}
+        assert sparse.data[0]['skills'][0]['name'] == sample_skill.name
+        assert 'skills' not in omitted.data[0]
+        assert 'skills' in api_client.get('/api/skills/by_category/').data[0]
+
+    def test_by_category_unknown_field(self, api_client, sample_skill):
+        """Test that by_category rejects unknown fields like the list does."""
+        response = api_client.get('/api/skills/by_category/?fields=bogus')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -6,6 +6,8 @@ import pytest
 from django.conf import settings
 from django.test import RequestFactory
 
+pytest_plugins = ['core.testing']
+
 
 @pytest.fixture(scope='session')
 def django_db_setup():
@@ -28,6 +30,49 @@ def media_storage(settings, tmpdir):
     settings.MEDIA_ROOT = tmpdir.strpath
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache so cached responses never leak."""
+    from django.core.cache import cache
+    from core.cache import get_local_cache
+    cache.clear()
+    get_local_cache().clear()
+    yield
+    cache.clear()
+    get_local_cache().clear()
+
+
+@pytest.fixture
+def explain_endpoint(client):
+    """
+    Return a function that GETs a URL and returns the query plans of its SELECTs.
+
+    Sequential scans are disabled on PostgreSQL so tiny test tables still
+    show which index the planner can use.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    def explain(url):
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == 200
+
+        prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+        plans = []
+        with connection.cursor() as cursor:
+            for query in context.captured_queries:
+                if query['sql'].startswith('SELECT'):
+                    cursor.execute(prefix + query['sql'])
+                    plans.append(' '.join(str(column) for row in cursor.fetchall() for column in row))
+        return '\n'.join(plans)
+
+    return explain
+
+
 @pytest.fixture
 def api_client():
     """Fixture for DRF API client - available across all test modules."""
@@ -0,0 +1,28 @@
+"""
+Core admin configuration.
+Configuración de admin para core.
+"""
+
+from django.contrib import admin
+from django.utils import timezone
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Admin configuration for Job model."""
+
+    list_display = ["task", "status", "attempts", "max_attempts", "run_at", "finished_at"]
+    list_filter = ["status", "task"]
+    search_fields = ["task", "last_error"]
+    ordering = ["-run_at"]
+    readonly_fields = ["locked_by", "locked_at", "created_at", "finished_at"]
+    actions = ["retry_now"]
+
+    @admin.action(description="Retry selected jobs now")
+    def retry_now(self, request, queryset):
+        """Queue failed or waiting jobs to run on the next claim."""
+        updated = queryset.exclude(status=Job.Status.RUNNING).update(
+            status=Job.Status.QUEUED, run_at=timezone.now(), attempts=0, finished_at=None
+        )
+        self.message_user(request, f"{updated} job(s) queued.")
@@ -0,0 +1,24 @@
+"""
+Core app configuration.
+Configuración de la app core.
+"""
+
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+class CoreConfig(AppConfig):
+    """Project-wide services: search index, background jobs, shared management commands."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
+    verbose_name = "Core"
+
+    def ready(self):
+        """Create the cache table after every migrate, check the cache and register the image variants job."""
+        from django.core import checks
+        from core import cache, images, jobs
+
+        post_migrate.connect(cache.install_cache_table, sender=self, dispatch_uid="core-cache-table-install")
+        checks.register(cache.check_shared_cache, checks.Tags.caches)
+        jobs.register(images.TASK, images.process_variants)
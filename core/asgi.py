@@ -5,6 +5,10 @@ Configuración ASGI para el proyecto portfolio.
 It exposes the ASGI callable as a module-level variable named ``application``.
 Expone el callable ASGI como una variable a nivel de módulo llamada ``application``.
 
+Set ``ASYNC_VIEWS=True`` to serve the API reads as coroutines (see
+"ASGI Deployment" in docs/en/installation.md).
+Usar ``ASYNC_VIEWS=True`` para servir las lecturas de la API como corrutinas.
+
 For more information on this file, see
 Para más información sobre este archivo, ver
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
@@ -0,0 +1,140 @@
+"""
+Native async read actions for the API viewsets (ASGI).
+Acciones de lectura asíncronas nativas para los viewsets de la API (ASGI).
+
+DRF views are synchronous, so under an ASGI server every request used to
+hold a worker thread from the first middleware to the last byte. With
+``ASYNC_VIEWS = True`` the routes of viewsets using ``AsyncReadMixin``
+become coroutines: anonymous GETs of actions that have an ``a<action>``
+variant (``alist``, ``aretrieve``, ``afeatured``...) load rows with the
+async ORM and serialize and render on the event loop. The permission,
+cache and conditional-GET phase (``initial()``) and the cache store after
+a miss each run in one short ``sync_to_async`` call, so the request only
+holds a thread while it talks to the cache or the database.
+
+Everything else keeps the synchronous DRF path, run through
+``sync_to_async``: writes, logged-in users (their ``request.user`` is a lazy
+database lookup), actions without an async variant and the query
+parameters listed in ``async_sync_params`` (full-text search, keyset
+cursors and streaming, whose internals are synchronous). The setting is read
+when the URLs are loaded; under WSGI keep it off, as async views would be
+run through ``async_to_sync`` on every request.
+Con ``ASYNC_VIEWS = True`` las rutas se vuelven corrutinas: los GET
+anónimos de acciones con variante ``a<acción>`` usan el ORM asíncrono y
+serializan en el bucle de eventos; el resto sigue por la vía síncrona.
+"""
+
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ValidationError
+from django.http import Http404, HttpResponse
+from rest_framework.response import Response
+
+
+class AsyncReadMixin:
+    """
+    Serve ``a<action>`` coroutines for anonymous GETs when ``ASYNC_VIEWS`` is on.
+    Sirve las corrutinas ``a<acción>`` para GET anónimos si ``ASYNC_VIEWS`` está activo.
+
+    Must come first in the bases of a ``GenericViewSet``.
+    """
+
+    async_sync_params = ("search", "cursor", "stream")
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        if not getattr(settings, "ASYNC_VIEWS", False):
+            return view
+        sync_view = sync_to_async(lambda *args, **kwargs: cls.detach(view(*args, **kwargs)))
+
+        @wraps(view)
+        async def async_view(request, *args, **kwargs):
+            action = actions.get(request.method.lower())
+            if request.method != "GET" or not hasattr(cls, f"a{action}") or not cls.can_run_async(request):
+                return await sync_view(request, *args, **kwargs)
+            self = cls(**initkwargs)
+            self.action_map = actions
+            for method, name in actions.items():
+                setattr(self, method, getattr(self, name))
+            self.request = request
+            self.args = args
+            self.kwargs = kwargs
+            return await self.adispatch(request, *args, **kwargs)
+
+        return async_view
+
+    @classmethod
+    def can_run_async(cls, request):
+        """Anonymous requests (no lazy user) without sync-only parameters."""
+        user = getattr(request, "user", None)
+        if user is not None and type(user) is not AnonymousUser:
+            return False
+        return not any(param in request.GET for param in cls.async_sync_params)
+
+    async def adispatch(self, request, *args, **kwargs):
+        """
+        ``APIView.dispatch()`` for ``a<action>`` handlers.
+        ``APIView.dispatch()`` para los manejadores ``a<acción>``.
+        """
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            response = await getattr(self, f"a{self.action}")(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        if getattr(self, "response_cache", None) is not None:
+            response = await sync_to_async(self.finalize_response)(request, response, *args, **kwargs)
+        else:
+            response = self.finalize_response(request, response, *args, **kwargs)
+        self.response = response
+        return self.detach(response)
+
+    @staticmethod
+    def detach(response):
+        """
+        Render a DRF response into a plain ``HttpResponse``.
+        Renderiza una respuesta DRF en un ``HttpResponse`` simple.
+
+        Django renders deferred responses through ``sync_to_async``; rendering
+        here keeps the encoding on the event loop.
+        """
+        if not isinstance(response, Response):
+            return response
+        response.render()
+        plain = HttpResponse(response.content, status=response.status_code)
+        for header, value in response.items():
+            plain[header] = value
+        return plain
+
+    async def aget_object(self):
+        """Async ``get_object()``: a 404 for missing rows and malformed lookups."""
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            instance = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+        return await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer([row async for row in queryset], many=True).data)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return Response(self.get_serializer(await self.aget_object()).data)
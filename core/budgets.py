@@ -0,0 +1,66 @@
+"""
+Per-endpoint query budgets.
+Presupuestos de consultas por endpoint.
+
+Each app declares, next to its other registrations, the maximum number of
+database queries every read action may run. The ``core.testing`` pytest
+plugin turns the registry into one test per route that seeds 1 and then N
+rows and fails when an action exceeds its budget or when its query count
+grows with the number of rows, the signature of an N+1.
+Cada app declara el número máximo de consultas de cada acción de lectura. El
+plugin ``core.testing`` genera una prueba por ruta que falla si la acción
+supera su presupuesto o si sus consultas crecen con el número de filas.
+"""
+
+from collections import namedtuple
+
+from core.routes import iter_routes
+
+_registry = {}
+
+BudgetCase = namedtuple("BudgetCase", "url_name view action budget detail")
+
+
+def register(view, **budgets):
+    """
+    Set the maximum query count of each ``action`` of ``view``.
+    Define el máximo de consultas de cada acción de ``view``.
+
+    ViewSets are keyed by action name (``list``, ``retrieve``, ``featured``);
+    plain API views use ``get``.
+    """
+    _registry.setdefault(view, {}).update(budgets)
+
+
+def registered_budgets():
+    """Return the registered views and their budgets."""
+    return {view: dict(budgets) for view, budgets in _registry.items()}
+
+
+def get_budget(view, action):
+    """Return the query budget of ``action`` on ``view``, or None if undeclared."""
+    for klass in getattr(view, "__mro__", (view,)):
+        if action in _registry.get(klass, {}):
+            return _registry[klass][action]
+    return None
+
+
+def iter_cases():
+    """
+    Yield a ``BudgetCase`` for every GET route that has a budget.
+    Genera un ``BudgetCase`` por cada ruta GET con presupuesto.
+
+    Routes that take URL kwargs other than ``pk`` are skipped.
+    """
+    for route in iter_routes():
+        if route.kwargs - {"pk"}:
+            continue
+        budget = get_budget(route.view, route.action)
+        if budget is None:
+            continue
+        yield BudgetCase(route.url_name, route.view, route.action, budget, "pk" in route.kwargs)
+
+
+def budget_cases():
+    """Return the budgeted routes sorted by URL name."""
+    return sorted(iter_cases(), key=lambda case: case.url_name)
@@ -0,0 +1,550 @@
+"""
+Versioned cache helpers shared by the API apps.
+Utilidades de caché versionada compartidas por las apps de la API.
+
+Cache keys embed a version counter stored in the cache itself. Bumping the
+counter invalidates every key built from it without having to find and delete
+them one by one.
+Las llaves de caché incluyen un contador de versión guardado en la propia caché.
+Incrementar el contador invalida todas las llaves construidas con él.
+
+Registered models get their own counter (``model:<app_label>.<model>``),
+bumped on every post_save/post_delete, on changes to their many-to-many
+relations and when image variants are stored. Code that writes with a
+queryset ``update()`` calls :func:`bump_model_version` itself.
+Los modelos registrados tienen su propio contador, incrementado en cada
+post_save/post_delete; quien escribe con ``update()`` lo incrementa a mano.
+"""
+
+import contextvars
+import hashlib
+import math
+import os
+import random
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.exceptions import EmptyResultSet
+from django.db import transaction
+from django.core.signals import request_finished, request_started
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from core.images import variants_generated
+from core.local_cache import MISSING, LRUCache
+
+VERSION_KEY_PREFIX = "portfolio:version"
+
+
+def _version_key(namespace):
+    return f"{VERSION_KEY_PREFIX}:{namespace}"
+
+
+def _initial_version():
+    # Seed counters from the clock so a counter that was evicted never
+    # restarts at a value whose keys may still be cached.
+    # Semilla basada en el reloj para no reutilizar versiones ya cacheadas.
+    return int(time.time() * 1000)
+
+
+def get_version(namespace):
+    """
+    Return the current version counter for a namespace.
+    Retorna el contador de versión actual de un espacio de nombres.
+    """
+    return get_versions([namespace])[0]
+
+
+def get_versions(namespaces):
+    """
+    Return the version counters of several namespaces in one cache round trip.
+    Retorna los contadores de varios espacios de nombres en un solo acceso a la caché.
+    """
+    keys = [_version_key(namespace) for namespace in namespaces]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        version = found.get(key)
+        if version is None:
+            cache.add(key, _initial_version(), timeout=None)
+            version = cache.get(key)
+        versions.append(version)
+    return versions
+
+
+def bump_version(namespace):
+    """
+    Increment the version counter of a namespace, invalidating its keys.
+    Incrementa el contador de versión de un espacio de nombres, invalidando sus llaves.
+    """
+    key = _version_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Counter evicted or never created: start a fresh one.
+        # Contador expulsado o nunca creado: crear uno nuevo.
+        cache.add(key, _initial_version(), timeout=None)
+        return cache.incr(key)
+
+
+def make_key(prefix, *namespaces):
+    """
+    Build a cache key that embeds the versions of the given namespaces.
+    Construye una llave de caché que incluye las versiones de los espacios de nombres dados.
+    """
+    versions = ".".join(f"{namespace}{version}" for namespace, version in zip(namespaces, get_versions(namespaces)))
+    return f"portfolio:{prefix}:{versions}"
+
+
+_registry = []
+
+
+def register(model):
+    """
+    Give ``model`` a version counter that every write bumps.
+    Da a ``model`` un contador de versión que cada escritura incrementa.
+    """
+    if model in _registry:
+        return
+    _registry.append(model)
+    uid = model._meta.label_lower
+    post_save.connect(_bump_sender, sender=model, dispatch_uid=f"cache-save-{uid}")
+    post_delete.connect(_bump_sender, sender=model, dispatch_uid=f"cache-delete-{uid}")
+    variants_generated.connect(_bump_sender, sender=model, dispatch_uid=f"cache-variants-{uid}")
+    for field in model._meta.many_to_many:
+        m2m_changed.connect(_bump_relation, sender=field.remote_field.through, dispatch_uid=f"cache-m2m-{uid}-{field.name}")
+
+
+def registered_models():
+    """Return the models with a version counter."""
+    return list(_registry)
+
+
+def model_namespace(model):
+    return f"model:{model._meta.label_lower}"
+
+
+def bump_model_version(model):
+    """
+    Invalidate every key built from ``model``'s counter.
+    Invalida todas las llaves construidas con el contador de ``model``.
+
+    The counter is bumped now and again once the transaction commits: a
+    reader that cached the pre-commit rows in between used the first bump,
+    so the second one retires its entry.
+    El contador se incrementa ahora y otra vez al confirmar la transacción.
+    """
+    namespace = model_namespace(model)
+
+    def bump():
+        bump_version(namespace)
+        bump_generation()
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def get_model_versions(*models):
+    """Return the current counters of ``models``."""
+    return get_versions([model_namespace(model) for model in models])
+
+
+def make_model_key(prefix, *models):
+    """
+    Build a cache key that embeds the versions of the given models.
+    Construye una llave de caché que incluye las versiones de los modelos dados.
+    """
+    return make_key(prefix, *(model_namespace(model) for model in models))
+
+
+def _bump_sender(sender, **kwargs):
+    bump_model_version(sender)
+
+
+def _bump_relation(sender, instance, model, action, **kwargs):
+    if not action.startswith("post_"):
+        return
+    for changed in {type(instance), model}:
+        if changed in _registry:
+            bump_model_version(changed)
+
+
+def cache_queryset(queryset, *models, evaluate=list, name="queryset", timeout=None):
+    """
+    Return ``evaluate(queryset)``, cached under the versions of ``models``.
+    Retorna ``evaluate(queryset)``, cacheado bajo las versiones de ``models``.
+
+    ``models`` defaults to the queryset's model; list every registered model
+    the query reads (joins, subqueries). The key hashes the SQL and its
+    parameters, so any filter change gets its own entry; ``name`` tells
+    apart different evaluations of the same queryset.
+    """
+    try:
+        sql = queryset.query.get_compiler(queryset.db).as_sql()
+    except EmptyResultSet:
+        return evaluate(queryset)
+    digest = hashlib.md5(repr((queryset.db, sql)).encode("utf-8"), usedforsecurity=False).hexdigest()
+    key = make_model_key(f"{name}:{queryset.model._meta.label_lower}:{digest}", *(models or (queryset.model,)))
+    result = cache.get(key)
+    if result is None:
+        result = evaluate(queryset)
+        cache.set(key, result, settings.API_CACHE_TIMEOUT if timeout is None else timeout)
+    return result
+
+
+# Stale-while-revalidate entries live under unversioned keys and record the
+# versions they were built from; a mismatch makes them stale, not missing.
+# Las entradas SWR viven bajo llaves sin versión y guardan las versiones
+# con las que se construyeron; si no coinciden están obsoletas, no ausentes.
+HIT, MISS, STALE, REFRESH = "hit", "miss", "stale", "refresh"
+LOCAL = "local"
+
+STATS_KEY_PREFIX = "portfolio:stats"
+STAT_EVENTS = (LOCAL, HIT, MISS, STALE, REFRESH)
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+_stats_flushed_at = time.monotonic()
+
+
+def record(event):
+    """
+    Count a cache event; counts reach the shared cache in batches.
+    Cuenta un evento de caché; los contadores llegan a la caché compartida en lotes.
+    """
+    global _stats_flushed_at
+    with _stats_lock:
+        _stats[event] += 1
+        due = time.monotonic() - _stats_flushed_at >= getattr(settings, "API_CACHE_STATS_FLUSH_INTERVAL", 10)
+        if due:
+            _stats_flushed_at = time.monotonic()
+    if due:
+        flush_stats()
+
+
+def flush_stats():
+    """Add this process' pending counts to the shared totals."""
+    with _stats_lock:
+        pending = dict(_stats)
+        _stats.clear()
+    for event, count in pending.items():
+        key = f"{STATS_KEY_PREFIX}:{event}"
+        if not cache.add(key, count, timeout=None):
+            try:
+                cache.incr(key, count)
+            except ValueError:
+                cache.set(key, count, timeout=None)
+
+
+def get_stats():
+    """
+    Return the hit/miss/stale/refresh totals of every process.
+    Retorna los totales de aciertos/fallos/obsoletos/refrescos de todos los procesos.
+    """
+    flush_stats()
+    totals = cache.get_many([f"{STATS_KEY_PREFIX}:{event}" for event in STAT_EVENTS])
+    return {event: totals.get(f"{STATS_KEY_PREFIX}:{event}", 0) for event in STAT_EVENTS}
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+    cache.delete_many([f"{STATS_KEY_PREFIX}:{event}" for event in STAT_EVENTS])
+
+
+def _lock_key(key):
+    return f"{key}:lock"
+
+
+def should_refresh_early(entry, now=None):
+    """
+    XFetch: refresh before expiry with a probability that grows as it nears.
+    XFetch: refresca antes de expirar con una probabilidad que crece al acercarse.
+
+    Entries that took ``delta`` seconds to compute start refreshing about
+    ``delta * beta`` seconds early, so one request usually renews a hot key
+    before it expires for everyone.
+    """
+    now = time.time() if now is None else now
+    beta = getattr(settings, "API_CACHE_XFETCH_BETA", 1.0)
+    return now - entry["delta"] * beta * math.log(1.0 - random.random()) >= entry["expires"]
+
+
+def lookup(key, versions):
+    """
+    Return ``(state, data)`` for a stale-while-revalidate entry.
+    Retorna ``(state, data)`` para una entrada stale-while-revalidate.
+
+    - ``HIT``: current data.
+    - ``STALE``: outdated data; another process holds the refresh lock.
+    - ``REFRESH`` / ``MISS``: the caller must compute and :func:`store` the
+      data (and holds the lock, if it could take it).
+
+    A miss with the lock taken waits up to ``API_CACHE_LOCK_WAIT`` seconds
+    for the other process before computing anyway.
+    """
+    entry = cache.get(key)
+    if entry is not None and entry["versions"] == versions and not should_refresh_early(entry):
+        return HIT, entry["data"]
+    if cache.add(_lock_key(key), 1, getattr(settings, "API_CACHE_LOCK_TIMEOUT", 30)):
+        return (MISS if entry is None else REFRESH), None
+    if entry is not None:
+        return STALE, entry["data"]
+
+    deadline = time.monotonic() + getattr(settings, "API_CACHE_LOCK_WAIT", 0.5)
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None and entry["versions"] == versions:
+            return HIT, entry["data"]
+    return MISS, None
+
+
+def store(key, versions, data, delta, timeout=None):
+    """
+    Save a computed value and release the refresh lock.
+    Guarda un valor calculado y libera el candado de refresco.
+
+    The entry is kept ``API_CACHE_STALE_TIMEOUT`` seconds past its expiry so
+    it can still be served while it is being refreshed.
+    """
+    timeout = settings.API_CACHE_TIMEOUT if timeout is None else timeout
+    entry = {"versions": versions, "data": data, "delta": delta, "expires": time.time() + timeout}
+    cache.set(key, entry, timeout + getattr(settings, "API_CACHE_STALE_TIMEOUT", 300))
+    release(key)
+
+
+def release(key):
+    cache.delete(_lock_key(key))
+
+
+def cached_call(key, models, compute, timeout=None, local=False):
+    """
+    Return ``(state, compute())`` with stampede protection and stale serving.
+    Retorna ``(state, compute())`` con protección contra estampidas.
+
+    ``local=True`` puts the per-process LRU in front of the shared cache;
+    use it only for small values read on most requests.
+    """
+    if local:
+        data = local_get(key)
+        if data is not MISSING:
+            record(LOCAL)
+            return LOCAL, data
+    versions = get_model_versions(*models)
+    state, data = lookup(key, versions)
+    record(state)
+    if state == STALE:
+        return state, data
+    if state != HIT:
+        started = time.monotonic()
+        try:
+            data = compute()
+        except BaseException:
+            release(key)
+            raise
+        store(key, versions, data, time.monotonic() - started, timeout)
+    if local:
+        local_set(key, data)
+    return state, data
+
+
+# Second tier: a per-process LRU in front of the shared cache for tiny, hot
+# values. Any model write bumps one shared generation number; each process
+# reads it at most once per request and drops its LRU when it moved.
+# Segundo nivel: un LRU por proceso delante de la caché compartida. Cada
+# escritura incrementa un número de generación compartido que cada proceso
+# lee como mucho una vez por petición.
+GENERATION_NAMESPACE = "generation"
+
+_local_cache = None
+_local_generation = None
+# None outside requests (always check), otherwise {"checked": bool}.
+_request_scope = contextvars.ContextVar("local_cache_request_scope", default=None)
+
+
+def get_local_cache():
+    global _local_cache
+    if _local_cache is None:
+        _local_cache = LRUCache(getattr(settings, "LOCAL_CACHE_MAX_BYTES", 1024 * 1024))
+    return _local_cache
+
+
+def bump_generation():
+    """Retire every process' LRU; this process' one right away."""
+    get_local_cache().clear()
+    bump_version(GENERATION_NAMESPACE)
+
+
+def sync_local_cache():
+    """
+    Drop the LRU if another process changed data since it was filled.
+    Vacía el LRU si otro proceso cambió datos desde que se llenó.
+
+    Reads the shared generation once per request; outside requests
+    (commands, shells) it reads it on every call.
+    """
+    global _local_generation
+    scope = _request_scope.get()
+    if scope is not None and scope["checked"]:
+        return
+    generation = get_version(GENERATION_NAMESPACE)
+    if scope is not None:
+        scope["checked"] = True
+    if generation != _local_generation:
+        get_local_cache().clear()
+        _local_generation = generation
+
+
+def local_get(key):
+    """Return the LRU value of ``key`` or ``MISSING``."""
+    sync_local_cache()
+    return get_local_cache().get(key, MISSING)
+
+
+def local_set(key, value):
+    get_local_cache().set(key, value)
+
+
+def _open_request_scope(**kwargs):
+    _request_scope.set({"checked": False})
+
+
+def _close_request_scope(**kwargs):
+    _request_scope.set(None)
+
+
+request_started.connect(_open_request_scope, dispatch_uid="local-cache-request-started")
+request_finished.connect(_close_request_scope, dispatch_uid="local-cache-request-finished")
+
+
+def check_shared_cache(app_configs=None, **kwargs):
+    """
+    System check: the version counters must be shared by every worker.
+    Chequeo del sistema: los contadores de versión deben ser compartidos.
+
+    With a per-process cache a write only invalidates the worker that made it,
+    and the generation number and single-flight locks stop working across
+    workers. ``WEB_CONCURRENCY`` (read by gunicorn and uvicorn) above 1 is an
+    error; any other non-debug run gets a warning.
+    """
+    if not settings.CACHES["default"]["BACKEND"].endswith("LocMemCache"):
+        return []
+    hint = "Set CACHE_BACKEND=database (or file on a shared disk)."
+    try:
+        workers = int(os.environ.get("WEB_CONCURRENCY") or 1)
+    except ValueError:
+        workers = 1
+    if workers > 1:
+        return [checks.Error(
+            f"CACHE_BACKEND=locmem with WEB_CONCURRENCY={workers}: other workers would serve stale responses.",
+            hint=hint,
+            id="core.E001",
+        )]
+    if not settings.DEBUG:
+        return [checks.Warning(
+            "CACHE_BACKEND=locmem is per process; run a single worker or use a shared cache.",
+            hint=hint,
+            id="core.W001",
+        )]
+    return []
+
+
+def install_cache_table(using="default", **kwargs):
+    """Create the ``database`` cache table after migrate (no-op for other backends)."""
+    call_command("createcachetable", database=using, verbosity=0)
+
+
+class CachedResponse(APIException):
+    """Raised from ``initial()`` to answer with cached data, skipping the handler."""
+
+    def __init__(self, data, state=HIT):
+        super().__init__()
+        self.data = data
+        self.state = state
+
+
+class CachedResponseMixin:
+    """
+    Cache the data of successful read actions, with stale-while-revalidate.
+    Cachea los datos de las acciones de lectura exitosas, con stale-while-revalidate.
+
+    ``cache_models`` lists every model the representation reads; any write to
+    one of them makes the entries stale. The key includes the full path, the
+    Accept header and the host, so pages, filters, sparse fieldsets and
+    absolute URLs never mix. Permissions run before the lookup, and streamed
+    responses are never stored.
+    Los permisos se comprueban antes de leer la caché y las respuestas en
+    streaming nunca se guardan.
+
+    After a write, one process takes the refresh lock and recomputes while
+    the others keep serving the previous data (without ETag, so clients
+    never pin it). ``X-Cache`` reports ``local``, ``hit``, ``miss``,
+    ``stale`` or ``refresh``.
+
+    Actions in ``local_cache_actions`` also keep their data in the
+    per-process LRU, for tiny payloads read on most requests.
+    """
+
+    cache_models = ()
+    cache_actions = ("list", "retrieve")
+    local_cache_actions = ()
+
+    def initial(self, request, *args, **kwargs):
+        self.response_cache = None
+        super().initial(request, *args, **kwargs)
+        if request.method not in ("GET", "HEAD") or self.action not in self.cache_actions or not self.cache_models:
+            return
+        key = self.get_response_cache_key()
+        local = self.action in self.local_cache_actions
+        if local:
+            data = local_get(key)
+            if data is not MISSING:
+                record(LOCAL)
+                raise CachedResponse(data, LOCAL)
+        versions = get_model_versions(*self.cache_models)
+        state, data = lookup(key, versions)
+        record(state)
+        if state == HIT and local:
+            local_set(key, data)
+        if state in (HIT, STALE):
+            raise CachedResponse(data, state)
+        self.response_cache = (key, versions, state, time.monotonic())
+
+    def get_response_cache_key(self):
+        request = self.request
+        digest = hashlib.md5(repr((
+            request.scheme, request.get_host(), request.get_full_path(), request.META.get("HTTP_ACCEPT", ""),
+        )).encode("utf-8"), usedforsecurity=False).hexdigest()
+        return f"portfolio:response:{self.basename}:{self.action}:{digest}"
+
+    def handle_exception(self, exc):
+        if isinstance(exc, CachedResponse):
+            if exc.state == STALE:
+                self.conditional_validators = None
+            response = Response(exc.data)
+            response["X-Cache"] = exc.state
+            return response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        pending = getattr(self, "response_cache", None)
+        if pending is None:
+            return response
+        key, versions, state, started = pending
+        self.response_cache = None
+        if response.status_code == 200 and isinstance(response, Response) and response.data is not None:
+            store(key, versions, response.data, time.monotonic() - started)
+            if self.action in self.local_cache_actions:
+                local_set(key, response.data)
+            response["X-Cache"] = state
+        else:
+            release(key)
+        return response
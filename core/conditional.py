@@ -0,0 +1,134 @@
+"""
+Conditional GET support (ETag / Last-Modified) for the API viewsets.
+Soporte de GET condicional (ETag / Last-Modified) para los viewsets de la API.
+
+Validators are computed in ``initial()``, before the handler runs, so a
+matching ``If-None-Match`` / ``If-Modified-Since`` is answered with 304
+without loading or serializing any row.
+Los validadores se calculan en ``initial()``, antes de ejecutar la acción,
+así una petición que coincide recibe 304 sin serializar nada.
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.exceptions import APIException
+
+from core.cache import cache_queryset
+
+
+class NotModified(APIException):
+    """Raised from ``initial()`` to short-circuit the request with a 304."""
+
+    status_code = 304
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+def make_etag(*parts):
+    """
+    Build a quoted ETag from any representable parts.
+    Construye un ETag entre comillas a partir de partes representables.
+    """
+    return quote_etag(hashlib.md5(repr(parts).encode("utf-8"), usedforsecurity=False).hexdigest())
+
+
+class ConditionalGetMixin:
+    """
+    Add ETag and Last-Modified to safe read actions and answer 304s early.
+    Añade ETag y Last-Modified a las acciones de lectura y responde 304 temprano.
+
+    Validators aggregate ``Max(updated_at)`` and ``Count(pk)`` over the
+    querysets returned by ``get_conditional_querysets()``: by default the
+    filtered queryset, narrowed to the requested row for detail actions.
+    Views add querysets for related rows they render (e.g. category names)
+    and may override ``get_validators()`` when a cheaper source exists.
+
+    The ETag is authoritative; Last-Modified is the newest ``updated_at`` and
+    cannot reflect deletions, so clients should prefer If-None-Match.
+
+    Views with ``cache_models`` cache the aggregates under those models'
+    version counters, so revalidating an unchanged resource reads no rows.
+    """
+
+    conditional_timestamp_field = "updated_at"
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.conditional_validators = None
+        if request.method not in ("GET", "HEAD"):
+            return
+
+        validators = self.get_validators()
+        if validators is None:
+            return
+        self.conditional_validators = validators
+        etag, last_modified = validators
+        response = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+        if response is not None:
+            raise NotModified(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            self.set_validator_headers(exc.response)
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code == 200:
+            self.set_validator_headers(response)
+        return response
+
+    def set_validator_headers(self, response):
+        validators = getattr(self, "conditional_validators", None)
+        if validators is None:
+            return
+        etag, last_modified = validators
+        response.headers.setdefault("ETag", etag)
+        if last_modified is not None:
+            response.headers.setdefault("Last-Modified", http_date(last_modified))
+
+    def get_representation_key(self):
+        """Request attributes that change the rendered body for the same rows."""
+        return (self.request.get_full_path(), self.request.META.get("HTTP_ACCEPT", ""))
+
+    def get_lookup_value(self):
+        return self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+
+    def get_conditional_querysets(self):
+        """Querysets whose rows make up the response of the current action."""
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.detail:
+            queryset = queryset.filter(**{self.lookup_field: self.get_lookup_value()})
+        return [queryset]
+
+    def aggregate_validators(self, queryset):
+        """Return the newest timestamp and the row count of ``queryset``."""
+        def aggregate(queryset):
+            return queryset.aggregate(last=Max(self.conditional_timestamp_field), count=Count("pk", distinct=True))
+
+        models = getattr(self, "cache_models", ())
+        if not models:
+            return aggregate(queryset)
+        return cache_queryset(queryset, *models, evaluate=aggregate, name="validators")
+
+    def get_validators(self):
+        """Return ``(etag, last_modified_timestamp)`` or None to skip validation."""
+        parts = [self.basename, self.action]
+        last_modified = None
+        for index, queryset in enumerate(self.get_conditional_querysets()):
+            stats = self.aggregate_validators(queryset.order_by())
+            if self.detail and index == 0 and not stats["count"]:
+                # Let the handler produce its 404.
+                return None
+            parts.append((stats["count"], stats["last"].isoformat() if stats["last"] else None))
+            if stats["last"] is not None:
+                timestamp = int(stats["last"].timestamp())
+                last_modified = max(last_modified or timestamp, timestamp)
+        parts.append(self.get_representation_key())
+        return make_etag(*parts), last_modified
@@ -0,0 +1,138 @@
+"""
+Path-based middleware dispatch: a lean chain for anonymous public reads.
+Despacho de middleware por ruta: una cadena mínima para lecturas anónimas.
+
+The public portfolio reads need no session, CSRF check, authenticated user
+or messages, yet every ``/api/`` GET paid for those middleware.
+``PathDispatchMiddleware`` sits first in ``MIDDLEWARE`` and sends
+safe-method requests under ``LEAN_MIDDLEWARE_PATHS`` that carry no session
+cookie through a second chain built from the rest of ``MIDDLEWARE`` minus
+``LEAN_MIDDLEWARE_SKIP``. Everything else (the admin, writes, logged-in
+users) keeps the full stack. Lean requests get an ``AnonymousUser`` so code
+reading ``request.user`` keeps working.
+Las peticiones seguras bajo ``LEAN_MIDDLEWARE_PATHS`` sin cookie de sesión
+pasan por una cadena sin los middleware de ``LEAN_MIDDLEWARE_SKIP``; el resto
+conserva la pila completa.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.base import BaseHandler
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading import import_string
+
+DISPATCHER = "core.dispatch.PathDispatchMiddleware"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def full_middleware():
+    """Return ``MIDDLEWARE`` without the dispatcher."""
+    return [path for path in settings.MIDDLEWARE if path != DISPATCHER]
+
+
+def lean_middleware():
+    """
+    Return the middleware after the dispatcher, minus ``LEAN_MIDDLEWARE_SKIP``.
+    Retorna los middleware posteriores al despachador, sin ``LEAN_MIDDLEWARE_SKIP``.
+    """
+    middleware = list(settings.MIDDLEWARE)
+    if DISPATCHER in middleware:
+        middleware = middleware[middleware.index(DISPATCHER) + 1:]
+    skipped = set(getattr(settings, "LEAN_MIDDLEWARE_SKIP", ()))
+    return [path for path in middleware if path not in skipped]
+
+
+class MiddlewareChain(BaseHandler):
+    """
+    Middleware chain built from an explicit list of paths.
+    Cadena de middleware construida con una lista explícita.
+
+    Mirrors ``BaseHandler.load_middleware()``, which always reads
+    ``settings.MIDDLEWARE``, and ends in the same URL resolution and view
+    call. With ``is_async`` the chain is a coroutine (ASGI) and sync-only
+    middleware are adapted the way Django adapts them.
+    """
+
+    def __init__(self, middleware, is_async=False):
+        super().__init__()
+        self.middleware = []
+        self._view_middleware = []
+        self._template_response_middleware = []
+        self._exception_middleware = []
+
+        handler = convert_exception_to_response(self._get_response_async if is_async else self._get_response)
+        handler_is_async = is_async
+        for path in reversed(middleware):
+            factory = import_string(path)
+            if not handler_is_async and getattr(factory, "sync_capable", True):
+                middleware_is_async = False
+            else:
+                middleware_is_async = getattr(factory, "async_capable", False)
+            adapted = self.adapt_method_mode(middleware_is_async, handler, handler_is_async)
+            try:
+                instance = factory(adapted)
+            except MiddlewareNotUsed:
+                continue
+            self.middleware.insert(0, path)
+            if hasattr(instance, "process_view"):
+                self._view_middleware.insert(0, self.adapt_method_mode(is_async, instance.process_view))
+            if hasattr(instance, "process_template_response"):
+                self._template_response_middleware.append(
+                    self.adapt_method_mode(is_async, instance.process_template_response)
+                )
+            if hasattr(instance, "process_exception"):
+                self._exception_middleware.append(self.adapt_method_mode(False, instance.process_exception))
+            handler = convert_exception_to_response(instance)
+            handler_is_async = middleware_is_async
+        self._middleware_chain = self.adapt_method_mode(is_async, handler, handler_is_async)
+
+    def __call__(self, request):
+        return self._middleware_chain(request)
+
+
+class PathDispatchMiddleware:
+    """
+    Route anonymous safe requests under the lean paths through a minimal chain.
+    Envía las peticiones anónimas seguras de las rutas ligeras por una cadena mínima.
+
+    Must be the first entry of ``MIDDLEWARE``. Removed at startup when
+    ``LEAN_MIDDLEWARE_ENABLED`` is off. Runs natively under ASGI, where the
+    lean chain is built async too.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "LEAN_MIDDLEWARE_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        self.prefixes = tuple(getattr(settings, "LEAN_MIDDLEWARE_PATHS", ("/api/",)))
+        self.session_cookie = settings.SESSION_COOKIE_NAME
+        self.lean = MiddlewareChain(lean_middleware(), is_async=self.async_mode)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if self.is_lean(request):
+            request.user = AnonymousUser()
+            return self.lean(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if self.is_lean(request):
+            request.user = AnonymousUser()
+            return await self.lean(request)
+        return await self.get_response(request)
+
+    def is_lean(self, request):
+        return (
+            request.method in SAFE_METHODS
+            and request.path_info.startswith(self.prefixes)
+            and self.session_cookie not in request.COOKIES
+        )
@@ -0,0 +1,23 @@
+"""
+File helpers shared by the build-time exports.
+Utilidades de archivos compartidas por las exportaciones.
+"""
+
+import os
+import tempfile
+
+
+def write_file(root, relative, content):
+    """
+    Write ``content`` to ``root / relative`` atomically.
+    Escribe ``content`` en ``root / relative`` de forma atómica.
+
+    The bytes go to a temporary file in the same directory that then
+    replaces the target, so readers never see a half-written file.
+    """
+    target = root / relative
+    target.parent.mkdir(parents=True, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    with os.fdopen(handle, "wb") as stream:
+        stream.write(content)
+    os.replace(temporary, target)
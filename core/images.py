@@ -0,0 +1,208 @@
+"""
+Responsive image derivatives generated in the background.
+Derivados de imagen responsivos generados en segundo plano.
+
+When a registered image field changes, resized copies are generated by a
+background job (``core.jobs``, run by ``run_worker``) so the upload request
+returns immediately and a failed generation is retried. Each width is
+written as WebP and JPEG next to the original
+(``<dir>/variants/<name>-<width>w.<ext>``) and the model stores:
+
+- ``<field>_width`` / ``<field>_height``: intrinsic size of the original.
+- ``<field>_variants``: ``{"source": name, "webp": {width: path}, "jpeg": {...}}``.
+
+Cuando cambia un campo de imagen registrado, las copias redimensionadas las
+genera un trabajo en segundo plano, así la subida responde enseguida.
+"""
+
+import posixpath
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.dispatch import Signal
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from core import jobs
+
+DEFAULT_WIDTHS = (320, 640, 1024, 1600)
+FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+TASK = "images.variants"
+
+_registry = []
+
+# Sent with ``instance`` and ``field`` once new variants are stored. The row is
+# written with a queryset update, so post_save does not fire.
+# Se envía con ``instance`` y ``field`` cuando se guardan nuevas variantes.
+variants_generated = Signal()
+
+
+def register(model, field):
+    """
+    Declare ``model.field`` as an image with generated variants.
+    Declara ``model.field`` como una imagen con variantes generadas.
+
+    The model saves call :func:`queue_variants`; the registry is what
+    ``generate_image_variants`` walks to backfill existing rows.
+    """
+    if (model, field) not in _registry:
+        _registry.append((model, field))
+
+
+def registered_fields():
+    """Return the registered ``(model, field)`` pairs."""
+    return list(_registry)
+
+
+def get_widths():
+    return tuple(sorted(getattr(settings, "IMAGE_VARIANT_WIDTHS", DEFAULT_WIDTHS)))
+
+
+def field_names(field):
+    """Return the width, height and variants attribute names for an image field."""
+    return f"{field}_width", f"{field}_height", f"{field}_variants"
+
+
+def needs_variants(instance, field):
+    """
+    Return True when the image changed since its variants were generated.
+    Retorna True cuando la imagen cambió desde que se generaron sus variantes.
+    """
+    image = getattr(instance, field)
+    variants = getattr(instance, field_names(field)[2]) or {}
+    return bool(image) and variants.get("source") != image.name
+
+
+def reset_variants(instance, field):
+    """Clear the stored size and variants when the image was removed."""
+    width_attr, height_attr, variants_attr = field_names(field)
+    setattr(instance, width_attr, None)
+    setattr(instance, height_attr, None)
+    setattr(instance, variants_attr, {})
+
+
+def queue_variants(instance, field):
+    """
+    Queue variant generation; it runs once the current transaction commits.
+    Encola la generación de variantes; se ejecuta al confirmar la transacción.
+
+    The job row is written in the same transaction as the upload, so it is
+    never lost between the commit and the queue; with ``JOBS_SYNC`` the job
+    runs inline once the transaction commits.
+    """
+    jobs.enqueue(TASK, {"label": instance._meta.label, "pk": instance.pk, "field": field})
+
+
+def process_variants(label, pk, field, force=False):
+    """
+    Generate and store the variants of one image, if it is still current.
+    Genera y guarda las variantes de una imagen, si sigue siendo la actual.
+
+    Returns the stored variants map, or None when there was nothing to do.
+    ``force`` regenerates variants that are already current (e.g. new widths).
+    """
+    model = apps.get_model(label)
+    instance = model._default_manager.filter(pk=pk).first()
+    if instance is None or not getattr(instance, field) or not (force or needs_variants(instance, field)):
+        return None
+
+    image = getattr(instance, field)
+    width_attr, height_attr, variants_attr = field_names(field)
+    delete_variants(image.storage, getattr(instance, variants_attr))
+    width, height, variants = build_variants(image)
+
+    values = {width_attr: width, height_attr: height, variants_attr: variants}
+    if any(f.name == "updated_at" for f in model._meta.concrete_fields):
+        # New URLs change the representation, so move the conditional GET validators.
+        # Las nuevas URLs cambian la representación, así que se mueven los validadores.
+        values["updated_at"] = timezone.now()
+    # Guard on the source name so a newer upload is never overwritten by a stale job.
+    # Se filtra por el nombre de origen para no pisar una subida más reciente.
+    updated = model._default_manager.filter(pk=pk, **{field: image.name}).update(**values)
+    if not updated:
+        delete_variants(image.storage, variants)
+        return None
+
+    for name, value in values.items():
+        setattr(instance, name, value)
+    if hasattr(instance, "refresh_snapshot"):
+        instance.refresh_snapshot()
+    variants_generated.send(sender=model, instance=instance, field=field)
+    return variants
+
+
+def build_variants(image):
+    """
+    Write every width/format of ``image`` to storage.
+    Escribe cada ancho/formato de ``image`` en el almacenamiento.
+
+    Widths larger than the original are skipped; the original width is always
+    included so small images still get WebP/JPEG copies.
+    """
+    with image.open("rb") as handle:
+        source = ImageOps.exif_transpose(Image.open(handle))
+        source.load()
+    width, height = source.size
+
+    widths = [w for w in get_widths() if w < width] + [width]
+    directory, filename = posixpath.split(image.name)
+    stem = posixpath.splitext(filename)[0]
+    variants = {"source": image.name}
+    for key, (pil_format, options) in FORMATS.items():
+        converted = flatten(source) if pil_format == "JPEG" else source.convert("RGBA")
+        variants[key] = {}
+        for target in widths:
+            resized = converted if target == width else converted.resize(
+                (target, max(1, round(height * target / width))), Image.LANCZOS
+            )
+            buffer = BytesIO()
+            resized.save(buffer, pil_format, **options)
+            name = posixpath.join(directory, "variants", f"{stem}-{target}w.{key}")
+            variants[key][str(target)] = image.storage.save(name, ContentFile(buffer.getvalue()))
+    return width, height, variants
+
+
+def flatten(image):
+    """
+    Return ``image`` as RGB with transparent pixels over white, for JPEG.
+    Retorna ``image`` en RGB con los píxeles transparentes sobre blanco, para JPEG.
+    """
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def delete_variants(storage, variants):
+    """Remove previously generated files listed in a variants map."""
+    for key in FORMATS:
+        for name in (variants or {}).get(key, {}).values():
+            storage.delete(name)
+
+
+def srcset(image, variants, build_url=None):
+    """
+    Return ``{"webp": "url 320w, ...", "jpeg": "..."}`` for an image.
+    Retorna ``{"webp": "url 320w, ...", "jpeg": "..."}`` para una imagen.
+
+    Empty while variants are pending or missing, so clients fall back to the
+    original URL. ``build_url`` can make URLs absolute (e.g. from a request).
+    """
+    if not image or (variants or {}).get("source") != image.name:
+        return {}
+    return {
+        key: ", ".join(
+            f"{(build_url or str)(image.storage.url(name))} {width}w"
+            for width, name in sorted(variants[key].items(), key=lambda item: int(item[0]))
+        )
+        for key in FORMATS
+        if variants.get(key)
+    }
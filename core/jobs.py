@@ -0,0 +1,344 @@
+"""
+Database-backed background jobs.
+Trabajos en segundo plano guardados en la base de datos.
+
+Slow work (notification e-mails, image variants) is stored as a ``Job`` row
+in the same database and run by ``python manage.py run_worker``, so there is
+no broker to deploy and a job enqueued inside a transaction only becomes
+visible when that transaction commits. Tasks are plain functions registered
+by name in an app's ``ready()``; their keyword arguments are the JSON
+payload of the row.
+
+Claiming uses ``SELECT ... FOR UPDATE SKIP LOCKED`` where the database has it
+(PostgreSQL), so concurrent workers never wait on each other's rows. SQLite
+serializes writes on its database lock, so there a conditional ``UPDATE ...
+WHERE status = 'queued'`` acts as a compare-and-swap and only one worker wins
+each row. A failing job is retried with exponential backoff until
+``max_attempts``. A running job's lease is renewed every third of
+``JOBS_LOCK_TIMEOUT``, so only a job whose worker died is requeued once its
+lock is older than that. Outcomes are fenced on the attempt that claimed the
+job: a worker that lost its lease never overwrites the newer run's result.
+Los trabajos se guardan como filas ``Job`` y los ejecuta ``run_worker``, sin
+broker externo. En PostgreSQL se reclaman con ``FOR UPDATE SKIP LOCKED``; en
+SQLite con un ``UPDATE`` condicional. Los fallos se reintentan con espera
+exponencial.
+"""
+
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.models import Job
+
+logger = logging.getLogger(__name__)
+
+MAINTENANCE_INTERVAL = 60
+ERROR_LENGTH = 4000
+
+_registry = {}
+
+
+def register(name, func, max_attempts=None):
+    """
+    Declare ``func`` as the task run for jobs named ``name``.
+    Declara ``func`` como la tarea de los trabajos llamados ``name``.
+    """
+    _registry[name] = (func, max_attempts)
+
+
+def registered_tasks():
+    """Return the registered task names."""
+    return sorted(_registry)
+
+
+def get_task(name):
+    return _registry[name]
+
+
+def enqueue(name, payload=None, delay=0, max_attempts=None):
+    """
+    Store a job for ``run_worker``; return the ``Job`` (None when run inline).
+    Guarda un trabajo para ``run_worker``; retorna el ``Job``.
+
+    ``JOBS_SYNC = True`` runs the task inline once the current transaction
+    commits instead, which is what development without a worker wants.
+    """
+    func, default_attempts = get_task(name)
+    payload = payload or {}
+    if getattr(settings, "JOBS_SYNC", False):
+        transaction.on_commit(lambda: _run_inline(name, func, payload))
+        return None
+    return Job.objects.create(
+        task=name,
+        payload=payload,
+        run_at=timezone.now() + timedelta(seconds=delay),
+        max_attempts=max_attempts or default_attempts or getattr(settings, "JOBS_MAX_ATTEMPTS", 5),
+    )
+
+
+def _run_inline(name, func, payload):
+    try:
+        func(**payload)
+    except Exception:
+        logger.exception("Job %s failed", name)
+
+
+def backoff(attempts):
+    """
+    Seconds to wait before retry number ``attempts``, with jitter.
+    Segundos de espera antes del reintento número ``attempts``, con variación.
+
+    Doubles from ``JOBS_RETRY_BACKOFF`` up to ``JOBS_RETRY_BACKOFF_MAX``; the
+    random half keeps jobs that failed together from retrying together.
+    """
+    base = getattr(settings, "JOBS_RETRY_BACKOFF", 10)
+    delay = min(getattr(settings, "JOBS_RETRY_BACKOFF_MAX", 3600), base * 2 ** max(attempts - 1, 0))
+    return random.uniform(delay / 2, delay)
+
+
+def claim(worker, limit=1):
+    """
+    Mark up to ``limit`` due jobs as running for ``worker`` and return them.
+    Marca hasta ``limit`` trabajos pendientes como en ejecución y los retorna.
+    """
+    now = timezone.now()
+    ready = Job.objects.filter(status=Job.Status.QUEUED, run_at__lte=now).order_by("run_at", "id")
+    values = {"status": Job.Status.RUNNING, "locked_by": worker, "locked_at": now, "attempts": F("attempts") + 1}
+
+    if connections[ready.db].features.has_select_for_update_skip_locked:
+        with transaction.atomic(using=ready.db):
+            pks = list(ready.select_for_update(skip_locked=True).values_list("pk", flat=True)[:limit])
+            Job.objects.filter(pk__in=pks).update(**values)
+    else:
+        # Each conditional UPDATE is atomic: a row another worker took first updates nothing.
+        # Cada UPDATE condicional es atómico: una fila tomada por otro worker no se actualiza.
+        pks = []
+        for pk in ready.values_list("pk", flat=True)[:limit * 2]:
+            if Job.objects.filter(pk=pk, status=Job.Status.QUEUED).update(**values):
+                pks.append(pk)
+                if len(pks) == limit:
+                    break
+    return list(Job.objects.filter(pk__in=pks, locked_by=worker).order_by("run_at", "id"))
+
+
+def run(job):
+    """
+    Run a claimed job and record its outcome; return True on success.
+    Ejecuta un trabajo reclamado y registra el resultado.
+    """
+    try:
+        func, _max_attempts = get_task(job.task)
+    except KeyError:
+        finish(job, Job.Status.FAILED, f"Unknown task {job.task!r}.")
+        return False
+    try:
+        with Heartbeat(job):
+            func(**job.payload)
+    except Exception:
+        logger.exception("Job %s #%s failed (attempt %s of %s)", job.task, job.pk, job.attempts, job.max_attempts)
+        retry(job, traceback.format_exc())
+        return False
+    finish(job, Job.Status.DONE)
+    return True
+
+
+def owned(job):
+    """
+    Filter a job by the claim that is running it, so a requeued job is never overwritten.
+    Filtra un trabajo por el reclamo que lo ejecuta.
+
+    Every claim increments ``attempts``, which makes it the lease token: a
+    newer claim of the same row, even by the same worker, no longer matches.
+    """
+    return Job.objects.filter(pk=job.pk, status=Job.Status.RUNNING, locked_by=job.locked_by, attempts=job.attempts)
+
+
+def renew(job):
+    """Extend the lease of a running job; return False once it was lost."""
+    return bool(owned(job).update(locked_at=timezone.now()))
+
+
+class Heartbeat:
+    """
+    Renew a job's lease from a background thread while it runs.
+    Renueva el bloqueo de un trabajo desde un hilo mientras se ejecuta.
+
+    Without it a job running longer than ``JOBS_LOCK_TIMEOUT`` would be
+    requeued and run twice at once.
+    """
+
+    def __init__(self, job, interval=None):
+        self.job = job
+        self.interval = interval or getattr(settings, "JOBS_LOCK_TIMEOUT", 600) / 3
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"jobs-heartbeat-{job.pk}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        try:
+            while not self._stop.wait(self.interval):
+                if not renew(self.job):
+                    logger.warning("Job %s #%s lost its lease; its outcome will be discarded", self.job.task, self.job.pk)
+                    return
+        except Exception:
+            logger.exception("Could not renew the lease of job %s #%s", self.job.task, self.job.pk)
+        finally:
+            connections.close_all()
+
+
+def finish(job, status, error=""):
+    owned(job).update(status=status, finished_at=timezone.now(), locked_by="", locked_at=None, last_error=error[-ERROR_LENGTH:])
+
+
+def retry(job, error):
+    """Requeue a failed job after its backoff, or fail it once attempts run out."""
+    if job.attempts >= job.max_attempts:
+        finish(job, Job.Status.FAILED, error)
+        return
+    owned(job).update(
+        status=Job.Status.QUEUED,
+        run_at=timezone.now() + timedelta(seconds=backoff(job.attempts)),
+        locked_by="",
+        locked_at=None,
+        last_error=error[-ERROR_LENGTH:],
+    )
+
+
+def requeue_expired():
+    """
+    Retry running jobs whose lock outlived ``JOBS_LOCK_TIMEOUT`` (dead workers).
+    Reintenta los trabajos cuyo bloqueo superó ``JOBS_LOCK_TIMEOUT``.
+    """
+    cutoff = timezone.now() - timedelta(seconds=getattr(settings, "JOBS_LOCK_TIMEOUT", 600))
+    expired = list(Job.objects.filter(status=Job.Status.RUNNING, locked_at__lt=cutoff))
+    for job in expired:
+        retry(job, f"Lock held by {job.locked_by} expired.")
+    return len(expired)
+
+
+def purge():
+    """
+    Delete finished jobs older than ``JOBS_RETENTION_DAYS``.
+    Elimina los trabajos terminados más antiguos que ``JOBS_RETENTION_DAYS``.
+    """
+    cutoff = timezone.now() - timedelta(days=getattr(settings, "JOBS_RETENTION_DAYS", 7))
+    deleted, _ = Job.objects.filter(status__in=[Job.Status.DONE, Job.Status.FAILED], finished_at__lt=cutoff).delete()
+    return deleted
+
+
+class Worker:
+    """
+    Claim and run jobs with up to ``concurrency`` threads.
+    Reclama y ejecuta trabajos con hasta ``concurrency`` hilos.
+
+    With ``concurrency=1`` jobs run in the calling thread. ``stop()`` (from a
+    signal handler) lets running jobs finish and claims nothing new.
+    """
+
+    def __init__(self, concurrency=1, poll_interval=1.0, name=None):
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.stopping = threading.Event()
+        self.processed = 0
+        self.failed = 0
+        self._maintained = None
+
+    def stop(self):
+        self.stopping.set()
+
+    def run(self, burst=False):
+        """
+        Work until stopped; with ``burst``, until no job is due. Return the jobs run.
+        Trabaja hasta detenerse; con ``burst``, hasta que no haya trabajos pendientes.
+        """
+        if self.concurrency == 1:
+            self._run_inline(burst)
+        else:
+            self._run_pool(burst)
+        return self.processed
+
+    def maintain(self):
+        if self._maintained is None or time.monotonic() - self._maintained >= MAINTENANCE_INTERVAL:
+            self._maintained = time.monotonic()
+            requeue_expired()
+            purge()
+
+    def record(self, succeeded):
+        self.processed += 1
+        self.failed += not succeeded
+
+    def _run_inline(self, burst):
+        while not self.stopping.is_set():
+            self.maintain()
+            jobs = claim(self.name)
+            if not jobs:
+                if burst:
+                    break
+                self.stopping.wait(self.poll_interval)
+                continue
+            self.record(self.execute(jobs[0]))
+            # Drop broken or expired connections between jobs, as a request would.
+            # Descarta conexiones rotas o vencidas entre trabajos, como una petición.
+            if not any(connection.in_atomic_block for connection in connections.all()):
+                close_old_connections()
+
+    def _run_pool(self, burst):
+        running = set()
+        with ThreadPoolExecutor(self.concurrency, thread_name_prefix="jobs") as pool:
+            while not self.stopping.is_set():
+                self.maintain()
+                free = self.concurrency - len(running)
+                jobs = claim(self.name, free) if free else []
+                running.update(pool.submit(self._run_in_thread, job) for job in jobs)
+                if not running:
+                    if burst:
+                        break
+                    self.stopping.wait(self.poll_interval)
+                    continue
+                done, running = wait(running, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self.record(future.result())
+            for future in wait(running).done:
+                self.record(future.result())
+
+    @staticmethod
+    def execute(job):
+        """
+        ``run()`` that survives database errors while recording the outcome.
+        ``run()`` que sobrevive a errores de base de datos al registrar el resultado.
+
+        The job keeps its lock and runs again once ``JOBS_LOCK_TIMEOUT`` expires.
+        """
+        try:
+            return run(job)
+        except Exception:
+            logger.exception("Could not record the outcome of job %s #%s", job.task, job.pk)
+            return False
+
+    @classmethod
+    def _run_in_thread(cls, job):
+        close_old_connections()
+        try:
+            return cls.execute(job)
+        finally:
+            close_old_connections()
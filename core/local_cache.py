@@ -0,0 +1,71 @@
+"""
+Bounded in-process LRU for tiny, hot cache values.
+LRU acotado en memoria del proceso para valores de caché pequeños y populares.
+
+Values are stored as the same objects callers get back, never copied, so
+they must be treated as read-only. The size of each value is its pickled
+length, measured once on insertion; least recently used values are evicted
+once the total exceeds ``max_bytes``.
+Los valores se guardan sin copiar, así que deben tratarse como de solo
+lectura; se expulsan los menos usados al superar ``max_bytes``.
+"""
+
+import pickle
+import threading
+from collections import OrderedDict
+
+MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe LRU bounded by the total pickled size of its values."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key, MISSING)
+            if entry is MISSING:
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value):
+        """
+        Store ``value``; returns False when it is larger than the whole cache.
+        Guarda ``value``; retorna False si es más grande que toda la caché.
+        """
+        size = len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+        return True
+
+    def delete(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -0,0 +1,4 @@
+"""
+Management package for core app.
+Paquete de gestión para la app core.
+"""
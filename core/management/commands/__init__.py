@@ -0,0 +1,4 @@
+"""
+Management commands for core app.
+Comandos de gestión para la app core.
+"""
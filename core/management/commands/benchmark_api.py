@@ -0,0 +1,141 @@
+"""
+Measure latency, queries and response size of every API router endpoint.
+Mide latencia, consultas y tamaño de respuesta de cada endpoint de los routers.
+
+Every GET route served by a DRF view under ``/api/`` is requested through
+the test client (detail routes with the first row of their queryset) and
+reported as JSON: p50/p95/p99 latency, queries per request and bytes per
+response. Seed data first, e.g. ``manage.py seed_portfolio --clear``.
+
+With ``--baseline`` the command fails when an endpoint's p50 or p95 is
+slower than the baseline beyond ``--tolerance`` (plus ``--slack-ms``), it
+runs more queries, or returns more bytes beyond ``--tolerance``. p99 is
+reported but not compared: with a few dozen samples it is the slowest one.
+Con ``--baseline`` el comando falla si algún endpoint empeora respecto a la
+línea base guardada.
+"""
+
+import json
+import math
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from core.cache import get_local_cache
+from core.routes import iter_routes
+
+PERCENTILES = (50, 95, 99)
+COMPARED_PERCENTILES = (50, 95)
+
+
+def percentile(samples, percent):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def endpoints():
+    """Return the sorted ``/api/`` paths to benchmark."""
+    paths = set()
+    for route in iter_routes():
+        if route.kwargs - {"pk"}:
+            continue
+        values = {}
+        if route.kwargs:
+            queryset = getattr(route.view, "queryset", None)
+            pk = queryset.order_by("pk").values_list("pk", flat=True).first() if queryset is not None else None
+            if pk is None:
+                continue
+            values["pk"] = pk
+        path = reverse(route.url_name, kwargs=values)
+        if path.startswith("/api/") and not path.startswith(("/api/schema/", "/api/docs/")):
+            paths.add(path)
+    return sorted(paths)
+
+
+class Command(BaseCommand):
+    """Benchmark every router endpoint and compare with a stored baseline."""
+
+    help = "Measure latency, queries and response size of every API router endpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=30, help="Timed requests per endpoint.")
+        parser.add_argument("--warmup", type=int, default=3, help="Untimed requests per endpoint first.")
+        parser.add_argument("--cold", action="store_true", help="Clear the caches before every request.")
+        parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+        parser.add_argument("--baseline", help="Fail when results regress beyond this stored report.")
+        parser.add_argument("--save-baseline", help="Also write the report here as the new baseline.")
+        parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression (0.25 = 25%%).")
+        parser.add_argument("--slack-ms", type=float, default=5.0, help="Latency regressions below this are ignored.")
+
+    def handle(self, *args, **options):
+        client = Client(HTTP_ACCEPT="application/json")
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            results = {path: self.measure(client, path, options) for path in endpoints()}
+        if not results:
+            raise CommandError("No endpoints to benchmark.")
+
+        report = json.dumps(
+            {"iterations": options["iterations"], "cold": options["cold"], "endpoints": results},
+            indent=2,
+            sort_keys=True,
+        )
+        for target in (options["output"], options["save_baseline"]):
+            if target:
+                Path(target).write_text(report + "\n")
+        if not options["output"]:
+            self.stdout.write(report)
+
+        if options["baseline"]:
+            baseline = json.loads(Path(options["baseline"]).read_text())["endpoints"]
+            regressions = self.compare(baseline, results, options["tolerance"], options["slack_ms"])
+            if regressions:
+                raise CommandError("Performance regressions:\n" + "\n".join(regressions))
+            self.stderr.write(self.style.SUCCESS(f"No regressions against {options['baseline']}."))
+
+    def measure(self, client, path, options):
+        for _run in range(options["warmup"]):
+            client.get(path)
+
+        timings, queries, sizes = [], [], []
+        for _run in range(options["iterations"]):
+            if options["cold"]:
+                cache.clear()
+                get_local_cache().clear()
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                response = client.get(path)
+                body = b"".join(response.streaming_content) if response.streaming else response.content
+                timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise CommandError(f"GET {path} returned {response.status_code}.")
+            queries.append(len(context.captured_queries))
+            sizes.append(len(body))
+
+        result = {f"p{percent}_ms": round(percentile(timings, percent), 3) for percent in PERCENTILES}
+        result["queries"] = max(queries)
+        result["bytes"] = max(sizes)
+        return result
+
+    @staticmethod
+    def compare(baseline, results, tolerance, slack_ms):
+        """Return a description of every metric that regressed."""
+        regressions = []
+        for path, base in sorted(baseline.items()):
+            current = results.get(path)
+            if current is None:
+                continue
+            for metric in (f"p{percent}_ms" for percent in COMPARED_PERCENTILES):
+                if current[metric] > base[metric] * (1 + tolerance) + slack_ms:
+                    regressions.append(f"{path} {metric}: {base[metric]} -> {current[metric]}")
+            if current["queries"] > base["queries"]:
+                regressions.append(f"{path} queries: {base['queries']} -> {current['queries']}")
+            if current["bytes"] > base["bytes"] * (1 + tolerance):
+                regressions.append(f"{path} bytes: {base['bytes']} -> {current['bytes']}")
+        return regressions
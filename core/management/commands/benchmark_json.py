@@ -0,0 +1,106 @@
+"""
+Compare the stdlib and orjson JSON renderers on a seeded project dataset.
+Compara los renderizadores JSON estándar y orjson con un conjunto de proyectos generado.
+
+Nothing is written to the database: projects are built in memory from a
+fixed random seed, serialized once with ProjectSerializer, then rendered and
+parsed repeatedly by both implementations. Outputs are checked for equality.
+"""
+
+import gc
+import io
+import random
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from apps.projects.api.serializers import ProjectSerializer
+from apps.projects.models import Project
+from core import renderers
+
+WORDS = "django python react postgres api cache query index render stream portfolio fast lean".split()
+
+
+class Command(BaseCommand):
+    """Benchmark FastJSONRenderer/FastJSONParser against DRF's stdlib classes."""
+
+    help = "Compare the stdlib and orjson JSON renderers on a seeded project dataset."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Number of projects in the payload.")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed iterations per implementation.")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed for the dataset.")
+
+    def handle(self, *args, **options):
+        if renderers.orjson is None:
+            raise CommandError("orjson is not installed; both renderers would use the stdlib.")
+
+        data = self.build_payload(options["rows"], random.Random(options["seed"]))
+        stdlib_bytes = JSONRenderer().render(data)
+        fast_bytes = renderers.FastJSONRenderer().render(data)
+        if stdlib_bytes != fast_bytes:
+            raise CommandError("Renderers produced different output.")
+
+        results = [
+            ("render", JSONRenderer().render, renderers.FastJSONRenderer().render, data),
+            ("parse", self.parser(JSONParser()), self.parser(renderers.FastJSONParser()), stdlib_bytes),
+        ]
+        self.stdout.write(f"{options['rows']} projects, {len(stdlib_bytes):,} bytes, {options['repeat']} runs")
+        for name, stdlib, fast, argument in results:
+            stdlib_time = self.timeit(stdlib, argument, options["repeat"])
+            fast_time = self.timeit(fast, argument, options["repeat"])
+            self.stdout.write(
+                f"{name:<8} stdlib {stdlib_time * 1000:8.2f} ms  orjson {fast_time * 1000:8.2f} ms  "
+                f"x{stdlib_time / fast_time:.1f}"
+            )
+        self.stdout.write(self.style.SUCCESS("Output is byte-identical."))
+
+    @staticmethod
+    def build_payload(rows, rng):
+        """Serialized projects plus the non-native types the renderer must handle."""
+        now = timezone.now()
+        projects = []
+        for index in range(rows):
+            project = Project(
+                id=index + 1,
+                title=" ".join(rng.choices(WORDS, k=3)).title(),
+                description=" ".join(rng.choices(WORDS, k=rng.randint(40, 120))),
+                short_description=" ".join(rng.choices(WORDS, k=12)),
+                url=f"https://example.com/{index}",
+                github_url=f"https://github.com/example/{index}",
+                technologies=", ".join(rng.sample(WORDS, 4)),
+                is_featured=rng.random() < 0.2,
+                order=rng.randint(0, 50),
+            )
+            project.created_at = now - timedelta(days=rng.randint(0, 2000), microseconds=rng.randint(0, 999999))
+            project.updated_at = project.created_at + timedelta(hours=rng.randint(0, 500))
+            projects.append(project)
+        return {
+            "generatedAt": now,
+            "label": _("Projects"),
+            "score": Decimal("12.5"),
+            "results": ProjectSerializer(projects, many=True).data,
+        }
+
+    @staticmethod
+    def parser(instance):
+        return lambda body: instance.parse(io.BytesIO(body))
+
+    @staticmethod
+    def timeit(function, argument, repeat):
+        """Best wall time of ``repeat`` calls, with the GC paused like ``timeit``."""
+        best = float("inf")
+        gc.disable()
+        try:
+            for _run in range(repeat):
+                start = time.perf_counter()
+                function(argument)
+                best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+        return best
@@ -0,0 +1,86 @@
+"""
+Compare the full and the lean middleware chains per request.
+Compara por petición la cadena de middleware completa y la ligera.
+
+Both chains are built the way ``PathDispatchMiddleware`` builds them and
+called with the same anonymous GET, alternating in rounds; the median of
+the per-round means is reported as JSON in microseconds. ``middleware`` is a
+stub view that returns an empty response, so it is the cost of the chain
+alone; each ``--path`` adds a real API route (seed data first and warm the
+cache so the view itself costs the same in both chains).
+Ambas cadenas se llaman con la misma petición GET anónima, alternando por
+rondas; se reporta la mediana de las medias en microsegundos.
+"""
+
+import json
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import path as route
+from core.dispatch import MiddlewareChain, full_middleware, lean_middleware
+
+STUB = "middleware"
+
+urlpatterns = [route("", lambda request: HttpResponse())]
+
+
+class Command(BaseCommand):
+    """Measure the per-request savings of the lean middleware chain."""
+
+    help = "Compare the per-request cost of the full and the lean middleware chains."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", action="append", default=None, help="API path to include (repeatable).")
+        parser.add_argument("--iterations", type=int, default=2000, help="Requests per chain and round.")
+        parser.add_argument("--rounds", type=int, default=5, help="Alternating rounds.")
+
+    def handle(self, *args, **options):
+        chains = {"full": MiddlewareChain(full_middleware()), "lean": MiddlewareChain(lean_middleware())}
+        targets = [STUB] + (options["path"] or ["/api/skills/by_category/"])
+
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            results = {target: self.compare(chains, target, options) for target in targets}
+
+        self.stdout.write(json.dumps(
+            {
+                "iterations": options["iterations"],
+                "rounds": options["rounds"],
+                "skipped": sorted(set(chains["full"].middleware) - set(chains["lean"].middleware)),
+                "results": results,
+            },
+            indent=2,
+        ))
+
+    def compare(self, chains, target, options):
+        samples = {name: [] for name in chains}
+        for chain in chains.values():
+            self.run(chain, target, 10)
+        for _round in range(options["rounds"]):
+            for name, chain in chains.items():
+                samples[name].append(self.run(chain, target, options["iterations"]))
+        full, lean = (statistics.median(samples[name]) for name in chains)
+        return {
+            "full_us": round(full, 2),
+            "lean_us": round(lean, 2),
+            "saved_us": round(full - lean, 2),
+            "saved_pct": round((full - lean) / full * 100, 1),
+        }
+
+    @staticmethod
+    def run(chain, target, iterations):
+        """Return the mean microseconds per request of ``iterations`` GETs."""
+        factory = RequestFactory()
+        started = time.perf_counter()
+        for _request in range(iterations):
+            request = factory.get("/" if target == STUB else target)
+            if target == STUB:
+                request.urlconf = __name__
+            response = chain(request)
+            if response.status_code != 200:
+                raise CommandError(f"GET {target} returned {response.status_code}.")
+            response.close()
+        return (time.perf_counter() - started) / iterations * 1_000_000
@@ -0,0 +1,25 @@
+"""
+Pre-build the OpenAPI schema served by /api/schema/ and the docs pages.
+Pre-genera el esquema OpenAPI servido por /api/schema/ y las páginas de documentación.
+"""
+
+from django.core.management.base import BaseCommand
+from core import schema
+
+
+class Command(BaseCommand):
+    """Write compact JSON/YAML schema artifacts and their gzip copies (run at deploy time)."""
+
+    help = "Pre-build the OpenAPI schema artifacts, skipping the work when the code is unchanged."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--root", help="Output directory (defaults to SCHEMA_ROOT).")
+        parser.add_argument("--force", action="store_true", help="Rebuild even if the fingerprint matches.")
+
+    def handle(self, *args, **options):
+        root = options["root"] or schema.get_root()
+        manifest, built = schema.build(root, force=options["force"])
+        if not built:
+            self.stdout.write(f"Schema is up to date ({manifest['fingerprint'][:12]}).")
+            return
+        self.stdout.write(self.style.SUCCESS(f"Schema built in {root} ({manifest['fingerprint'][:12]})."))
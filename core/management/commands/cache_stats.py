@@ -0,0 +1,29 @@
+"""
+Show the response cache hit/miss/stale counters of every worker.
+Muestra los contadores de aciertos/fallos/obsoletos de la caché de respuestas.
+
+Workers add their counts to the shared cache every
+API_CACHE_STATS_FLUSH_INTERVAL seconds, so recent requests may be missing.
+"""
+
+from django.core.management.base import BaseCommand
+from core import cache
+
+
+class Command(BaseCommand):
+    """Print (and optionally reset) the shared cache counters."""
+
+    help = "Show the response cache hit/miss/stale counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing them.")
+
+    def handle(self, *args, **options):
+        stats = cache.get_stats()
+        total = sum(stats.values())
+        for event, count in stats.items():
+            share = f" ({count / total:.1%})" if total else ""
+            self.stdout.write(f"{event}: {count}{share}")
+        if options["reset"]:
+            cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
@@ -0,0 +1,35 @@
+"""
+Generate responsive variants for every registered image field.
+Genera variantes responsivas para cada campo de imagen registrado.
+
+Run once after deploying the variant pipeline, or with --force after
+changing IMAGE_VARIANT_WIDTHS.
+Ejecutar una vez tras desplegar el pipeline, o con --force al cambiar
+IMAGE_VARIANT_WIDTHS.
+"""
+
+from django.core.management.base import BaseCommand
+from core import images
+
+
+class Command(BaseCommand):
+    """Synchronously backfill image variants of existing rows."""
+
+    help = "Generate responsive variants for every registered image field."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate variants that are already up to date.",
+        )
+
+    def handle(self, *args, **options):
+        generated = 0
+        for model, field in images.registered_fields():
+            queryset = model._default_manager.exclude(**{field: ""}).exclude(**{f"{field}__isnull": True})
+            for pk in queryset.values_list("pk", flat=True).iterator():
+                if images.process_variants(model._meta.label, pk, field, force=options["force"]) is not None:
+                    generated += 1
+            self.stdout.write(f"Processed {model._meta.label}.{field}.")
+        self.stdout.write(self.style.SUCCESS(f"Generated variants for {generated} image(s)."))
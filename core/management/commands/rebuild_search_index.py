@@ -0,0 +1,30 @@
+"""
+Rebuild the full-text search tables of every registered model.
+Reconstruye las tablas de búsqueda de texto completo de cada modelo registrado.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from core import cache, search
+
+
+class Command(BaseCommand):
+    """Drop-in rebuild of the search index (e.g. after bulk imports)."""
+
+    help = "Rebuild the full-text search tables of every registered model."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default", help="Database alias to index.")
+
+    def handle(self, *args, **options):
+        backend = search.get_backend(options["database"])
+        if backend is None:
+            raise CommandError("No full-text search backend is available for this database.")
+
+        for model, fields in search.registered_models().items():
+            backend.create(model, fields)
+            backend.rebuild(model, fields)
+            # Bulk imports skip the save signals, so retire cached responses too.
+            # Las importaciones masivas no envían señales: se invalida la caché también.
+            cache.bump_model_version(model)
+            self.stdout.write(f"Indexed {model._meta.label}.")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
@@ -0,0 +1,37 @@
+"""
+Run background jobs from the database queue.
+Ejecuta los trabajos en segundo plano de la cola en base de datos.
+
+Run one or more of these next to the web processes; each claims due jobs,
+runs them with --concurrency threads and stops gracefully on SIGTERM or
+Ctrl+C (running jobs finish, nothing new is claimed). --burst drains the due
+jobs and exits, for cron or one-off runs.
+Ejecutar uno o más junto a los procesos web; --burst vacía la cola y termina.
+"""
+
+import signal
+
+from django.core.management.base import BaseCommand
+from core.jobs import Worker
+
+
+class Command(BaseCommand):
+    """Claim and run queued jobs until stopped."""
+
+    help = "Run background jobs from the database queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=1, help="Jobs run at the same time (threads).")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between polls of an empty queue.")
+        parser.add_argument("--burst", action="store_true", help="Exit once no job is due.")
+
+    def handle(self, *args, **options):
+        worker = Worker(concurrency=options["concurrency"], poll_interval=options["poll_interval"])
+        previous = {signum: signal.signal(signum, lambda *_args: worker.stop()) for signum in (signal.SIGTERM, signal.SIGINT)}
+        self.stdout.write(f"Worker {worker.name} started with concurrency {worker.concurrency}.")
+        try:
+            worker.run(burst=options["burst"])
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+        self.stdout.write(self.style.SUCCESS(f"Ran {worker.processed} job(s), {worker.failed} failed."))
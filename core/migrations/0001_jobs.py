@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-17 08:28
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task', models.CharField(help_text='Registered task name', max_length=100, verbose_name='Task')),
+                ('payload', models.JSONField(blank=True, default=dict, help_text='Keyword arguments of the task', verbose_name='Payload')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Attempts')),
+                ('max_attempts', models.PositiveIntegerField(default=5, verbose_name='Max attempts')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Not claimed before this time', verbose_name='Run at')),
+                ('locked_by', models.CharField(blank=True, help_text='Worker running the job', max_length=100, verbose_name='Locked by')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='Locked at')),
+                ('last_error', models.TextField(blank=True, verbose_name='Last error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished At')),
+            ],
+            options={
+                'verbose_name': 'Job',
+                'verbose_name_plural': 'Jobs',
+                'ordering': ['run_at', 'id'],
+                'indexes': [models.Index(condition=models.Q(('status', 'queued')), fields=['run_at', 'id'], name='jobs_ready_idx'), models.Index(condition=models.Q(('status', 'running')), fields=['locked_at'], name='jobs_running_idx')],
+            },
+        ),
+    ]
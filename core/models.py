@@ -0,0 +1,47 @@
+"""
+Core models.
+Modelos de core.
+"""
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class Job(models.Model):
+    """
+    A unit of background work stored in the database (see ``core.jobs``).
+    Una unidad de trabajo en segundo plano guardada en la base de datos.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", _("Queued")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    task = models.CharField(max_length=100, verbose_name=_("Task"), help_text=_("Registered task name"))
+    payload = models.JSONField(default=dict, blank=True, verbose_name=_("Payload"), help_text=_("Keyword arguments of the task"))
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED, verbose_name=_("Status"))
+    attempts = models.PositiveIntegerField(default=0, verbose_name=_("Attempts"))
+    max_attempts = models.PositiveIntegerField(default=5, verbose_name=_("Max attempts"))
+    run_at = models.DateTimeField(default=timezone.now, verbose_name=_("Run at"), help_text=_("Not claimed before this time"))
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name=_("Locked by"), help_text=_("Worker running the job"))
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Locked at"))
+    last_error = models.TextField(blank=True, verbose_name=_("Last error"))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created At"))
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Finished At"))
+
+    class Meta:
+        verbose_name = _("Job")
+        verbose_name_plural = _("Jobs")
+        ordering = ["run_at", "id"]
+        indexes = [
+            # Only claimable rows, in claim order.
+            models.Index(fields=["run_at", "id"], condition=models.Q(status="queued"), name="jobs_ready_idx"),
+            # Running rows, to find expired locks.
+            models.Index(fields=["locked_at"], condition=models.Q(status="running"), name="jobs_running_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
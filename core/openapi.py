@@ -0,0 +1,45 @@
+"""
+OpenAPI schema class for the API views.
+Clase de esquema OpenAPI para las vistas de la API.
+
+Kept apart from ``core.schema``: DRF imports ``DEFAULT_SCHEMA_CLASS`` while
+the drf-spectacular views that module extends are being defined.
+"""
+
+from drf_spectacular.openapi import AutoSchema
+from drf_spectacular.utils import OpenApiParameter
+
+from core.sparse import FIELDS_PARAM, OMIT_PARAM, SparseFieldsetViewMixin
+from core.streaming import StreamingListMixin
+
+
+class PortfolioAutoSchema(AutoSchema):
+    """
+    ``AutoSchema`` that documents the query parameters added by view mixins.
+    ``AutoSchema`` que documenta los parámetros añadidos por los mixins de vistas.
+
+    ``?fields=`` / ``?omit=`` (``SparseFieldsetViewMixin``) on every read and
+    ``?stream=`` (``StreamingListMixin``) on list actions.
+    """
+
+    def get_override_parameters(self):
+        parameters = list(super().get_override_parameters())
+        if self.method != "GET":
+            return parameters
+        if isinstance(self.view, SparseFieldsetViewMixin):
+            parameters += [
+                OpenApiParameter(
+                    FIELDS_PARAM, str,
+                    description="Comma-separated fields to return; unknown names are a 400 / Campos a retornar separados por comas",
+                ),
+                OpenApiParameter(
+                    OMIT_PARAM, str,
+                    description="Comma-separated fields to leave out / Campos a omitir separados por comas",
+                ),
+            ]
+        if isinstance(self.view, StreamingListMixin) and getattr(self.view, "action", None) == "list":
+            parameters.append(OpenApiParameter(
+                self.view.stream_param, bool,
+                description="Stream the rows as a plain JSON array without pagination / Envía las filas como un arreglo JSON sin paginación",
+            ))
+        return parameters
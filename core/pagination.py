@@ -0,0 +1,232 @@
+"""
+Pagination classes shared by the API viewsets.
+Clases de paginación compartidas por los viewsets de la API.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from rest_framework import exceptions
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination on the model's ``Meta.ordering`` plus ``id``.
+    Paginación por llave (keyset) sobre ``Meta.ordering`` del modelo más ``id``.
+
+    The cursor stores the ordering values of the last row returned, so the
+    next page is a ``WHERE (order, -created_at, id) > (...)`` range scan: no
+    ``COUNT(*)``, no ``OFFSET``, and rows inserted meanwhile never shift pages.
+    Views may override the key with a ``cursor_ordering`` attribute.
+
+    The key is fixed, so ``?ordering=`` together with a cursor is a 400
+    rather than silently ignored.
+    """
+
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+
+    def get_ordering(self, queryset, view):
+        ordering = list(getattr(view, 'cursor_ordering', None) or queryset.model._meta.ordering)
+        if not any(field.lstrip('-') in ('id', 'pk') for field in ordering):
+            ordering.append('id')
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if api_settings.ORDERING_PARAM in request.query_params:
+            raise exceptions.ValidationError({
+                api_settings.ORDERING_PARAM: ['Cursor pages follow a fixed ordering; drop ?ordering= or ?cursor=.'],
+            })
+        self.request = request
+        self.ordering = self.get_ordering(queryset, view)
+        self.model = queryset.model
+        position, reverse = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*(self._flip(field) if reverse else field for field in self.ordering))
+        if position is not None:
+            queryset = queryset.filter(self.seek_filter(position, reverse))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.first_position = self.get_position(rows[0]) if rows else None
+        self.last_position = self.get_position(rows[-1]) if rows else None
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or self.last_position is None:
+            return None
+        return self.build_link(self.last_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or self.first_position is None:
+            return None
+        return self.build_link(self.first_position, reverse=True)
+
+    def build_link(self, position, reverse):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position, reverse))
+
+    def seek_filter(self, position, reverse):
+        """
+        Build ``(a, b, c) > (x, y, z)`` as nested OR/AND for any mix of directions.
+        Construye ``(a, b, c) > (x, y, z)`` como OR/AND anidados para cualquier dirección.
+        """
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            step = Q(**{f'{name}__{"lt" if descending else "gt"}': position[index]})
+            for previous_field, previous_value in zip(self.ordering[:index], position):
+                step &= Q(**{previous_field.lstrip('-'): previous_value})
+            condition |= step
+        return condition
+
+    def get_position(self, instance):
+        position = []
+        for field in self.ordering:
+            value = instance
+            for attribute in field.lstrip('-').split('__'):
+                value = getattr(value, attribute)
+            position.append(value)
+        return position
+
+    def encode_cursor(self, position, reverse):
+        values = [value.isoformat() if isinstance(value, (date, datetime)) else value for value in position]
+        payload = json.dumps({'p': values, 'r': reverse}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param, '')
+        if not token:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8'))
+            values = payload['p']
+            if len(values) != len(self.ordering):
+                raise ValueError(token)
+            position = [
+                self._model_field(field).to_python(value) for field, value in zip(self.ordering, values)
+            ]
+            return position, bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+    def _model_field(self, field):
+        model = self.model
+        parts = field.lstrip('-').split('__')
+        for part in parts[:-1]:
+            model = model._meta.get_field(part).related_model
+        name = parts[-1]
+        return model._meta.pk if name == 'pk' else model._meta.get_field(name)
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+
+class PortfolioPagination(PageNumberPagination):
+    """
+    Page-number pagination with opt-in keyset pagination.
+    Paginación por número de página con paginación por llave opcional.
+
+    Requests carrying ``?cursor=`` (empty for the first page) are paginated
+    with :class:`KeysetPagination`; every other request keeps the existing
+    ``count``/``next``/``previous``/``results`` page-number format.
+    """
+
+    cursor_query_param = KeysetPagination.cursor_query_param
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.cursor_query_param in request.query_params:
+            self.keyset = KeysetPagination(self.get_page_size(request))
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Async page-number pagination with the async ORM (``acount``, ``async for``).
+        Paginación por número de página asíncrona con el ORM asíncrono.
+
+        Keyset requests are not supported here; async views serve them synchronously.
+        """
+        self.keyset = None
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return [row async for row in self.page.object_list]
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_next_link(self):
+        if getattr(self, 'keyset', None) is not None:
+            return self.keyset.get_next_link()
+        return super().get_next_link()
+
+    def get_previous_link(self):
+        if getattr(self, 'keyset', None) is not None:
+            return self.keyset.get_previous_link()
+        return super().get_previous_link()
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append({
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Keyset pagination cursor; send it empty for the first page. Cannot be combined with ordering / Cursor de paginación por llave; enviarlo vacío para la primera página. No se combina con ordering',
+            'schema': {'type': 'string'},
+        })
+        return parameters
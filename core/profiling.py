@@ -0,0 +1,217 @@
+"""
+On-demand request profiler for staff users.
+Perfilador de peticiones bajo demanda para usuarios staff.
+
+A staff user (logged in to the admin) adds ``?profile`` or the
+``X-Profile`` header to any request to have it run under a profiler:
+
+- ``sample`` (default): a thread samples the request thread's stack every
+  ``PROFILER_INTERVAL_MS`` and returns the collapsed ("folded") stacks that
+  ``flamegraph.pl``, speedscope and inferno read directly.
+- ``cprofile``: the deterministic ``cProfile``; the response is the
+  ``pstats`` summary and the saved file is the binary dump that snakeviz,
+  gprof2dot or flameprof read.
+
+The dump replaces the response body and is saved under ``PROFILER_DIR``,
+which keeps the newest ``PROFILER_MAX_FILES`` profiles. The middleware is
+removed at startup unless ``PROFILER_ENABLED``, and ordinary requests pay a
+substring check on the query string and a header lookup.
+
+The profiler is WSGI-only: under ASGI an async view runs on the event loop
+thread, not the one the middleware samples or profiles, so staff requests
+for a profile get a 501 instead of a misleading one.
+Un usuario staff agrega ``?profile`` o la cabecera ``X-Profile`` para
+perfilar la petición; el volcado reemplaza la respuesta y se guarda en un
+búfer circular en disco. Las peticiones normales no pagan nada más que una
+búsqueda en la query string y en las cabeceras. Solo funciona bajo WSGI.
+"""
+
+import cProfile
+import io
+import itertools
+import marshal
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse
+
+PARAM = "profile"
+HEADER = "HTTP_X_PROFILE"
+MODES = ("sample", "cprofile")
+
+_sequence = itertools.count()
+
+
+def frame_label(frame):
+    """Return ``module:qualified.name`` for a stack frame."""
+    return f'{frame.f_globals.get("__name__", "?")}:{frame.f_code.co_qualname}'
+
+
+class SamplingProfiler:
+    """
+    Sample one thread's stack at a fixed interval and count folded stacks.
+    Muestrea la pila de un hilo a intervalos fijos y cuenta las pilas plegadas.
+    """
+
+    extension = "folded"
+
+    def __init__(self, interval=0.001, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def dump(self):
+        """Return the folded stacks, one ``frame;frame;frame count`` per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common()).encode()
+
+    def report(self):
+        return self.dump()
+
+
+class DeterministicProfiler:
+    """
+    ``cProfile`` wrapped with the same interface as ``SamplingProfiler``.
+    ``cProfile`` con la misma interfaz que ``SamplingProfiler``.
+    """
+
+    extension = "prof"
+
+    def __init__(self, limit=60):
+        self.limit = limit
+        self.profile = cProfile.Profile()
+
+    def __enter__(self):
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+
+    def dump(self):
+        """Return the binary ``pstats`` dump."""
+        self.profile.create_stats()
+        return marshal.dumps(self.profile.stats)
+
+    def report(self):
+        """Return the ``pstats`` summary sorted by cumulative time."""
+        output = io.StringIO()
+        pstats.Stats(self.profile, stream=output).sort_stats("cumulative").print_stats(self.limit)
+        return output.getvalue().encode()
+
+
+class ProfileStore:
+    """
+    Directory of profiles that keeps only the newest ``max_files``.
+    Directorio de perfiles que conserva solo los ``max_files`` más recientes.
+    """
+
+    def __init__(self, directory, max_files):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def save(self, request, profiler):
+        """Write the profile and drop the oldest ones; return the file name."""
+        slug = request.path.strip("/").replace("/", "-") or "root"
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}-{next(_sequence):06d}-{request.method.lower()}-{slug}.{profiler.extension}"
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / name).write_bytes(profiler.dump())
+            for old in self.files()[: -self.max_files]:
+                old.unlink(missing_ok=True)
+        return name
+
+    def files(self):
+        """Return the stored profiles, oldest first."""
+        if not self.directory.is_dir():
+            return []
+        return sorted((path for path in self.directory.iterdir() if path.is_file()), key=lambda path: path.name)
+
+
+class ProfilerMiddleware:
+    """
+    Profile requests from staff users that ask for it.
+    Perfila las peticiones de usuarios staff que lo piden.
+
+    Must come after ``AuthenticationMiddleware``. Non-staff requests with the
+    trigger are served normally.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILER_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.interval = getattr(settings, "PROFILER_INTERVAL_MS", 1) / 1000
+        max_files = getattr(settings, "PROFILER_MAX_FILES", 50)
+        if max_files < 1:
+            raise ImproperlyConfigured("PROFILER_MAX_FILES must be at least 1.")
+        self.store = ProfileStore(
+            getattr(settings, "PROFILER_DIR", Path(settings.BASE_DIR) / "profiles"),
+            max_files,
+        )
+
+    def __call__(self, request):
+        mode = self.requested_mode(request)
+        if mode is None:
+            return self.get_response(request)
+        user = getattr(request, "user", None)
+        if user is None or not user.is_staff:
+            return self.get_response(request)
+        if isinstance(request, ASGIRequest):
+            return HttpResponse(
+                "The request profiler only runs under WSGI.\n",
+                status=501,
+                content_type="text/plain; charset=utf-8",
+                headers={"Cache-Control": "no-store"},
+            )
+
+        profiler = DeterministicProfiler() if mode == "cprofile" else SamplingProfiler(self.interval)
+        with profiler:
+            response = self.get_response(request)
+            if response.streaming:
+                b"".join(response.streaming_content)
+
+        name = self.store.save(request, profiler)
+        profiled = HttpResponse(profiler.report(), content_type="text/plain; charset=utf-8")
+        profiled["X-Profile-File"] = name
+        profiled["X-Profile-Status"] = str(response.status_code)
+        profiled["Cache-Control"] = "no-store"
+        return profiled
+
+    @staticmethod
+    def requested_mode(request):
+        """Return the profiler mode asked for, or None for ordinary requests."""
+        header = request.META.get(HEADER)
+        if header is None and PARAM not in request.META.get("QUERY_STRING", ""):
+            return None
+        mode = header if header is not None else request.GET.get(PARAM)
+        if mode is None:
+            return None
+        return mode if mode in MODES else MODES[0]
@@ -0,0 +1,104 @@
+"""
+orjson-backed JSON renderer and parser.
+Renderizador y parser JSON respaldados por orjson.
+
+Non-native values (datetimes, Decimals, lazy translations, UUIDs, ...) are
+handed to the same encoder the stdlib path uses, so their output is
+byte-identical; orjson only replaces the tree walk and string escaping.
+Anything orjson rejects (indentation, ASCII-only output, non-string keys,
+integers beyond 64 bits) falls back to the stdlib implementation, and so
+does everything when orjson is not installed. The one known textual
+difference is floats large or small enough for exponent notation
+(``1e16`` vs ``1e+16``); the API serializers emit none.
+
+Los valores no nativos se pasan al mismo encoder que usa la ruta estándar,
+así su salida es idéntica byte a byte; lo que orjson no soporta usa la
+implementación estándar, igual que cuando orjson no está instalado.
+"""
+
+import io
+import re
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.timing import measure
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+if orjson is not None:
+    DUMPS_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+# DRF always escapes these so the output stays a strict JavaScript subset.
+# DRF siempre escapa estos caracteres para que la salida sea JavaScript válido.
+LINE_SEPARATORS = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"))
+
+# Some orjson versions read integers beyond 64 bits as floats; such bodies
+# (20+ digit runs) are left to the stdlib parser.
+# Algunas versiones de orjson leen enteros de más de 64 bits como float.
+LONG_NUMBER_RE = re.compile(rb"\d{20}")
+
+
+def dumps(data, encoder_class):
+    """
+    Encode ``data`` with orjson, delegating non-native values to ``encoder_class``.
+    Codifica ``data`` con orjson, delegando los valores no nativos a ``encoder_class``.
+
+    Raises ``TypeError`` when orjson cannot encode the data; callers fall back.
+    """
+    return orjson.dumps(data, default=encoder_class().default, option=DUMPS_OPTIONS)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in ``JSONRenderer`` that encodes compact output with orjson.
+    ``JSONRenderer`` intercambiable que codifica la salida compacta con orjson.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with measure("render"):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None or data is None or not self.compact or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = dumps(data, self.encoder_class)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        for raw, escaped in LINE_SEPARATORS:
+            if raw in ret:
+                ret = ret.replace(raw, escaped)
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """
+    Drop-in ``JSONParser`` that decodes with orjson.
+    ``JSONParser`` intercambiable que decodifica con orjson.
+
+    Bodies orjson rejects, and bodies with huge integers, are parsed by
+    ``JSONParser`` so error messages and edge cases stay unchanged.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        body = stream.read()
+        if LONG_NUMBER_RE.search(body):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+        try:
+            return orjson.loads(body if encoding.lower() in ("utf-8", "utf8") else body.decode(encoding))
+        except (orjson.JSONDecodeError, UnicodeDecodeError, LookupError):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+
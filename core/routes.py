@@ -0,0 +1,41 @@
+"""
+Walk the URLconf for the DRF routes that answer GET.
+Recorre el URLconf buscando las rutas DRF que responden a GET.
+
+Shared by the query budget tests (``core.budgets``) and ``benchmark_api`` so
+both see the same set of endpoints.
+"""
+
+from collections import namedtuple
+
+from django.urls import URLPattern, URLResolver, get_resolver
+
+Route = namedtuple("Route", "url_name view action kwargs")
+
+
+def iter_routes(patterns=None, namespace=None):
+    """
+    Yield a ``Route`` for every named DRF route that answers GET.
+    Genera una ``Route`` por cada ruta DRF con nombre que responde a GET.
+
+    ``action`` is the viewset action bound to GET, or ``"get"`` for plain API
+    views; ``kwargs`` are the URL kwarg names. The ``.json`` format suffix
+    duplicates are skipped.
+    """
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            inner = ":".join(filter(None, [namespace, pattern.namespace])) or None
+            yield from iter_routes(pattern.url_patterns, inner)
+            continue
+        if not isinstance(pattern, URLPattern) or not pattern.name:
+            continue
+        view = getattr(pattern.callback, "cls", None)
+        kwargs = set(pattern.pattern.regex.groupindex)
+        if view is None or "format" in kwargs:
+            continue
+        actions = getattr(pattern.callback, "actions", None)
+        action = "get" if actions is None else actions.get("get")
+        if action is None:
+            continue
+        name = f"{namespace}:{pattern.name}" if namespace else pattern.name
+        yield Route(name, view, action, kwargs)
@@ -0,0 +1,247 @@
+"""
+Pre-built OpenAPI schema served with ETags.
+Esquema OpenAPI pre-generado servido con ETags.
+
+drf-spectacular introspects every viewset and serializer to build the
+schema, which made ``/api/schema/`` the most expensive URL. ``build_schema``
+(run at deploy time) writes compact JSON and YAML, plus gzip copies, under
+``SCHEMA_ROOT`` together with a manifest holding a fingerprint of the code
+that shapes the schema: the ``apps`` and ``core`` sources, the DRF and
+drf-spectacular settings and the library versions. The views serve those
+files and only regenerate them, once per process, when the fingerprint
+changes; the documentation pages get ETags from the same fingerprint.
+``build_schema`` escribe JSON y YAML compactos y sus copias gzip bajo
+``SCHEMA_ROOT`` con una huella del código; las vistas sirven esos archivos y
+solo los regeneran cuando la huella cambia.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import OpenApiYamlRenderer
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+
+from core.conditional import make_etag
+from core.files import write_file
+from core.renderers import FastJSONRenderer
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+FORMATS = ("json", "yaml")
+SOURCE_DIRS = ("apps", "core")
+SKIPPED_DIRS = {"tests", "migrations", "__pycache__"}
+PACKAGES = ("django", "djangorestframework", "drf-spectacular")
+
+_lock = threading.Lock()
+_loaded = {}
+
+
+def get_root():
+    return Path(getattr(settings, "SCHEMA_ROOT", None) or Path(settings.BASE_DIR) / "build" / "schema")
+
+
+def source_files():
+    """Return the sorted ``.py`` files whose changes can alter the schema."""
+    base = Path(settings.BASE_DIR)
+    files = []
+    for name in SOURCE_DIRS:
+        for path in (base / name).rglob("*.py"):
+            if not SKIPPED_DIRS.intersection(path.relative_to(base).parts):
+                files.append(path)
+    return sorted(files)
+
+
+def fingerprint():
+    """
+    Hash everything the generated schema depends on.
+    Calcula el hash de todo lo que determina el esquema generado.
+    """
+    digest = hashlib.sha256()
+    base = Path(settings.BASE_DIR)
+    for path in source_files():
+        digest.update(str(path.relative_to(base)).encode())
+        digest.update(path.read_bytes())
+    for package in PACKAGES:
+        try:
+            digest.update(f"{package}=={version(package)}".encode())
+        except PackageNotFoundError:
+            pass
+    digest.update(repr(sorted(settings.SPECTACULAR_SETTINGS.items())).encode())
+    digest.update(repr(sorted(settings.REST_FRAMEWORK.items())).encode())
+    return digest.hexdigest()
+
+
+def generate():
+    """Return the schema as ``{format: bytes}``."""
+    data = SchemaGenerator().get_schema(request=None, public=True)
+    return {
+        "json": FastJSONRenderer().render(data),
+        "yaml": OpenApiYamlRenderer().render(data),
+    }
+
+
+def read_manifest(root):
+    try:
+        return json.loads((root / MANIFEST_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def build(root=None, force=False):
+    """
+    Write the schema artifacts unless they already match the code.
+    Escribe los artefactos del esquema salvo que ya coincidan con el código.
+
+    Returns ``(manifest, built)``.
+    """
+    root = Path(root) if root is not None else get_root()
+    current = fingerprint()
+    manifest = read_manifest(root)
+    if not force and manifest is not None and manifest.get("fingerprint") == current:
+        return manifest, False
+
+    manifest = {"fingerprint": current, "etags": {}}
+    for name, body in generate().items():
+        write_file(root, f"schema.{name}", body)
+        write_file(root, f"schema.{name}.gz", gzip.compress(body, mtime=0))
+        manifest["etags"][name] = make_etag(hashlib.sha256(body).hexdigest())
+    write_file(root, MANIFEST_FILE, json.dumps(manifest, indent=2).encode())
+    return manifest, True
+
+
+def get_artifacts():
+    """
+    Return ``(fingerprint, {format: (body, gzipped body, etag)})`` for this process.
+    Retorna los artefactos del esquema, construyéndolos si faltan o están obsoletos.
+
+    Returns None when the artifacts cannot be written or read (e.g. a
+    read-only deploy that skipped ``build_schema``); the views then generate
+    the schema live, and this process does not try again.
+    """
+    root = get_root()
+    with _lock:
+        if root not in _loaded:
+            try:
+                manifest, _ = build(root)
+            except OSError:
+                logger.warning("Cannot build the schema artifacts under %s; using live generation.", root, exc_info=True)
+                _loaded[root] = None
+                return None
+            _loaded[root] = (
+                manifest["fingerprint"],
+                {
+                    name: (
+                        (root / f"schema.{name}").read_bytes(),
+                        (root / f"schema.{name}.gz").read_bytes(),
+                        manifest["etags"][name],
+                    )
+                    for name in FORMATS
+                },
+            )
+        return _loaded[root]
+
+
+def reset():
+    """Forget the artifacts loaded by this process."""
+    with _lock:
+        _loaded.clear()
+
+
+def accepts_gzip(request):
+    """
+    Return True when ``Accept-Encoding`` allows gzip (``q`` above 0).
+    Retorna True si ``Accept-Encoding`` admite gzip (``q`` mayor que 0).
+    """
+    qualities = {}
+    for item in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding.lower()] = quality
+    return qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0))) > 0
+
+
+class PrebuiltSchemaView(SpectacularAPIView):
+    """
+    ``SpectacularAPIView`` serving the pre-built artifacts.
+    ``SpectacularAPIView`` que sirve los artefactos pre-generados.
+
+    Content negotiation is unchanged (YAML by default, JSON with
+    ``?format=json`` or ``Accept``). Requests using ``?lang=`` or
+    ``?version=``, or ``SCHEMA_PREBUILT = False``, use live generation.
+    """
+
+    @extend_schema(exclude=True)
+    def get(self, request, *args, **kwargs):
+        artifacts = None
+        if not set(request.GET) - {"format"} and getattr(settings, "SCHEMA_PREBUILT", True):
+            artifacts = get_artifacts()
+        if artifacts is None:
+            return super().get(request, *args, **kwargs)
+
+        renderer = request.accepted_renderer
+        body, compressed, etag = artifacts[1][renderer.format]
+        compress = accepts_gzip(request)
+        if compress:
+            # Each encoding is a distinct representation with its own validator.
+            # Cada codificación es una representación distinta con su propio validador.
+            body, etag = compressed, f'{etag[:-1]}-gzip"'
+        response = get_conditional_response(request._request, etag=etag)
+        if response is None:
+            content_type = renderer.media_type
+            if renderer.charset:
+                content_type = f"{content_type}; charset={renderer.charset}"
+            response = HttpResponse(body, content_type=content_type)
+            if compress:
+                response["Content-Encoding"] = "gzip"
+            response["Content-Disposition"] = f'inline; filename="{self._get_filename(request, None)}"'
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        patch_vary_headers(response, ["Accept", "Accept-Encoding"])
+        return response
+
+
+class PrebuiltDocsMixin:
+    """
+    Answer documentation pages with 304 while the schema fingerprint holds.
+    Responde 304 a las páginas de documentación mientras la huella no cambie.
+    """
+
+    @extend_schema(exclude=True)
+    def get(self, request, *args, **kwargs):
+        artifacts = get_artifacts()
+        if artifacts is None:
+            return super().get(request, *args, **kwargs)
+        etag = make_etag(artifacts[0], request.get_full_path())
+        response = get_conditional_response(request._request, etag=etag)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
+
+
+class PrebuiltRedocView(PrebuiltDocsMixin, SpectacularRedocView):
+    """ReDoc page with an ETag tied to the pre-built schema."""
+
+
+class PrebuiltSwaggerView(PrebuiltDocsMixin, SpectacularSwaggerView):
+    """Swagger UI page with an ETag tied to the pre-built schema."""
@@ -0,0 +1,320 @@
+"""
+Pluggable full-text search for the API viewsets.
+Búsqueda de texto completo intercambiable para los viewsets de la API.
+
+Each registered model gets a shadow search table named ``<db_table>_search``,
+created by a ``CreateSearchTable`` migration of the model's app and kept
+current by post_save/post_delete signals:
+
+- PostgreSQL: a ``tsvector`` column with a GIN index, ranked with ``ts_rank``.
+- SQLite: an FTS5 virtual table, ranked with ``bm25``.
+
+Cada modelo registrado tiene una tabla de búsqueda ``<db_table>_search``
+mantenida por señales post_save/post_delete (tsvector + GIN en PostgreSQL,
+tabla virtual FTS5 en SQLite).
+
+Databases without a supported engine fall back to DRF's ``icontains`` search.
+"""
+
+import re
+
+from django.conf import settings
+from django.db import connections, migrations, router
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+_registry = {}
+_fts5_support = {}
+
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def register(model, fields):
+    """
+    Index ``fields`` of ``model`` for full-text search.
+    Indexa los campos ``fields`` de ``model`` para búsqueda de texto completo.
+
+    Fields are listed by decreasing weight.
+    """
+    _registry[model] = list(fields)
+    post_save.connect(_index_instance, sender=model, dispatch_uid=f"search-index-{model._meta.label_lower}")
+    post_delete.connect(_remove_instance, sender=model, dispatch_uid=f"search-remove-{model._meta.label_lower}")
+
+
+def registered_models():
+    """Return the registered models and their indexed fields."""
+    return dict(_registry)
+
+
+def get_backend(using):
+    """
+    Return the search backend for a database alias, or None if unsupported.
+    Retorna el backend de búsqueda para un alias de base de datos, o None.
+    """
+    connection = connections[using]
+    name = getattr(settings, "SEARCH_BACKEND", "auto")
+    if name == "auto":
+        name = {"postgresql": "postgres", "sqlite": "sqlite_fts5"}.get(connection.vendor, "none")
+    if name == "postgres":
+        return PostgresSearchBackend(connection)
+    if name == "sqlite_fts5" and _sqlite_has_fts5(connection):
+        return SQLiteFTS5Backend(connection)
+    return None
+
+
+def _sqlite_has_fts5(connection):
+    if connection.alias not in _fts5_support:
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA compile_options")
+            options = {row[0] for row in cursor.fetchall()}
+        _fts5_support[connection.alias] = "ENABLE_FTS5" in options
+    return _fts5_support[connection.alias]
+
+
+def _index_instance(sender, instance, **kwargs):
+    backend = get_backend(router.db_for_write(sender, instance=instance))
+    if backend is not None:
+        backend.index(instance, _registry[sender])
+
+
+def _remove_instance(sender, instance, **kwargs):
+    backend = get_backend(router.db_for_write(sender, instance=instance))
+    if backend is not None:
+        backend.remove(instance)
+
+
+def install(using="default"):
+    """
+    Create missing search tables and fill them from existing rows.
+    Crea las tablas de búsqueda que falten y las llena con las filas existentes.
+
+    Migrations create the tables; this covers databases built without them,
+    such as the ``--nomigrations`` test database (see ``core.testing``).
+    """
+    backend = get_backend(using)
+    if backend is None:
+        return
+    existing = set(backend.connection.introspection.table_names())
+    for model, fields in _registry.items():
+        if model._meta.db_table not in existing:
+            continue
+        if backend.table_name(model) not in existing:
+            backend.create(model, fields)
+            backend.rebuild(model, fields)
+
+
+class CreateSearchTable(migrations.RunSQL):
+    """
+    Migration operation that creates the search table of ``model_name``.
+    Operación de migración que crea la tabla de búsqueda de ``model_name``.
+
+    The DDL depends on the backend of the migrated database, so the SQL is
+    built when the operation runs; the existing rows are indexed right after.
+    Databases without a backend get no table.
+    """
+
+    def __init__(self, model_name, fields):
+        self.model_name = model_name
+        self.fields = list(fields)
+        super().__init__(migrations.RunSQL.noop, migrations.RunSQL.noop)
+
+    def deconstruct(self):
+        return self.__class__.__qualname__, [self.model_name, self.fields], {}
+
+    def describe(self):
+        return f"Create the full-text search table of {self.model_name}"
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        backend = get_backend(schema_editor.connection.alias)
+        if backend is None or not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        self._run_sql(schema_editor, backend.create_sql(model, self.fields))
+        if not schema_editor.collect_sql:
+            backend.rebuild(model, self.fields)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        backend = get_backend(schema_editor.connection.alias)
+        if backend is None or not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        self._run_sql(schema_editor, [f"DROP TABLE IF EXISTS {backend.quote(backend.table_name(model))}"])
+
+
+class SearchBackend:
+    """
+    Base class for full-text search backends.
+    Clase base para los backends de búsqueda de texto completo.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def table_name(self, model):
+        return f"{model._meta.db_table}_search"
+
+    def quote(self, name):
+        return self.connection.ops.quote_name(name)
+
+    def values(self, instance, fields):
+        return [str(getattr(instance, field) or "") for field in fields]
+
+    def rebuild(self, model, fields):
+        """Re-index every row of ``model``."""
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.quote(self.table_name(model))}")
+        for instance in model._default_manager.using(self.connection.alias).only("pk", *fields).iterator():
+            self.index(instance, fields)
+
+    def create(self, model, fields):
+        """Create the search table of ``model`` if it does not exist."""
+        with self.connection.cursor() as cursor:
+            for statement in self.create_sql(model, fields):
+                cursor.execute(statement)
+
+    def remove(self, instance):
+        raise NotImplementedError
+
+    def create_sql(self, model, fields):
+        """Return the statements that create the search table of ``model``."""
+        raise NotImplementedError
+
+    def index(self, instance, fields):
+        raise NotImplementedError
+
+    def search(self, queryset, terms):
+        """Filter ``queryset`` to matching rows annotated with ``search_rank``."""
+        raise NotImplementedError
+
+
+class PostgresSearchBackend(SearchBackend):
+    """tsvector documents with a GIN index, ranked with ts_rank."""
+
+    WEIGHTS = "ABCD"
+
+    @property
+    def config(self):
+        return getattr(settings, "SEARCH_CONFIG", "simple")
+
+    def create_sql(self, model, fields):
+        table = self.table_name(model)
+        return [
+            f"CREATE TABLE IF NOT EXISTS {self.quote(table)} "
+            f"(object_id bigint PRIMARY KEY, document tsvector NOT NULL)",
+            f"CREATE INDEX IF NOT EXISTS {self.quote(table + '_document_gin')} "
+            f"ON {self.quote(table)} USING GIN (document)",
+        ]
+
+    def index(self, instance, fields):
+        weighted = " || ".join(
+            f"setweight(to_tsvector(%s::regconfig, %s), '{self.WEIGHTS[min(position, 3)]}')"
+            for position in range(len(fields))
+        )
+        params = [instance.pk]
+        for value in self.values(instance, fields):
+            params.extend([self.config, value])
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.quote(self.table_name(type(instance)))} (object_id, document) "
+                f"VALUES (%s, {weighted}) "
+                f"ON CONFLICT (object_id) DO UPDATE SET document = EXCLUDED.document",
+                params,
+            )
+
+    def remove(self, instance):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.quote(self.table_name(type(instance)))} WHERE object_id = %s",
+                [instance.pk],
+            )
+
+    def search(self, queryset, terms):
+        query = " & ".join(f"{term}:*" for term in terms)
+        table = self.quote(self.table_name(queryset.model))
+        outer_pk = f"{self.quote(queryset.model._meta.db_table)}.{self.quote(queryset.model._meta.pk.column)}"
+        tsquery = "to_tsquery(%s::regconfig, %s)"
+        return queryset.filter(
+            pk__in=RawSQL(f"SELECT object_id FROM {table} WHERE document @@ {tsquery}", [self.config, query])
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT ts_rank(document, {tsquery}) FROM {table} WHERE object_id = {outer_pk}",
+                [self.config, query],
+            )
+        )
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """FTS5 virtual table keyed by rowid, ranked with bm25."""
+
+    def create_sql(self, model, fields):
+        columns = ", ".join(self.quote(field) for field in fields)
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.quote(self.table_name(model))} "
+            f"USING fts5({columns}, tokenize='unicode61 remove_diacritics 2')"
+        ]
+
+    def index(self, instance, fields):
+        table = self.quote(self.table_name(type(instance)))
+        columns = ", ".join(self.quote(field) for field in fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE rowid = %s", [instance.pk])
+            cursor.execute(
+                f"INSERT INTO {table} (rowid, {columns}) VALUES (%s, {placeholders})",
+                [instance.pk, *self.values(instance, fields)],
+            )
+
+    def remove(self, instance):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.quote(self.table_name(type(instance)))} WHERE rowid = %s", [instance.pk])
+
+    def search(self, queryset, terms):
+        query = " AND ".join(f'"{term}"*' for term in terms)
+        table = self.quote(self.table_name(queryset.model))
+        outer_pk = f"{self.quote(queryset.model._meta.db_table)}.{self.quote(queryset.model._meta.pk.column)}"
+        # Column weights mirror PostgreSQL's A/B/C/D: each field counts half the previous one.
+        # Pesos por columna equivalentes a A/B/C/D de PostgreSQL.
+        weights = ", ".join(str(2 ** max(3 - position, 0)) for position in range(len(_registry[queryset.model])))
+        # bm25() is lower for better matches, so negate it to rank descending.
+        # bm25() es menor para mejores coincidencias, por eso se niega.
+        return queryset.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [query])
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT -bm25({table}, {weights}) FROM {table} WHERE {table} MATCH %s AND rowid = {outer_pk}",
+                [query],
+            )
+        )
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    ``?search=`` backed by the full-text index, ranked by relevance.
+    ``?search=`` respaldado por el índice de texto completo, ordenado por relevancia.
+
+    Results are ordered by rank unless ``?ordering=`` is given; ties follow
+    the view's ordering (or ``Meta.ordering``) and then the primary key, so
+    pages never repeat or skip rows. Models that are
+    not registered, or databases without a backend, use DRF's SearchFilter.
+    """
+
+    def get_fulltext_terms(self, request):
+        """Split ``?search=`` into the word tokens understood by the index."""
+        params = request.query_params.get(self.search_param, "")
+        return TERM_RE.findall(params)
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_fulltext_terms(request)
+        if not terms:
+            return super().filter_queryset(request, queryset, view)
+        backend = get_backend(queryset.db)
+        if backend is None or queryset.model not in _registry:
+            return super().filter_queryset(request, queryset, view)
+
+        queryset = backend.search(queryset, terms)
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            ordering = queryset.query.order_by or queryset.model._meta.ordering
+            queryset = queryset.order_by("-search_rank", *ordering, "pk")
+        return queryset
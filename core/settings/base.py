@@ -33,24 +33,47 @@ INSTALLED_APPS = [
     "corsheaders",
     "drf_spectacular",  # API documentation
     # Local apps - Apps locales
+    "core",
     "apps.projects",
     "apps.skills",
     "apps.about",
     "apps.contact",
+    "apps.portfolio",
 ]
 
 MIDDLEWARE = [
+    "core.dispatch.PathDispatchMiddleware",  # Lean chain for anonymous /api/ reads (see LEAN_MIDDLEWARE_*)
+    "core.timing.ServerTimingMiddleware",  # Server-Timing header and timing log (opt-in)
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # For static files in production
     "corsheaders.middleware.CorsMiddleware",  # CORS middleware
+    "apps.portfolio.middleware.StaticAPIFallbackMiddleware",  # Pre-rendered API files (opt-in)
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.profiling.ProfilerMiddleware",  # ?profile for staff users (opt-in)
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Anonymous safe requests under these prefixes skip the middleware below
+# Las peticiones anónimas seguras bajo estos prefijos omiten los middleware siguientes
+LEAN_MIDDLEWARE_ENABLED = config("LEAN_MIDDLEWARE_ENABLED", default=True, cast=bool)
+LEAN_MIDDLEWARE_PATHS = config("LEAN_MIDDLEWARE_PATHS", default="/api/", cast=lambda value: [path.strip() for path in value.split(",") if path.strip()])
+LEAN_MIDDLEWARE_SKIP = [
+    "whitenoise.middleware.WhiteNoiseMiddleware",  # static files only, and sync-only under ASGI
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.profiling.ProfilerMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+]
+
+# ASGI profile: native async read actions (see docs, "ASGI deployment")
+# Perfil ASGI: acciones de lectura asíncronas nativas (ver docs, "Despliegue ASGI")
+ASYNC_VIEWS = config("ASYNC_VIEWS", default=False, cast=bool)
+
 ROOT_URLCONF = "core.urls"
 
 TEMPLATES = [
@@ -128,17 +151,21 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Django REST Framework configuration
 # Configuración de Django REST Framework
 REST_FRAMEWORK = {
+    # orjson-backed JSON, byte-identical to DRF's stdlib renderer/parser
+    # JSON respaldado por orjson, idéntico byte a byte al renderizador/parser de DRF
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "core.renderers.FastJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "core.renderers.FastJSONParser",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    # Page numbers by default, keyset pagination with ?cursor=
+    # Números de página por defecto, paginación por llave con ?cursor=
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.PortfolioPagination",
     "PAGE_SIZE": 10,
     # API Schema - Esquema de API
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_SCHEMA_CLASS": "core.openapi.PortfolioAutoSchema",
     # Convention: Use camelCase in JSON responses (not snake_case)
     # Convención: Usar camelCase en respuestas JSON (no snake_case)
     "JSON_UNDERSCOREIZE": {
@@ -146,6 +173,86 @@ REST_FRAMEWORK = {
     },
 }
 
+# Full-text search backend: "auto" picks PostgreSQL tsvector or SQLite FTS5
+# Backend de búsqueda de texto completo: "auto" elige tsvector de PostgreSQL o FTS5 de SQLite
+SEARCH_BACKEND = config("SEARCH_BACKEND", default="auto")
+SEARCH_CONFIG = config("SEARCH_CONFIG", default="simple")
+
+# Shared cache: "locmem" (single process), "file" or "database" (run createcachetable)
+# Caché compartida: "locmem" (un solo proceso), "file" o "database" (ejecutar createcachetable)
+CACHE_BACKENDS = {
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "portfolio"),
+    "file": ("django.core.cache.backends.filebased.FileBasedCache", str(BASE_DIR / ".cache")),
+    "database": ("django.core.cache.backends.db.DatabaseCache", "api_cache"),
+}
+CACHE_BACKEND = config("CACHE_BACKEND", default="locmem")
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND][0],
+        "LOCATION": config("CACHE_LOCATION", default=CACHE_BACKENDS[CACHE_BACKEND][1]),
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": config("CACHE_MAX_ENTRIES", default=5000, cast=int)},
+    }
+}
+
+# Lifetime of cached API responses (keys are versioned, so this only bounds memory)
+# Duración de las respuestas de API cacheadas (las llaves son versionadas)
+API_CACHE_TIMEOUT = config("API_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int)
+# Stampede protection: stale entries are served this long while one worker refreshes them
+# Protección contra estampidas: las entradas obsoletas se sirven mientras un worker las refresca
+API_CACHE_STALE_TIMEOUT = config("API_CACHE_STALE_TIMEOUT", default=300, cast=int)
+API_CACHE_LOCK_TIMEOUT = config("API_CACHE_LOCK_TIMEOUT", default=30, cast=int)
+API_CACHE_LOCK_WAIT = config("API_CACHE_LOCK_WAIT", default=0.5, cast=float)
+API_CACHE_XFETCH_BETA = config("API_CACHE_XFETCH_BETA", default=1.0, cast=float)
+API_CACHE_STATS_FLUSH_INTERVAL = config("API_CACHE_STATS_FLUSH_INTERVAL", default=10, cast=int)
+# Per-process LRU in front of the shared cache (active profile, featured projects, skill tree)
+# LRU por proceso delante de la caché compartida (perfil activo, proyectos destacados, árbol de skills)
+LOCAL_CACHE_MAX_BYTES = config("LOCAL_CACHE_MAX_BYTES", default=1024 * 1024, cast=int)
+
+# Responsive image variants: widths generated in the background after upload
+# Variantes de imagen responsivas: anchos generados en segundo plano tras la subida
+IMAGE_VARIANT_WIDTHS = config("IMAGE_VARIANT_WIDTHS", default="320,640,1024,1600", cast=lambda value: [int(width) for width in value.split(",") if width.strip()])
+
+# Background jobs stored in the database (python manage.py run_worker)
+# Trabajos en segundo plano guardados en la base de datos (python manage.py run_worker)
+JOBS_SYNC = config("JOBS_SYNC", default=False, cast=bool)
+JOBS_MAX_ATTEMPTS = config("JOBS_MAX_ATTEMPTS", default=5, cast=int)
+JOBS_RETRY_BACKOFF = config("JOBS_RETRY_BACKOFF", default=10, cast=float)
+JOBS_RETRY_BACKOFF_MAX = config("JOBS_RETRY_BACKOFF_MAX", default=3600, cast=float)
+JOBS_LOCK_TIMEOUT = config("JOBS_LOCK_TIMEOUT", default=600, cast=int)
+JOBS_RETENTION_DAYS = config("JOBS_RETENTION_DAYS", default=7, cast=int)
+
+# Addresses notified of each contact submission (sent by a background job)
+# Direcciones notificadas de cada mensaje de contacto (enviado por un trabajo en segundo plano)
+CONTACT_NOTIFICATION_EMAILS = config("CONTACT_NOTIFICATION_EMAILS", default="", cast=lambda value: [email.strip() for email in value.split(",") if email.strip()])
+
+# Per-request timing: Server-Timing header and structured log line
+# Tiempos por petición: cabecera Server-Timing y línea de log estructurada
+SERVER_TIMING_ENABLED = config("SERVER_TIMING_ENABLED", default=False, cast=bool)
+SERVER_TIMING_SAMPLE_RATE = config("SERVER_TIMING_SAMPLE_RATE", default=1.0, cast=float)
+SERVER_TIMING_LOG_THRESHOLD_MS = config("SERVER_TIMING_LOG_THRESHOLD_MS", default=0, cast=float)
+SERVER_TIMING_HEADER = config("SERVER_TIMING_HEADER", default=True, cast=bool)
+
+# On-demand profiler for staff users (?profile=sample|cprofile or X-Profile header)
+# Perfilador bajo demanda para usuarios staff (?profile=sample|cprofile o cabecera X-Profile)
+PROFILER_ENABLED = config("PROFILER_ENABLED", default=False, cast=bool)
+PROFILER_DIR = config("PROFILER_DIR", default=str(BASE_DIR / "profiles"))
+PROFILER_MAX_FILES = config("PROFILER_MAX_FILES", default=50, cast=int)
+PROFILER_INTERVAL_MS = config("PROFILER_INTERVAL_MS", default=1, cast=float)
+
+# Pre-built OpenAPI schema (python manage.py build_schema), regenerated when the code changes
+# Esquema OpenAPI pre-generado (python manage.py build_schema), regenerado cuando cambia el código
+SCHEMA_ROOT = config("SCHEMA_ROOT", default=str(BASE_DIR / "build" / "schema"))
+SCHEMA_PREBUILT = config("SCHEMA_PREBUILT", default=True, cast=bool)
+
+# Static JSON export of the public read API (python manage.py export_static_api)
+# Exportación JSON estática de la API pública de lectura
+STATIC_API_ROOT = config("STATIC_API_ROOT", default=str(STATIC_ROOT))
+STATIC_API_BASE_URL = config("STATIC_API_BASE_URL", default="http://localhost:8000")
+STATIC_API_EXPORT_ON_SAVE = config("STATIC_API_EXPORT_ON_SAVE", default=False, cast=bool)
+STATIC_API_FALLBACK = config("STATIC_API_FALLBACK", default=False, cast=bool)
+STATIC_API_MAX_AGE = config("STATIC_API_MAX_AGE", default=60, cast=int)
+
 # CORS configuration
 # Configuración de CORS
 CORS_ALLOWED_ORIGINS = [
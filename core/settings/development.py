@@ -29,6 +29,10 @@ DATABASES = {
 # Backend de correo para desarrollo (imprime en consola)
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
+# Run background jobs inline after commit, so runserver needs no worker
+# Ejecuta los trabajos en segundo plano tras el commit, sin necesidad de worker
+JOBS_SYNC = config("JOBS_SYNC", default=True, cast=bool)
+
 # Logging configuration for development
 # Configuración de logging para desarrollo
 LOGGING = {
@@ -26,11 +26,21 @@ ALLOWED_HOSTS = config(
 DATABASES = {
     "default": dj_database_url.config(
         default=config("DATABASE_URL", default=""),
-        conn_max_age=600,
+        # Use 0 under ASGI: connections are per thread and each request gets its own
+        # Usar 0 bajo ASGI: las conexiones son por hilo y cada petición tiene el suyo
+        conn_max_age=config("DB_CONN_MAX_AGE", default=600, cast=int),
         conn_health_checks=True,
     )
 }
 
+# Shared cache: every worker must see the same version counters (see CACHE_BACKEND)
+# Caché compartida: todos los workers deben ver los mismos contadores de versión
+CACHE_BACKEND = config("CACHE_BACKEND", default="database")
+CACHES["default"].update(
+    BACKEND=CACHE_BACKENDS[CACHE_BACKEND][0],
+    LOCATION=config("CACHE_LOCATION", default=CACHE_BACKENDS[CACHE_BACKEND][1]),
+)
+
 # Security settings for production
 # Configuraciones de seguridad para producción
 
@@ -86,6 +96,14 @@ LOGGING = {
     },
 }
 
+# Request timing: sample 10% of requests and log only the slow ones; the header
+# would show query counts and timings to any client, so it stays off
+# Tiempos de petición: muestrea el 10% y registra solo las lentas; sin cabecera
+SERVER_TIMING_ENABLED = config("SERVER_TIMING_ENABLED", default=True, cast=bool)
+SERVER_TIMING_SAMPLE_RATE = config("SERVER_TIMING_SAMPLE_RATE", default=0.1, cast=float)
+SERVER_TIMING_LOG_THRESHOLD_MS = config("SERVER_TIMING_LOG_THRESHOLD_MS", default=500, cast=float)
+SERVER_TIMING_HEADER = config("SERVER_TIMING_HEADER", default=False, cast=bool)
+
 # CORS configuration for production
 # Configuración de CORS para producción
 CORS_ALLOWED_ORIGINS = config(
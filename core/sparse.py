@@ -0,0 +1,137 @@
+"""
+Sparse fieldsets (``?fields=`` / ``?omit=``) for the API.
+Campos dispersos (``?fields=`` / ``?omit=``) para la API.
+
+``SparseFieldsetSerializerMixin`` prunes the serializer fields of read
+requests; ``SparseFieldsetViewMixin`` pushes the same selection down to the
+queryset with ``only()`` so unrequested columns are never read.
+``SparseFieldsetSerializerMixin`` elimina campos del serializador en las
+lecturas; ``SparseFieldsetViewMixin`` aplica la misma selección al queryset
+con ``only()`` para no leer columnas que no se pidieron.
+"""
+
+from rest_framework import serializers
+
+FIELDS_PARAM = "fields"
+OMIT_PARAM = "omit"
+
+
+def parse_field_list(value):
+    """Split a comma-separated query parameter into field names."""
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+def get_requested_fields(request):
+    """
+    Return ``(fields, omit)`` from the request, or ``(None, [])`` when unused.
+    Retorna ``(fields, omit)`` de la petición, o ``(None, [])`` si no se usan.
+
+    Only safe methods are pruned so write responses stay complete.
+    """
+    if request is None or request.method not in ("GET", "HEAD"):
+        return None, []
+    params = request.query_params if hasattr(request, "query_params") else request.GET
+    fields = parse_field_list(params.get(FIELDS_PARAM)) or None
+    return fields, parse_field_list(params.get(OMIT_PARAM))
+
+
+def select_fields(available, fields, omit):
+    """
+    Return the names of ``available`` kept by ``fields``/``omit``.
+    Retorna los nombres de ``available`` que se conservan según ``fields``/``omit``.
+
+    Unknown names are rejected with a 400 so typos do not silently return
+    everything.
+    """
+    unknown = sorted(set(fields or []).union(omit) - set(available))
+    if unknown:
+        raise serializers.ValidationError({FIELDS_PARAM: [f"Unknown field(s): {', '.join(unknown)}"]})
+    kept = [name for name in available if fields is None or name in fields]
+    return [name for name in kept if name not in omit]
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Drop serializer fields not selected by ``?fields=`` / ``?omit=``.
+    Elimina los campos del serializador no seleccionados por ``?fields=`` / ``?omit=``.
+
+    Only serializers built by a view's ``get_serializer()`` (top level, or the
+    child of a ``many=True`` list) prune; nested serializers and serializers
+    built by hand always render in full.
+
+    ``Meta.sparse_field_sources`` lists the model fields read by fields whose
+    source cannot be inferred, such as ``SerializerMethodField``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        context = kwargs.get("context") or {}
+        if "view" not in context:
+            return
+        fields, omit = get_requested_fields(context.get("request"))
+        if fields is None and not omit:
+            return
+        kept = set(select_fields(list(self.fields), fields, omit))
+        for name in list(self.fields):
+            if name not in kept:
+                self.fields.pop(name)
+
+    @classmethod
+    def get_model_fields(cls, field_names, declared=None):
+        """
+        Return the model field paths needed to render ``field_names``.
+        Retorna las rutas de campos del modelo necesarias para ``field_names``.
+
+        Returns None when some field reads the whole instance, in which case
+        no column can be deferred safely.
+        """
+        declared = declared if declared is not None else cls().fields
+        explicit = getattr(cls.Meta, "sparse_field_sources", {})
+        paths = []
+        for name in field_names:
+            if name in explicit:
+                paths.extend(explicit[name])
+                continue
+            source = declared[name].source
+            if source == "*" or isinstance(declared[name], serializers.BaseSerializer):
+                return None
+            parts = source.split(".")
+            # Traversed relations need their FK column too.
+            # Las relaciones recorridas también necesitan su columna FK.
+            paths.extend("__".join(parts[:depth]) for depth in range(1, len(parts) + 1))
+        return paths
+
+
+class SparseFieldsetViewMixin:
+    """
+    Load only the columns the pruned serializer renders.
+    Carga solo las columnas que el serializador reducido muestra.
+
+    Apply ``sparse_queryset()`` to every queryset a read action serializes;
+    ``get_queryset()`` already does it. Ordering columns of the model are kept
+    so keyset cursors never trigger a query per row, and so are the fields
+    in ``sparse_always_load`` (e.g. foreign keys used by ``select_related``).
+    """
+
+    sparse_always_load = ()
+
+    def get_queryset(self):
+        return self.sparse_queryset(super().get_queryset())
+
+    def sparse_queryset(self, queryset):
+        fields, omit = get_requested_fields(getattr(self, "request", None))
+        if fields is None and not omit:
+            return queryset
+        serializer_class = self.get_serializer_class()
+        if not issubclass(serializer_class, SparseFieldsetSerializerMixin):
+            return queryset
+
+        declared = serializer_class().fields
+        paths = serializer_class.get_model_fields(select_fields(list(declared), fields, omit), declared)
+        if paths is None:
+            return queryset
+        # Related ordering columns are read through the join, only the FK is needed.
+        # Las columnas de orden relacionadas se leen por el join, basta la FK.
+        ordering = list(queryset.model._meta.ordering) + list(getattr(self, "cursor_ordering", None) or [])
+        ordering = [field.lstrip("-").split("__")[0] for field in ordering]
+        return queryset.only("pk", *dict.fromkeys(paths + ordering + list(self.sparse_always_load)))
@@ -0,0 +1,67 @@
+"""
+Streaming JSON responses for large collections.
+Respuestas JSON en streaming para colecciones grandes.
+
+Rows are read with ``queryset.iterator(chunk_size=...)`` and encoded one at
+a time, so peak memory stays flat no matter how many rows are returned.
+Las filas se leen con ``queryset.iterator(chunk_size=...)`` y se codifican
+una a una, así la memoria se mantiene constante.
+"""
+
+from django.http import StreamingHttpResponse
+from core.renderers import FastJSONRenderer
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def json_array(fragments, prefix="[", suffix="]", separator=","):
+    """
+    Yield a JSON array (optionally wrapped) from already-encoded fragments.
+    Genera un array JSON (opcionalmente envuelto) a partir de fragmentos codificados.
+    """
+    yield prefix
+    first = True
+    for fragment in fragments:
+        if not first:
+            yield separator
+        first = False
+        yield fragment
+    yield suffix
+
+
+def streaming_json_response(fragments, **kwargs):
+    """Wrap :func:`json_array` in a ``StreamingHttpResponse``."""
+    return StreamingHttpResponse(json_array(fragments, **kwargs), content_type="application/json")
+
+
+class StreamingListMixin:
+    """
+    ``?stream=1`` variant of list actions that renders rows incrementally.
+    Variante ``?stream=1`` de las acciones de lista que renderiza filas incrementalmente.
+
+    The streamed body is a plain JSON array (no pagination envelope) encoded
+    with the same renderer as regular responses.
+    """
+
+    stream_param = "stream"
+    stream_chunk_size = DEFAULT_CHUNK_SIZE
+    stream_renderer_class = FastJSONRenderer
+
+    def wants_stream(self, request):
+        return request.query_params.get(self.stream_param, "").lower() in ("1", "true", "yes")
+
+    def stream_queryset(self, queryset):
+        """Serialize and encode ``queryset`` row by row into a streaming response."""
+        serializer = self.get_serializer()
+        renderer = self.stream_renderer_class()
+
+        def fragments():
+            for instance in queryset.iterator(chunk_size=self.stream_chunk_size):
+                yield renderer.render(serializer.to_representation(instance))
+
+        return streaming_json_response(fragments(), prefix=b"[", suffix=b"]", separator=b",")
+
+    def list(self, request, *args, **kwargs):
+        if self.wants_stream(request):
+            return self.stream_queryset(self.filter_queryset(self.get_queryset()))
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,104 @@
+"""
+Pytest plugin that enforces the query budgets of ``core.budgets``.
+Plugin de pytest que hace cumplir los presupuestos de ``core.budgets``.
+
+Enabled from the root ``conftest.py`` with ``pytest_plugins``. Any test that
+asks for the ``budget_case`` fixture is parametrized with every budgeted
+route; the ``query_counts`` fixture seeds the portfolio with 1 and then
+``BUDGET_ROWS`` rows of everything and returns the queries the route ran at
+each size, with both cache tiers cleared so every request is cold.
+Cualquier prueba que pida ``budget_case`` se parametriza con cada ruta con
+presupuesto; ``query_counts`` siembra 1 y luego ``BUDGET_ROWS`` filas y
+retorna las consultas de la ruta en cada tamaño, con las cachés vacías.
+
+It also creates the full-text search tables, which come from migrations,
+when the test database is built with ``--nomigrations``.
+"""
+
+from io import StringIO
+
+import pytest
+
+BUDGET_ROWS = 5
+
+
+@pytest.fixture(scope="session", autouse=True)
+def search_tables(django_db_setup, django_db_blocker):
+    """Create the search tables a ``--nomigrations`` database is missing."""
+    from core import search
+
+    with django_db_blocker.unblock():
+        search.install()
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize ``budget_case`` with the registered budgets."""
+    if "budget_case" in metafunc.fixturenames:
+        from core.budgets import budget_cases
+
+        cases = budget_cases()
+        metafunc.parametrize("budget_case", cases, ids=[f"{case.url_name}[{case.budget}]" for case in cases])
+
+
+def case_url(case):
+    """Return the URL of a budget case, pointing detail routes at the first row."""
+    from django.urls import reverse
+
+    if not case.detail:
+        return reverse(case.url_name)
+    pk = case.view.queryset.model._default_manager.order_by("pk").values_list("pk", flat=True).first()
+    return reverse(case.url_name, kwargs={"pk": pk})
+
+
+@pytest.fixture
+def seed_rows(db):
+    """Return a function that replaces the portfolio with ``size`` rows of everything."""
+    from django.core.management import call_command
+
+    def seed(size):
+        call_command(
+            "seed_portfolio",
+            clear=True,
+            projects=size,
+            categories=size,
+            skills=size,
+            messages=size,
+            stdout=StringIO(),
+        )
+
+    return seed
+
+
+@pytest.fixture
+def count_queries(client):
+    """Return a function that GETs a URL cold and returns how many queries it ran."""
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from core.cache import get_local_cache
+
+    def count(url):
+        cache.clear()
+        get_local_cache().clear()
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        assert response.status_code == 200, f"{url} returned {response.status_code}"
+        return len(context.captured_queries)
+
+    return count
+
+
+@pytest.fixture
+def query_counts(seed_rows, count_queries):
+    """Return a function mapping a budget case to ``{rows: queries}`` for 1 and ``BUDGET_ROWS`` rows."""
+
+    def measure(case):
+        counts = {}
+        for size in (1, BUDGET_ROWS):
+            seed_rows(size)
+            counts[size] = count_queries(case_url(case))
+        return counts
+
+    return measure
@@ -0,0 +1,178 @@
+"""
+Per-request timing: Server-Timing header and structured log line.
+Tiempos por petición: cabecera Server-Timing y línea de log estructurada.
+
+``ServerTimingMiddleware`` records, for a sample of requests:
+
+- ``db``: query count and time, through ``connection.execute_wrapper``.
+- ``serialize``: time spent in the outermost ``to_representation`` of
+  serializers using ``TimedSerializerMixin`` (lazy related queries count too).
+- ``render``: time spent in ``FastJSONRenderer``.
+- ``total``: time through the rest of the middleware chain and the view.
+
+Streamed responses are rendered after the middleware returns, so their
+``total`` is the time to the first byte.
+Las respuestas en streaming se renderizan después, así que su ``total`` es
+el tiempo hasta el primer byte.
+"""
+
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar("server_timing", default=None)
+_serializing = ContextVar("server_timing_serializing", default=False)
+
+
+class RequestTimings:
+    """Accumulated durations (seconds) and counts of one request."""
+
+    def __init__(self):
+        self.durations = defaultdict(float)
+        self.queries = 0
+
+    def add(self, name, seconds):
+        self.durations[name] += seconds
+
+    def __call__(self, execute, sql, params, many, context):
+        """``execute_wrapper`` hook counting and timing every query."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.add("db", time.perf_counter() - started)
+
+
+def current_timings():
+    """Return the timings of the request being measured, or None."""
+    return _current.get()
+
+
+@contextmanager
+def measure(name):
+    """
+    Add the duration of the block to ``name`` when the request is sampled.
+    Suma la duración del bloque a ``name`` si la petición está muestreada.
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
+
+
+class TimedSerializerMixin:
+    """
+    Count serializer time under ``serialize``; nested serializers count once.
+    Cuenta el tiempo de serialización en ``serialize``; los anidados cuentan una vez.
+    """
+
+    def to_representation(self, instance):
+        if _current.get() is None or _serializing.get():
+            return super().to_representation(instance)
+        token = _serializing.set(True)
+        try:
+            with measure("serialize"):
+                return super().to_representation(instance)
+        finally:
+            _serializing.reset(token)
+
+
+class ServerTimingMiddleware:
+    """
+    Emit ``Server-Timing`` and a log line for a sample of requests.
+    Emite ``Server-Timing`` y una línea de log para una muestra de peticiones.
+
+    ``SERVER_TIMING_SAMPLE_RATE`` picks the share of requests measured;
+    ``SERVER_TIMING_LOG_THRESHOLD_MS`` only logs those at least that slow.
+    Unsampled requests pay one ``random()`` call. Under ASGI unsampled
+    requests stay on the event loop; sampled ones run in a thread so the
+    query wrapper sees the connections of the request's sync thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "SERVER_TIMING_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            self.get_response_sync = async_to_sync(get_response)
+        else:
+            self.get_response_sync = get_response
+        self.sample_rate = getattr(settings, "SERVER_TIMING_SAMPLE_RATE", 1.0)
+        self.threshold = getattr(settings, "SERVER_TIMING_LOG_THRESHOLD_MS", 0)
+        self.header = getattr(settings, "SERVER_TIMING_HEADER", True)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+        return self.timed_response(request)
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+        return await sync_to_async(self.timed_response)(request)
+
+    def sampled(self):
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def timed_response(self, request):
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timings))
+                response = self.get_response_sync(request)
+        finally:
+            _current.reset(token)
+        timings.add("total", time.perf_counter() - started)
+
+        if self.header:
+            response["Server-Timing"] = self.format_header(timings)
+        total_ms = timings.durations["total"] * 1000
+        if total_ms >= self.threshold:
+            logger.info("request timing %s", json.dumps(self.log_record(request, response, timings)))
+        return response
+
+    @staticmethod
+    def format_header(timings):
+        parts = [f'db;dur={timings.durations["db"] * 1000:.1f};desc="{timings.queries} queries"']
+        for name in ("serialize", "render", "total"):
+            parts.append(f"{name};dur={timings.durations[name] * 1000:.1f}")
+        return ", ".join(parts)
+
+    @staticmethod
+    def log_record(request, response, timings):
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "db_queries": timings.queries,
+        }
+        for name in ("db", "serialize", "render", "total"):
+            record[f"{name}_ms"] = round(timings.durations[name] * 1000, 1)
+        return record
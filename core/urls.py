@@ -11,11 +11,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from core.schema import PrebuiltRedocView, PrebuiltSchemaView, PrebuiltSwaggerView
 
 urlpatterns = [
     # Admin site
@@ -23,15 +19,17 @@ urlpatterns = [
 
     # API Documentation - Documentación de API
     # Root page is Redoc documentation - La página raíz es la documentación Redoc
-    path("", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
+    # Served from the artifacts of "manage.py build_schema" - Servidos desde los artefactos de build_schema
+    path("", PrebuiltRedocView.as_view(url_name="schema"), name="redoc"),
+    path("api/schema/", PrebuiltSchemaView.as_view(), name="schema"),
+    path("api/docs/", PrebuiltSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
 
     # API endpoints
     path("api/", include("apps.projects.api.router")),
     path("api/", include("apps.skills.api.router")),
     path("api/", include("apps.about.api.router")),
     path("api/", include("apps.contact.api.router")),
+    path("api/", include("apps.portfolio.api.urls")),
 ]
 
 # Serve media files in development